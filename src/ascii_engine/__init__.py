@@ -2,7 +2,7 @@ from .app import AppEngine
 from .cli import Banner, QuestionsManager
 from .core import FrameProcessor, Processor
 from .log import get_logger, setup_logging
-from .media import frame_to_text, frames_to_images, images_to_video
+from .media import frame_to_text, frames_to_images, frames_to_video, images_to_video
 from .settings import AppSettings
 
 __all__ = [
@@ -15,6 +15,7 @@ __all__ = [
     "setup_logging",
     "frame_to_text",
     "frames_to_images",
+    "frames_to_video",
     "images_to_video",
     "AppSettings",
 ]
\ No newline at end of file
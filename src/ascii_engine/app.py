@@ -1,17 +1,24 @@
 from pathlib import Path
-from typing import Any, Callable, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Sequence
 
 from .cli.questions_manager import QuestionsManager
 from .cli.banner import Banner
 from .core import FrameProcessor
 from .core import FileValidator
+from .core import Converter, ConversionEngine
+from .core import FrameSink
+from .core import ToneMap
+from .core import FrameCache
 
 from .settings import DEFAULT_RAW_SETTINGS
 from .settings import AppSettings
 from .settings.manager import SettingsManager
 
 from .utils import clear_console, clear_screen, get_source_via_dialog
-from .media.media import frame_to_text, frames_to_images, images_to_video
+from .media.sinks import ContainerSink, ImageSink, TextSink, VideoSink
+from .media.player import ContainerPlayer
+from .server import FrameServer
+from .batch import expand_inputs, is_batch_input, run_batch
 
 from .utils import init_colors, COLORS
 from .log import get_logger
@@ -83,15 +90,23 @@ class AppEngine:
         output_path: str | Path = "results/",
         dry_run: bool = False,
         source_type: str = "image",
+        jobs: int = 1,
+        saves: Optional[Sequence[str]] = None,
     ) -> None:
         """Run processing in non-interactive (headless) mode.
 
-        input_source: path-like or 'camera' or integer index for camera
+        input_source: path-like, directory, glob or 'camera' / integer index for camera
         source_type: one of 'image', 'video', 'camera'
+        jobs: worker processes (files in parallel for batches, video segments otherwise)
+        saves: outputs to write without prompting ('text', 'image', 'video')
         """
         self.settings = self.config_manager.load_normalized()
         self.logger.debug("Running in headless mode. dry_run=%s", dry_run)
 
+        if isinstance(input_source, str) and source_type != "camera" and is_batch_input(input_source):
+            self._run_batch(input_source, Path(output_path), jobs, saves, dry_run)
+            return
+
         # Determine source and whether it's a video
         if source_type == "camera":
             source = 0
@@ -117,12 +132,79 @@ class AppEngine:
             )
             return
 
-        self._create_handler(source, is_video, output_path)
+        self._create_handler(source, is_video, output_path, jobs=jobs, saves=saves)
+
+    def play(
+        self, path: str | Path, speed: float = 1.0, start: float = 0.0, loop: bool = False
+    ) -> None:
+        """Play a stored ASCII video (.asciv) without decoding or converting anything."""
+        if not Path(path).is_file():
+            self.logger.error("File not found: %s", path)
+            return
+        try:
+            ContainerPlayer(path, speed=speed, start=start, loop=loop).play()
+        except (OSError, ValueError) as exc:
+            self.logger.error(f"Playback failed: {exc}")
+
+    def serve(self, input_source: str = "camera", host: str = "127.0.0.1", port: int = 7777) -> None:
+        """Convert a camera (or a looping video) once and stream it to TCP clients."""
+        self.settings = self.config_manager.load_normalized()
+        if input_source == "camera":
+            source: str | int = 0
+        elif input_source.isdigit():
+            source = int(input_source)
+        else:
+            source = input_source
+        try:
+            FrameServer(self._build_processor(), source, host=host, port=port).run()
+        except (OSError, RuntimeError, ValueError) as exc:
+            self.logger.error(f"Server failed: {exc}")
+
+    def _run_batch(
+        self,
+        input_source: str,
+        output_path: Path,
+        jobs: int,
+        saves: Optional[Sequence[str]],
+        dry_run: bool,
+    ) -> None:
+        """Convert every media file of a directory or glob, `jobs` files at a time."""
+        paths: List[str] = expand_inputs(input_source)
+        if not paths:
+            self.logger.warning("No image or video files found for: %s", input_source)
+            return
+
+        if dry_run:
+            self.logger.debug(
+                "Dry run: would convert %d files with %d jobs into %s", len(paths), jobs, output_path
+            )
+            return
+
+        font_path: Path = Path("assets/fonts/JetBrainsMonoNerdFont-Bold.ttf").resolve()
+        run_batch(
+            paths,
+            # Files are the unit of parallelism; each worker converts serially
+            self._build_processor(jobs=1),
+            output_path.resolve(),
+            outputs=saves,
+            jobs=jobs,
+            fps=self.settings.fps,
+            font_path=font_path.as_posix(),
+            image_options=self.image_options(),
+        )
 
     def _create_handler(
-        self, source: Optional[str | int], is_video: bool, output_path: str | Path = "output"
+        self,
+        source: Optional[str | int],
+        is_video: bool,
+        output_path: str | Path = "output",
+        jobs: int = 1,
+        saves: Optional[Sequence[str]] = None,
     ) -> None:
-        """Create and run the appropriate processor based on source type."""
+        """Create and run the appropriate processor based on source type.
+
+        `saves` selects the outputs without prompting (None asks interactively).
+        """
         self.logger.debug("Creating handler for source: %s", source)
 
         if source is None:
@@ -130,58 +212,133 @@ class AppEngine:
             return
         
         try:
-            common_params: dict[str, Any] = {
-                "target_width": self.settings.width,
-                "scale": self.settings.scale_factor,
-                "sequence": self.settings.gradient,
-                "mode": self.settings.mode,
-                "invert": False,  # can be made configurable later
-                "mirror": False,  # can be made configurable later
-                "validator": FileValidator(),
-            }
-
-            processor: FrameProcessor = FrameProcessor(**common_params)
-
-            ascii_art: str = processor.start_processing(source)
+            processor: FrameProcessor = self._build_processor(jobs)
         except Exception as exc:
             self.logger.error(f"Processing failed: {exc}")
-            input("\nPress ENTER to continue...")
-            return
-        
-        frames: list[str] = self.extract_frames(ascii_art)
-        if not frames:
-            self.logger.warning("No frames were produced from the source.")
+            self._pause(saves is None)
             return
 
         output_dir: Path = Path(output_path).resolve()
         font_path: Path = Path("assets/fonts/JetBrainsMonoNerdFont-Bold.ttf").resolve()
 
+        # Ask for the outputs up front so frames are exported while they are converted
+        sinks: List[FrameSink] = [processor.terminal_sink()]
+        if saves is None:
+            sinks += self._ask_output_sinks(is_video, output_dir, font_path)
+        else:
+            sinks += self._output_sinks(is_video, output_dir, font_path, saves)
+
+        try:
+            count: int = processor.run(source, sinks)
+        except Exception as exc:
+            self.logger.error(f"Processing failed: {exc}")
+            self._pause(saves is None)
+            return
+
+        if not count:
+            self.logger.warning("No frames were produced from the source.")
+
+        self._pause(saves is None)
+
+    def _pause(self, interactive: bool) -> None:
+        """Wait for ENTER before going back to the menu (interactive runs only)."""
+        if interactive:
+            input("\nPress ENTER to continue...")
+
+    def _build_processor(self, jobs: int = 1) -> FrameProcessor:
+        """Create a FrameProcessor from the current settings."""
+        common_params: dict[str, Any] = {
+            "target_width": self.settings.width,
+            "scale": self.settings.scale_factor,
+            "sequence": self.settings.gradient,
+            "mode": self.settings.mode,
+            "invert": self.settings.invert,
+            "mirror": False,  # can be made configurable later
+            "validator": FileValidator(),
+            "ascii_converter": Converter(
+                engine=(
+                    ConversionEngine.THREADED
+                    if self.settings.threads > 1
+                    else ConversionEngine.VECTORIZED
+                ),
+                coalesce=self.settings.color_runs,
+                tolerance=self.settings.color_tolerance,
+                workers=self.settings.threads,
+            ),
+            "tone": ToneMap(
+                brightness=self.settings.brightness,
+                contrast=self.settings.contrast,
+                gamma=self.settings.gamma,
+            ),
+            "pipeline_workers": self.settings.pipeline_workers,
+            "sync_playback": self.settings.sync_playback,
+            "adaptive_quality": self.settings.adaptive_quality,
+            "target_fps": self.settings.fps,
+            "jobs": jobs,
+            "cache": self.frame_cache(),
+        }
+        return FrameProcessor(**common_params)
+
+    def frame_cache(self) -> Optional[FrameCache]:
+        """On-disk cache of converted frames, None when disabled."""
+        if self.settings.cache_size_mb <= 0:
+            return None
+        return FrameCache(
+            self.settings.cache_dir,
+            max_bytes=self.settings.cache_size_mb * 1024 * 1024,
+            hash_contents=self.settings.cache_hash_contents,
+        )
+
+    def status(self) -> dict[str, Any]:
+        """Current settings and frame cache usage."""
+        cache = self.frame_cache()
+        return {
+            "settings": self.settings.to_dict(),
+            "cache": cache.status() if cache else {"enabled": False},
+        }
+
+    def _output_sinks(
+        self, is_video: bool, output_dir: Path, font_path: Path, saves: Sequence[str]
+    ) -> List[FrameSink]:
+        """Sinks for the outputs requested on the command line, without prompting."""
+        sinks: List[FrameSink] = []
+        images = None
+        if "image" in saves:
+            images = output_dir / ("frames_images" if is_video else "static_images")
+        if is_video and "video" in saves:
+            # The video sink saves the frames it renders, instead of a second ImageSink
+            sinks.append(self.video_sink(output_dir, self.settings.fps, font_path, frames_dir=images))
+        elif images is not None:
+            sinks.append(self.image_sink(images, font_path))
+        if "text" in saves:
+            sinks.append(self.text_sink(output_dir / "texts" if is_video else output_dir))
+        if is_video and "container" in saves:
+            sinks.append(self.container_sink(output_dir))
+        return sinks
+
+    def _ask_output_sinks(
+        self, is_video: bool, output_dir: Path, font_path: Path
+    ) -> List[FrameSink]:
+        """Ask which files to export and build the matching sinks."""
+        sinks: List[FrameSink] = []
+
         if is_video:
             message: str = "Do you want to save the output as a video file?"
             if self.menu.ask_cofirmation(message, default=True):
-                self.save_video(
-                    frames,
-                    output_path=output_dir,
-                    fps=self.settings.fps,
-                    font_path=font_path,
-                )
+                sinks.append(self.video_sink(output_dir, self.settings.fps, font_path))
+            message = "Do you want to save the frames as an ASCII video (.asciv) for playback?"
+            if self.menu.ask_cofirmation(message, default=False):
+                sinks.append(self.container_sink(output_dir))
 
         else:
             message: str = "Do you want to save the output as image files?"
             if self.menu.ask_cofirmation(message, default=True):
-                self.save_image(
-                    frames,
-                    output_path=output_dir / "static_images",
-                    font_path=font_path,
-                )
+                sinks.append(self.image_sink(output_dir / "static_images", font_path))
             message = "Do you want to save the output as text files?"
             if self.menu.ask_cofirmation(message, default=True):
-                self.save_text(
-                    frames,
-                    output_path=output_dir,
-                )
+                sinks.append(self.text_sink(output_dir))
 
-        input("\nPress ENTER to continue...")
+        return sinks
 
     @clear_screen
     def handle_image(self) -> None:
@@ -260,48 +417,45 @@ class AppEngine:
 
         input("\nPress ENTER to continue...\n")
 
-    def extract_frames(self, ascii_art: str) -> list[str]:
-        """Extract individual frames from ASCII art output."""
-        if not ascii_art:
-            return []
-        
-        # Separated frames by blank lines (two \n)
-        raw_frames: List[str] = ascii_art.split("\n\n")
-        # Remove completely empty entries
-        return [f.strip() for f in raw_frames if f.strip()]
-
-    def save_image(
-        self, frames: List[str], output_path: Path, font_path: Path
-    ) -> List[str]:
-        """Save frames as image files."""
-        frames_list: List[str] = frames_to_images(
-            frames,
-            out_dir=output_path,
+    def image_sink(self, output_path: Path, font_path: Path) -> ImageSink:
+        """Sink saving frames as image files."""
+        return ImageSink(
+            output_path,
             font_path=font_path.resolve().as_posix(),
+            workers=self.settings.export_workers,
+            **self.image_options(),
         )
-        return frames_list
 
-    def save_text(self, frames: List[str], output_path: Path) -> None:
-        """Save frames as text files."""
-        frame_to_text(frames, output_path)
+    def image_options(self) -> dict[str, Any]:
+        """PNG options of image exports."""
+        return {
+            "compress_level": self.settings.png_compress_level,
+            "palette": self.settings.png_palette,
+        }
+
+    def text_sink(self, output_path: Path) -> TextSink:
+        """Sink saving frames as text files."""
+        return TextSink(output_path)
+
+    def container_sink(self, output_path: Path) -> ContainerSink:
+        """Sink saving frames to a binary ASCII video container."""
+        return ContainerSink(output_path / "output_video.asciv")
 
-    def save_video(
+    def video_sink(
         self,
-        frames: List[str],
         output_path: Path,
         fps: int,
         font_path: Path = Path("assets/fonts/JetBrainsMonoNerdFont-Bold.ttf"),
-    ) -> None:
-        """Save frames as a video file."""
-        images: List[str] = self.save_image(
-            frames,
-            output_path=output_path / "frames",
-            font_path=font_path,
-        )
-        images_to_video(
-            images,
-            output_path=output_path / "output_video.mp4",
+        frames_dir: Optional[Path] = None,
+    ) -> VideoSink:
+        """Sink saving frames as a video file, and as images in `frames_dir` when set."""
+        return VideoSink(
+            output_path / "output_video.mp4",
             fps=fps,
+            font_path=font_path.resolve().as_posix(),
+            frames_dir=frames_dir,
+            workers=self.settings.export_workers,
+            **self.image_options(),
         )
 
     def exit_program(self) -> None:
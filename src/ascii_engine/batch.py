@@ -0,0 +1,244 @@
+"""Batch conversion of many files (a directory or a glob) on a process pool.
+
+Every file is converted by a worker process with its own copy of the
+processor and written straight to disk through the file sinks. Progress is
+reported per file and a summary (throughput and failures) is written to
+`batch_summary.json` in the output folder.
+"""
+
+from __future__ import annotations
+
+import glob
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence
+
+from tqdm import tqdm
+
+from .core import FrameProcessor, FrameSink
+from .core.still import IMAGE_EXTENSIONS, is_still_image
+from .log import get_logger
+from .media.container import EXTENSION as CONTAINER_EXTENSION
+from .media.sinks import ContainerSink, ImageSink, TextSink, VideoSink
+
+logger = get_logger(__name__)
+
+VIDEO_EXTENSIONS = {".mp4", ".avi", ".mov", ".mkv", ".webm", ".gif"}
+
+# Output kinds accepted by `--save`
+OUTPUT_KINDS = ("text", "image", "video", "container")
+
+# What the interactive prompts default to
+DEFAULT_IMAGE_OUTPUTS = ("image", "text")
+DEFAULT_VIDEO_OUTPUTS = ("video",)
+
+
+def is_batch_input(input_source: str) -> bool:
+    """True when `input_source` is a directory or a glob pattern."""
+    return os.path.isdir(input_source) or glob.has_magic(input_source)
+
+
+def expand_inputs(input_source: str) -> List[str]:
+    """Media files in a directory (recursively) or matching a glob, sorted."""
+    if os.path.isdir(input_source):
+        candidates = (str(p) for p in Path(input_source).rglob("*"))
+    else:
+        candidates = glob.iglob(input_source, recursive=True)
+
+    extensions = IMAGE_EXTENSIONS | VIDEO_EXTENSIONS
+    return sorted(
+        p for p in candidates
+        if os.path.isfile(p) and os.path.splitext(p)[1].lower() in extensions
+    )
+
+
+def build_sinks(
+    path: str,
+    out_dir: Path,
+    outputs: Sequence[str],
+    fps: int,
+    font_path: Optional[str] = None,
+    image_options: Optional[dict] = None,
+) -> List[FrameSink]:
+    """
+    File sinks for one input. Still images are written as `<out_dir>.png` /
+    `<out_dir>.txt`; videos get folders of frames (images/text), `<out_dir>.mp4`
+    and `<out_dir>.asciv`. `image_options` are extra ImageSink arguments.
+    """
+    name = out_dir.name
+    sinks: List[FrameSink] = []
+    image_options = image_options or {}
+
+    if is_still_image(path):
+        if "image" in outputs:
+            sinks.append(
+                ImageSink(out_dir.parent, font_path=font_path, pattern=f"{name}.png", **image_options)
+            )
+        if "text" in outputs:
+            sinks.append(TextSink(out_dir.parent, pattern=f"{name}.txt"))
+        return sinks
+
+    frames_dir = out_dir / "frames" if "image" in outputs else None
+    if "video" in outputs:
+        # The video sink saves the frames it renders, instead of a second ImageSink
+        sinks.append(
+            VideoSink(
+                out_dir.parent / f"{name}.mp4",
+                fps=fps,
+                font_path=font_path,
+                frames_dir=frames_dir,
+                **image_options,
+            )
+        )
+    elif frames_dir is not None:
+        sinks.append(ImageSink(frames_dir, font_path=font_path, **image_options))
+    if "text" in outputs:
+        sinks.append(TextSink(out_dir / "text"))
+    if "container" in outputs:
+        sinks.append(ContainerSink(out_dir.parent / f"{name}{CONTAINER_EXTENSION}"))
+    return sinks
+
+
+@dataclass
+class FileResult:
+    """Outcome of converting one file."""
+
+    path: str
+    ok: bool
+    frames: int = 0
+    seconds: float = 0.0
+    error: Optional[str] = None
+
+
+@dataclass
+class BatchSummary:
+    """Totals of a batch run."""
+
+    files: int = 0
+    succeeded: int = 0
+    failed: int = 0
+    frames: int = 0
+    seconds: float = 0.0
+    files_per_second: float = 0.0
+    frames_per_second: float = 0.0
+    failures: List[Dict[str, str]] = field(default_factory=list)
+
+    def to_dict(self) -> dict:
+        return asdict(self)
+
+
+# Per-worker state, set by `_init_worker`
+_worker: dict = {}
+
+
+def _init_worker(
+    processor: FrameProcessor,
+    outputs: Optional[Sequence[str]],
+    fps: int,
+    font_path: Optional[str],
+    image_options: Optional[dict],
+) -> None:
+    _worker.update(
+        processor=processor, outputs=outputs, fps=fps, font_path=font_path, image_options=image_options
+    )
+
+
+def _convert_file(path: str, out_dir: str) -> FileResult:
+    """Convert one file inside a worker process."""
+    start = time.perf_counter()
+    try:
+        outputs = _worker["outputs"]
+        if not outputs:
+            outputs = DEFAULT_IMAGE_OUTPUTS if is_still_image(path) else DEFAULT_VIDEO_OUTPUTS
+        sinks = build_sinks(
+            path, Path(out_dir), outputs, _worker["fps"], _worker["font_path"], _worker["image_options"]
+        )
+        frames = _worker["processor"].run(path, sinks)
+        ok = frames > 0
+        error = None if ok else "no frames produced"
+    except Exception as exc:
+        frames, ok, error = 0, False, f"{type(exc).__name__}: {exc}"
+    return FileResult(path, ok, frames, time.perf_counter() - start, error)
+
+
+def _output_dirs(paths: Sequence[str], out_root: Path) -> Dict[str, Path]:
+    """One output name per input, named after the file and unique within the batch."""
+    used: Dict[str, int] = {}
+    result: Dict[str, Path] = {}
+    for path in paths:
+        stem = Path(path).stem
+        count = used.get(stem, 0)
+        used[stem] = count + 1
+        result[path] = out_root / (stem if count == 0 else f"{stem}_{count}")
+    return result
+
+
+def run_batch(
+    paths: Sequence[str],
+    processor: FrameProcessor,
+    out_root: Path,
+    outputs: Optional[Sequence[str]] = None,
+    jobs: int = 1,
+    fps: int = 24,
+    font_path: Optional[str] = None,
+    image_options: Optional[dict] = None,
+) -> BatchSummary:
+    """
+    Convert `paths` on `jobs` processes and write the outputs under `out_root`.
+
+    `outputs` is a subset of OUTPUT_KINDS; None uses the same defaults as the
+    interactive prompts. `image_options` are extra ImageSink arguments (files
+    are already spread over the processes, so images are saved serially).
+    Returns the summary, also saved as JSON.
+    """
+    out_root.mkdir(parents=True, exist_ok=True)
+    out_dirs = _output_dirs(paths, out_root)
+    summary = BatchSummary(files=len(paths))
+    start = time.perf_counter()
+
+    bar_format = "{l_bar}{bar} | {n_fmt}/{total_fmt} files | {elapsed} → {remaining}"
+    with ProcessPoolExecutor(
+        max_workers=max(1, jobs),
+        initializer=_init_worker,
+        initargs=(processor, outputs, fps, font_path, image_options),
+    ) as pool:
+        futures = {
+            pool.submit(_convert_file, path, str(out_dirs[path])): path for path in paths
+        }
+        with tqdm(total=len(futures), bar_format=bar_format, desc="Converting files") as bar:
+            for future in as_completed(futures):
+                result = future.result()
+                summary.frames += result.frames
+                if result.ok:
+                    summary.succeeded += 1
+                    bar.write(f"OK   {result.path} ({result.frames} frames, {result.seconds:.2f}s)")
+                else:
+                    summary.failed += 1
+                    summary.failures.append({"path": result.path, "error": result.error or ""})
+                    bar.write(f"FAIL {result.path}: {result.error}")
+                bar.update(1)
+
+    summary.seconds = time.perf_counter() - start
+    if summary.seconds > 0:
+        summary.files_per_second = summary.files / summary.seconds
+        summary.frames_per_second = summary.frames / summary.seconds
+
+    summary_path = out_root / "batch_summary.json"
+    with open(summary_path, "w", encoding="utf-8") as f:
+        json.dump(summary.to_dict(), f, indent=2)
+
+    logger.info(
+        "Batch finished: %d/%d files in %.1fs (%.2f files/s, %.1f frames/s), %d failed. Summary: %s",
+        summary.succeeded,
+        summary.files,
+        summary.seconds,
+        summary.files_per_second,
+        summary.frames_per_second,
+        summary.failed,
+        summary_path,
+    )
+    return summary
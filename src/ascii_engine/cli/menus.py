@@ -51,6 +51,12 @@ MENUS: dict = {
                     (COLORS.YELLOW.value + "RGB", "RGB"),
                     (COLORS.YELLOW.value + "Grayscale", "GRAYSCALE"),
                     (COLORS.YELLOW.value + "ASCII", "ASCII"),
+                    (COLORS.YELLOW.value + "256 colors", "ANSI256"),
+                    (COLORS.YELLOW.value + "16 colors", "ANSI16"),
+                    (COLORS.YELLOW.value + "Auto (detect terminal)", "AUTO"),
+                    (COLORS.YELLOW.value + "Half blocks ▀ (2x vertical detail)", "HALFBLOCK"),
+                    (COLORS.YELLOW.value + "Quadrants ▚ (2x2 detail)", "QUADRANT"),
+                    (COLORS.YELLOW.value + "Braille ⣿ (2x4 detail)", "BRAILLE"),
                 ],
                 "default": "RGB",
             },
@@ -67,6 +73,110 @@ MENUS: dict = {
                 ],
                 "default": "DETAILED",
             },
+            {
+                "type": "list",
+                "name": "color_runs",
+                "message": "Only emit colour codes when the colour changes (smaller output)",
+                "choices": [
+                    (COLORS.YELLOW.value + "No", "false"),
+                    (COLORS.YELLOW.value + "Yes", "true"),
+                ],
+                "default": "false",
+            },
+            {
+                "type": "text",
+                "name": "color_tolerance",
+                "message": "Set the colour tolerance for merging runs (0-255)",
+                "default": "0",
+            },
+            {
+                "type": "text",
+                "name": "brightness",
+                "message": "Set the brightness offset (-255 to 255)",
+                "default": "0",
+            },
+            {
+                "type": "text",
+                "name": "contrast",
+                "message": "Set the contrast (1.0 = unchanged)",
+                "default": "1.0",
+            },
+            {
+                "type": "text",
+                "name": "gamma",
+                "message": "Set the gamma (1.0 = unchanged)",
+                "default": "1.0",
+            },
+            {
+                "type": "list",
+                "name": "invert",
+                "message": "Invert the image",
+                "choices": [
+                    (COLORS.YELLOW.value + "No", "false"),
+                    (COLORS.YELLOW.value + "Yes", "true"),
+                ],
+                "default": "false",
+            },
+            {
+                "type": "text",
+                "name": "threads",
+                "message": "Set the number of threads per frame (for very wide outputs)",
+                "default": "1",
+            },
+            {
+                "type": "text",
+                "name": "pipeline_workers",
+                "message": "Set the number of pipeline conversion workers (0 = no pipeline)",
+                "default": "0",
+            },
+            {
+                "type": "list",
+                "name": "sync_playback",
+                "message": "Play videos at real speed, skipping late frames",
+                "choices": [
+                    (COLORS.YELLOW.value + "Yes", "true"),
+                    (COLORS.YELLOW.value + "No", "false"),
+                ],
+                "default": "true",
+            },
+            {
+                "type": "list",
+                "name": "adaptive_quality",
+                "message": "Lower width and colours of live previews to hold the target FPS",
+                "choices": [
+                    (COLORS.YELLOW.value + "Yes", "true"),
+                    (COLORS.YELLOW.value + "No", "false"),
+                ],
+                "default": "false",
+            },
+            {
+                "type": "text",
+                "name": "cache_size_mb",
+                "message": "Set the converted-frame cache size in MB (0 = disabled)",
+                "default": "0",
+            },
+            {
+                "type": "text",
+                "name": "export_workers",
+                "message": "Set the number of processes saving images (0 = no pool)",
+                "default": "0",
+            },
+            {
+                "type": "text",
+                "name": "png_compress_level",
+                "message": "Set the PNG compression level (0 = fastest, 9 = smallest)",
+                "default": "6",
+            },
+            {
+                "type": "list",
+                "name": "png_palette",
+                "message": "Save ASCII/grayscale images with a colour palette (smaller files)",
+                "choices": [
+                    (COLORS.YELLOW.value + "Yes", "true"),
+                    (COLORS.YELLOW.value + "No", "false"),
+                ],
+                "default": "false",
+            },
         ],
     },
 }
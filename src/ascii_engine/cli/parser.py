@@ -33,6 +33,33 @@ def parse_arguments(argv: Optional[list[str]] = None) -> argparse.Namespace:
         default="image",
         help="Type of the input source",
     )
+    p_run.add_argument(
+        "--jobs", "-j",
+        type=int,
+        default=1,
+        help="Worker processes: files converted in parallel for a directory/glob input, "
+        "video segments otherwise",
+    )
+    p_run.add_argument(
+        "--save", "-s",
+        action="append",
+        choices=["text", "image", "video", "container"],
+        help="Output to write without prompting (repeatable). "
+        "Batches default to image+text for images and video for videos",
+    )
+
+    # play command
+    p_play = subparsers.add_parser("play", help="Play an ASCII video (.asciv) saved by the engine")
+    p_play.add_argument("--input", "-i", required=True, help="Path to the .asciv file")
+    p_play.add_argument("--speed", type=float, default=1.0, help="Playback speed (2.0 = twice as fast)")
+    p_play.add_argument("--start", type=float, default=0.0, help="Start position in seconds")
+    p_play.add_argument("--loop", action="store_true", help="Restart at the end until Ctrl+C")
+
+    # serve command
+    p_serve = subparsers.add_parser("serve", help="Stream a camera or video to TCP clients (e.g. nc)")
+    p_serve.add_argument("--input", "-i", default="camera", help="Video file, 'camera' or a camera index")
+    p_serve.add_argument("--host", default="127.0.0.1", help="Address to listen on")
+    p_serve.add_argument("--port", "-p", type=int, default=7777, help="TCP port to listen on")
 
     # status command
     p_status = subparsers.add_parser("status", help="Show application status or information")
@@ -1,7 +1,14 @@
 from .processor import FrameProcessor, Processor
 from .validator import FileValidator
 from .resizer import Resizer
-from .converter import Converter
+from .converter import Converter, ConversionEngine
+from .renderer import DiffRenderer
+from .frame import AsciiFrame
+from .tone import ToneMap
+from .pipeline import FramePipeline, PipelineStats
+from .sinks import FrameSink, TerminalSink, ListSink
+from .terminal import TerminalWriter
+from .cache import FrameCache
 
 __all__ = [
     "FrameProcessor",
@@ -9,4 +16,15 @@ __all__ = [
     "FileValidator",
     "Resizer",
     "Converter",
+    "ConversionEngine",
+    "DiffRenderer",
+    "AsciiFrame",
+    "ToneMap",
+    "FramePipeline",
+    "PipelineStats",
+    "FrameSink",
+    "TerminalSink",
+    "ListSink",
+    "TerminalWriter",
+    "FrameCache",
 ]
@@ -0,0 +1,362 @@
+"""Content-addressed on-disk cache of converted frames.
+
+An entry is keyed by the input file (its bytes, or its path + size + mtime)
+and every setting that changes the cell planes. It holds the raw glyph,
+colour and background planes of all frames, appended while the source is
+converted and read back through `np.memmap`:
+
+    <root>/<key>/meta.json       shapes, dtypes, frame count, charset, mode, fps
+    <root>/<key>/glyphs.bin      frame planes, back to back
+    <root>/<key>/colors.bin      (optional)
+    <root>/<key>/background.bin  (optional)
+
+Entries are written to a temporary folder and renamed when complete, so an
+interrupted conversion never leaves a partial entry. The total size is
+kept under `max_bytes` by evicting the least recently used entries; an entry
+that alone would exceed it is dropped while it is being written.
+
+Lookup counts and the running total size live in `stats.json`, which is
+only updated under a lock file and replaced atomically, so several
+processes (batch workers) can share one cache.
+"""
+
+import hashlib
+import json
+import os
+import shutil
+import time
+import uuid
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterator, Optional, Union
+
+import numpy as np
+
+from .frame import AsciiFrame
+from ..log import get_logger
+from ..settings import get_mode
+
+logger = get_logger(__name__)
+
+PLANES = ("glyphs", "colors", "background")
+STATS_FILE = "stats.json"
+LOCK_FILE = "stats.lock"
+_TMP_PREFIX = ".tmp-"
+_LOCK_TIMEOUT = 5.0
+_LOCK_STALE = 30.0
+
+
+def file_digest(path: Union[str, Path], contents: bool = False) -> str:
+    """Identity of a file: hash of its bytes, or of its path, size and mtime."""
+    h = hashlib.sha256()
+    if contents:
+        with open(path, "rb") as f:
+            for chunk in iter(lambda: f.read(1 << 20), b""):
+                h.update(chunk)
+    else:
+        st = os.stat(path)
+        h.update(f"{os.path.abspath(path)}|{st.st_size}|{st.st_mtime_ns}".encode())
+    return h.hexdigest()
+
+
+class CacheWriter:
+    """Appends frames to a new cache entry; `commit` publishes it."""
+
+    def __init__(self, cache: "FrameCache", key: str, fps: float):
+        self.cache = cache
+        self.key = key
+        self.fps = fps
+        self.tmp = cache.root / f"{_TMP_PREFIX}{key}-{uuid.uuid4().hex[:8]}"
+        self.tmp.mkdir(parents=True)
+        self.files: dict = {}
+        self.meta: dict = {}
+        self.count = 0
+        self.size = 0
+        self.frame_bytes = 0
+        self.valid = True
+
+    def write(self, frame: AsciiFrame) -> None:
+        if not self.valid:
+            return
+        planes = {"glyphs": frame.glyphs, "colors": frame.colors, "background": frame.background}
+        if not self.meta:
+            self.meta = {
+                "charset": frame.charset,
+                "mode": frame.mode.name,
+                "fps": self.fps,
+                "planes": {
+                    name: {"shape": list(p.shape), "dtype": p.dtype.str}
+                    for name, p in planes.items() if p is not None
+                },
+            }
+            self.files = {name: open(self.tmp / f"{name}.bin", "wb") for name in self.meta["planes"]}
+            self.frame_bytes = sum(p.nbytes for p in planes.values() if p is not None)
+
+        # Every frame must have the same layout (e.g. no terminal resize mid-run)
+        for name, p in planes.items():
+            spec = self.meta["planes"].get(name)
+            if (p is None) != (spec is None) or (p is not None and list(p.shape) != spec["shape"]):
+                logger.debug("Frame layout changed, not caching %s", self.key)
+                self.abort()
+                return
+        if self.size + self.frame_bytes > self.cache.max_bytes:
+            logger.debug("Entry %s is larger than the cache, not caching it", self.key)
+            self.abort()
+            return
+        for name, f in self.files.items():
+            f.write(np.ascontiguousarray(planes[name]).tobytes())
+        self.size += self.frame_bytes
+        self.count += 1
+
+    def _close_files(self) -> None:
+        for f in self.files.values():
+            f.close()
+        self.files = {}
+
+    def commit(self) -> None:
+        """Publish the entry (only when at least one frame was written)."""
+        if not self.valid:
+            return
+        self._close_files()
+        if self.count == 0:
+            self.abort()
+            return
+        self.meta["count"] = self.count
+        with open(self.tmp / "meta.json", "w", encoding="utf-8") as f:
+            json.dump(self.meta, f)
+        self.size += (self.tmp / "meta.json").stat().st_size
+        target = self.cache.root / self.key
+        try:
+            os.replace(self.tmp, target)
+        except OSError:
+            # Another process stored the same entry first
+            shutil.rmtree(self.tmp, ignore_errors=True)
+            return
+        self.valid = False
+        self.cache.added(self.size)
+
+    def abort(self) -> None:
+        self.valid = False
+        self._close_files()
+        shutil.rmtree(self.tmp, ignore_errors=True)
+
+
+class FrameCache:
+    """
+    Least-recently-used cache of converted frames, limited to `max_bytes`.
+
+    - `hash_contents`: key on the file bytes instead of path + size + mtime
+      (slower to compute, survives copies and renames).
+    """
+
+    def __init__(
+        self,
+        root: Union[str, Path] = ".ascii_cache",
+        max_bytes: int = 256 * 1024 * 1024,
+        hash_contents: bool = False,
+    ):
+        self.root = Path(root)
+        self.max_bytes = int(max_bytes)
+        self.hash_contents = hash_contents
+        self.hits = 0
+        self.misses = 0
+
+    def key(self, source: Union[str, Path], settings: tuple) -> str:
+        """Cache key of `source` converted with `settings`."""
+        h = hashlib.sha256(file_digest(source, self.hash_contents).encode())
+        h.update(repr(settings).encode())
+        return h.hexdigest()
+
+    # ────────────────────────────────────────────────
+    # Lookup / store
+    # ────────────────────────────────────────────────
+
+    def get(self, key: str, encoder=None) -> Optional[Iterator[AsciiFrame]]:
+        """Frames of a stored entry (memory-mapped), or None on a miss."""
+        entry = self.root / key
+        try:
+            with open(entry / "meta.json", encoding="utf-8") as f:
+                meta = json.load(f)
+            planes = {
+                name: np.memmap(
+                    entry / f"{name}.bin",
+                    dtype=np.dtype(spec["dtype"]),
+                    mode="r",
+                    shape=(meta["count"], *spec["shape"]),
+                )
+                for name, spec in meta["planes"].items()
+            }
+            # Mark as recently used
+            os.utime(entry / "meta.json")
+        except (OSError, ValueError, KeyError):
+            self._record(hit=False)
+            return None
+
+        self._record(hit=True)
+        return self._frames(meta, planes, encoder)
+
+    def fps(self, key: str) -> float:
+        """Source frame rate stored with an entry."""
+        try:
+            with open(self.root / key / "meta.json", encoding="utf-8") as f:
+                return float(json.load(f).get("fps", 0.0))
+        except (OSError, ValueError):
+            return 0.0
+
+    @staticmethod
+    def _frames(meta: dict, planes: dict, encoder) -> Iterator[AsciiFrame]:
+        mode = get_mode(meta["mode"])
+        for i in range(meta["count"]):
+            # Copy out of the map so the entry can be evicted while frames live on
+            glyphs, colors, background = (
+                np.array(planes[name][i]) if name in planes else None for name in PLANES
+            )
+            yield AsciiFrame(glyphs, colors, meta["charset"], mode, encoder, background)
+
+    def writer(self, key: str, fps: float = 0.0) -> Optional[CacheWriter]:
+        """Start a new entry; None when the cache folder is not writable."""
+        if self.max_bytes <= 0:
+            return None
+        try:
+            return CacheWriter(self, key, fps)
+        except OSError as exc:
+            logger.warning("Frame cache disabled: %s", exc)
+            return None
+
+    # ────────────────────────────────────────────────
+    # Size management and statistics
+    # ────────────────────────────────────────────────
+
+    def _entries(self) -> list:
+        """(last use, size, path) of every complete entry."""
+        entries = []
+        if not self.root.is_dir():
+            return entries
+        for entry in self.root.iterdir():
+            meta = entry / "meta.json"
+            if entry.name.startswith(_TMP_PREFIX) or not meta.is_file():
+                continue
+            try:
+                size = sum(f.stat().st_size for f in entry.iterdir())
+                entries.append((meta.stat().st_mtime, size, entry))
+            except OSError:
+                continue
+        return entries
+
+    def _evict(self, stats: dict) -> int:
+        """Remove least recently used entries until under `max_bytes` (lock held)."""
+        entries = sorted(self._entries())
+        total = sum(size for _, size, _ in entries)
+        freed = 0
+        for _, size, entry in entries:
+            if total <= self.max_bytes:
+                break
+            shutil.rmtree(entry, ignore_errors=True)
+            total -= size
+            freed += size
+            logger.debug("Evicted cache entry %s (%d bytes)", entry.name, size)
+        stats["size_bytes"] = total
+        return freed
+
+    def evict(self) -> int:
+        """Remove least recently used entries until under `max_bytes`. Returns bytes freed."""
+        with self._stats() as stats:
+            return self._evict(stats) if stats is not None else 0
+
+    def added(self, size: int) -> None:
+        """Account for a committed entry; rescans the entries only when over `max_bytes`."""
+        with self._stats() as stats:
+            if stats is None:
+                return
+            if "size_bytes" in stats:
+                stats["size_bytes"] += size
+            else:
+                stats["size_bytes"] = sum(s for _, s, _ in self._entries())
+            if stats["size_bytes"] > self.max_bytes:
+                self._evict(stats)
+
+    @contextmanager
+    def _lock(self) -> Iterator[bool]:
+        """Hold the cache lock file; yields False when it could not be taken in time."""
+        path = self.root / LOCK_FILE
+        deadline = time.monotonic() + _LOCK_TIMEOUT
+        locked = False
+        while not locked and time.monotonic() < deadline:
+            try:
+                os.close(os.open(path, os.O_CREAT | os.O_EXCL | os.O_WRONLY))
+                locked = True
+            except FileExistsError:
+                try:
+                    # A crashed process never releases its lock
+                    if time.time() - path.stat().st_mtime > _LOCK_STALE:
+                        path.unlink()
+                        continue
+                except OSError:
+                    continue
+                time.sleep(0.005)
+        if not locked:
+            yield False
+            return
+        try:
+            yield True
+        finally:
+            path.unlink(missing_ok=True)
+
+    @contextmanager
+    def _stats(self) -> Iterator[Optional[dict]]:
+        """Read-modify-write of the statistics file under the lock (None when unavailable)."""
+        try:
+            self.root.mkdir(parents=True, exist_ok=True)
+        except OSError:
+            yield None
+            return
+        with self._lock() as locked:
+            if not locked:
+                logger.debug("Cache statistics are locked, not updating them")
+                yield None
+                return
+            stats = self._load_stats()
+            yield stats
+            stats["updated"] = time.time()
+            tmp = self.root / f"{_TMP_PREFIX}{STATS_FILE}-{uuid.uuid4().hex[:8]}"
+            try:
+                with open(tmp, "w", encoding="utf-8") as f:
+                    json.dump(stats, f)
+                os.replace(tmp, self.root / STATS_FILE)
+            except OSError:
+                tmp.unlink(missing_ok=True)
+
+    def _load_stats(self) -> dict:
+        try:
+            with open(self.root / STATS_FILE, encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {"hits": 0, "misses": 0}
+
+    def _record(self, hit: bool) -> None:
+        """Count a lookup, in this process and in the persistent totals."""
+        name = "hits" if hit else "misses"
+        setattr(self, name, getattr(self, name) + 1)
+        with self._stats() as stats:
+            if stats is not None:
+                stats[name] = stats.get(name, 0) + 1
+
+    def status(self) -> dict:
+        """Size and hit/miss totals, for `status --json`."""
+        entries = self._entries()
+        stats = self._load_stats()
+        lookups = stats.get("hits", 0) + stats.get("misses", 0)
+        return {
+            "path": str(self.root.resolve()),
+            "entries": len(entries),
+            "size_bytes": sum(size for _, size, _ in entries),
+            "max_bytes": self.max_bytes,
+            "hits": stats.get("hits", 0),
+            "misses": stats.get("misses", 0),
+            "hit_rate": stats.get("hits", 0) / lookups if lookups else 0.0,
+        }
+
+    def clear(self) -> None:
+        """Remove every entry and reset the statistics."""
+        shutil.rmtree(self.root, ignore_errors=True)
+        self.hits = self.misses = 0
@@ -1,6 +1,18 @@
-from typing import Optional
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from enum import Enum
+from functools import lru_cache
+from typing import TYPE_CHECKING, Optional, Sequence, Tuple, Union
+
+import cv2
 import numpy as np
 from ..settings import Mode
+from .palette import ansi_16_sgr, nearest_code, quantize
+from .subcell import SUBCELL_CHARSET, SUBCELL_SIZE, subcell_cells
+
+if TYPE_CHECKING:
+    from .tone import ToneMap
 
 # ============================================================
 #                  CONVERTER HELPERS
@@ -43,15 +55,255 @@ def gray_to_ansi(gray, char) -> str:
     return f"\033[38;5;{color_code}m{char}\033[0m"
 
 
+def rgb_to_ansi256(r, g, b, char) -> str:
+    """Quantize an RGB color to the xterm-256 palette (\033[38;5;Nm)."""
+    return f"\033[38;5;{nearest_code(r, g, b, 256)}m{char}\033[0m"
+
+
+def rgb_to_ansi16(r, g, b, char) -> str:
+    """Quantize an RGB color to the basic 16 colors (\033[3Xm / \033[9Xm)."""
+    return f"{ansi_16_sgr(nearest_code(r, g, b, 16))}{char}\033[0m"
+
+
+# ============================================================
+#                  VECTORIZED LOOKUP TABLES
+# ============================================================
+
+# A byte table is a (N, K) uint8 array holding N pre-encoded UTF-8 strings,
+# zero padded to the longest one, plus an (N,) array with their real lengths.
+ByteTable = Tuple[np.ndarray, np.ndarray]
+
+RESET = "\033[0m"
+
+# Indexed color modes and the size of their palette
+PALETTE_MODES = {Mode.ANSI256: 256, Mode.ANSI16: 16}
+
+
+def byte_table(items: Sequence[str]) -> ByteTable:
+    """Pre-encode a sequence of strings into a padded byte table."""
+    encoded = [item.encode("utf-8") for item in items]
+    width = max((len(e) for e in encoded), default=0) or 1
+    table = np.zeros((len(encoded), width), dtype=np.uint8)
+    for i, data in enumerate(encoded):
+        table[i, : len(data)] = np.frombuffer(data, dtype=np.uint8)
+    lengths = np.array([len(e) for e in encoded], dtype=np.intp)
+    return table, lengths
+
+
+@lru_cache(maxsize=None)
+def constant_table(text: str) -> ByteTable:
+    """Byte table with a single entry, used for fixed parts of a cell."""
+    return byte_table([text])
+
+
+@lru_cache(maxsize=16)
+def glyph_lut(gradient: str) -> np.ndarray:
+    """256-entry luminance → glyph index table (same mapping as `get_index_ascii`)."""
+    last = len(gradient) - 1
+    return np.array([int(v / 255 * last) for v in range(256)], dtype=np.uint8)
+
+
+@lru_cache(maxsize=16)
+def glyph_table(gradient: str) -> ByteTable:
+    """Byte table with every glyph of the gradient encoded as UTF-8."""
+    return byte_table(list(gradient))
+
+
+@lru_cache(maxsize=None)
+def number_table(suffix: str) -> ByteTable:
+    """Byte table with the decimal text of 0–255 followed by `suffix`."""
+    return byte_table([f"{v}{suffix}" for v in range(256)])
+
+
+@lru_cache(maxsize=None)
+def gray_sgr_table() -> ByteTable:
+    """Byte table with the full xterm grayscale SGR for each gray value 0–255."""
+    return byte_table([f"\033[38;5;{232 + int(v / 255 * 23)}m" for v in range(256)])
+
+
+@lru_cache(maxsize=None)
+def gray_level_lut() -> np.ndarray:
+    """256-entry gray value → grayscale level (0–23) table, as used by `gray_to_ansi`."""
+    return np.array([int(v / 255 * 23) for v in range(256)], dtype=np.uint8)
+
+
+def run_starts(key: np.ndarray, tolerance: int = 0) -> np.ndarray:
+    """
+    Mark the cells that open a new colour run on their row.
+
+    `key` is the colour of each cell, (h, w) or (h, w, c). With a tolerance of
+    zero a run ends as soon as the colour changes; otherwise a cell joins the
+    current run while every channel stays within `tolerance` of the colour
+    that opened it.
+    """
+    if key.ndim == 2:
+        key = key[..., None]
+    h, w, _ = key.shape
+    starts = np.ones((h, w), dtype=bool)
+
+    if tolerance <= 0:
+        starts[:, 1:] = np.any(key[:, 1:] != key[:, :-1], axis=2)
+        return starts
+
+    # Runs are anchored to their first colour, so walk the columns while
+    # still processing every row at once.
+    anchor = key[:, 0].astype(np.int16)
+    for x in range(1, w):
+        current = key[:, x].astype(np.int16)
+        new_run = np.abs(current - anchor).max(axis=1) > tolerance
+        anchor[new_run] = current[new_run]
+        starts[:, x] = new_run
+    return starts
+
+
+@lru_cache(maxsize=None)
+def palette_sgr_table(colors: int) -> ByteTable:
+    """Byte table with the SGR sequence of every palette code."""
+    if colors == 16:
+        return byte_table([ansi_16_sgr(code) for code in range(16)])
+    return byte_table([f"\033[38;5;{code}m" for code in range(256)])
+
+
+def as_uint8(plane: Optional[np.ndarray]) -> Optional[np.ndarray]:
+    """
+    `plane` as 0–255 uint8 pixel values, the type every lookup table expects.
+
+    Other numeric types are clipped to 0–255 and truncated (like `int()`);
+    anything else raises TypeError.
+    """
+    if plane is None or plane.dtype == np.uint8:
+        return plane
+    if plane.dtype == np.bool_ or not np.issubdtype(plane.dtype, np.number) or np.iscomplexobj(plane):
+        raise TypeError(f"Unsupported pixel type: {plane.dtype}")
+    return np.clip(plane, 0, 255).astype(np.uint8)
+
+
+def charset_for(mode: Mode, gradient: str) -> str:
+    """Characters the glyph indices of a mode refer to."""
+    return SUBCELL_CHARSET.get(mode, gradient)
+
+
+def gather(table: ByteTable, index: np.ndarray, keep: Optional[np.ndarray] = None):
+    """Look up `index` in a byte table, optionally dropping cells where `keep` is False."""
+    data, lengths = table
+    cells = np.take(data, index, axis=0)
+    sizes = np.take(lengths, index)
+    if keep is not None:
+        sizes = np.where(keep, sizes, 0)
+    return cells, sizes
+
+
+def constant(table: ByteTable, shape: Tuple[int, int], keep: Optional[np.ndarray] = None):
+    """Broadcast a single-entry byte table over a grid of cells."""
+    data, lengths = table
+    cells = np.broadcast_to(data[0], shape + (data.shape[1],))
+    sizes = np.broadcast_to(lengths[0], shape)
+    if keep is not None:
+        sizes = np.where(keep, sizes, 0)
+    return cells, sizes
+
+
+def assemble(parts, shape: Tuple[int, int], newline: bool = True) -> str:
+    """
+    Join per-cell byte segments into the final frame text.
+
+    Each part is a (cells, sizes) pair: `cells` is (h, w, k) bytes and `sizes`
+    is how many of those k bytes belong to the cell. Segments are laid out
+    cell by cell and row by row, unused padding is masked out and a newline
+    is inserted between rows.
+    """
+    h, w = shape
+    data = np.concatenate(
+        [np.broadcast_to(c, (h, w, c.shape[-1])) for c, _ in parts], axis=2
+    ).reshape(h, -1)
+    mask = np.concatenate(
+        [np.arange(c.shape[-1]) < np.broadcast_to(s, (h, w))[..., None] for c, s in parts],
+        axis=2,
+    ).reshape(h, -1)
+
+    if newline and h > 1:
+        data = np.concatenate([data, np.full((h, 1), ord("\n"), dtype=np.uint8)], axis=1)
+        mask = np.concatenate([mask, (np.arange(h) < h - 1)[:, None]], axis=1)
+
+    return data[mask].tobytes().decode("utf-8")
+
+
+# ============================================================
+#                  CONVERTER
+# ============================================================
+
+
+class ConversionEngine(Enum):
+    """Available conversion engines."""
+
+    VECTORIZED = "vectorized"  # Whole-array lookups (default)
+    THREADED = "threaded"  # Vectorized, split in row bands across a thread pool
+    REFERENCE = "reference"  # Per-pixel Python loop, kept to check the others against
+
+
 class Converter:
     """Encapsula la lógica de convertir imágenes (gray + color) a ASCII.
 
     Objetivo: cambiar la forma de mapear píxeles a caracteres sin tocar
     `Processor` ni la captura de frames.
+
+    The vectorized engine produces exactly the same text as the reference
+    per-pixel loop, which stays available through `engine="reference"`.
+
+    With `coalesce=True` colour escapes are only written when the colour
+    changes along a row and each line ends with a single reset. A non-zero
+    `tolerance` (0–255, per channel) lets nearly equal colours share a run.
+
+    The threaded engine splits the planes into row bands and converts them on
+    `workers` threads (NumPy and OpenCV release the GIL); bands are joined in
+    order, so the output is identical to the single-threaded one.
     """
 
-    def __init__(self):
-        pass
+    # Bands smaller than this are not worth a thread
+    MIN_BAND_ROWS = 16
+
+    def __init__(
+        self,
+        engine: Union[ConversionEngine, str] = ConversionEngine.VECTORIZED,
+        coalesce: bool = False,
+        tolerance: int = 0,
+        workers: Optional[int] = None,
+    ):
+        self.engine = (
+            engine if isinstance(engine, ConversionEngine) else ConversionEngine(engine.lower())
+        )
+        self.coalesce = coalesce
+        self.tolerance = max(0, int(tolerance))
+        self.workers = max(1, int(workers or os.cpu_count() or 1))
+        self._pool: Optional[ThreadPoolExecutor] = None
+        self._pool_lock = threading.Lock()
+
+    def __getstate__(self) -> dict:
+        # Thread pools and locks can't be pickled (the converter travels to worker processes)
+        state = self.__dict__.copy()
+        state["_pool"] = None
+        del state["_pool_lock"]
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        self.__dict__.update(state)
+        self._pool_lock = threading.Lock()
+
+    def _bands(self, rows: int) -> list[slice]:
+        """Row bands to convert in parallel (a single band unless threaded)."""
+        count = min(self.workers, rows // self.MIN_BAND_ROWS)
+        if self.engine != ConversionEngine.THREADED or count < 2:
+            return [slice(0, rows)]
+        bounds = np.linspace(0, rows, count + 1).astype(int)
+        return [slice(start, stop) for start, stop in zip(bounds[:-1], bounds[1:])]
+
+    def _map_bands(self, func, bands: list[slice]) -> list:
+        with self._pool_lock:
+            if self._pool is None:
+                self._pool = ThreadPoolExecutor(
+                    max_workers=self.workers, thread_name_prefix="ascii-band"
+                )
+        return list(self._pool.map(func, bands))
 
     def convert(
         self,
@@ -59,10 +311,225 @@ class Converter:
         color_frame: Optional[np.ndarray],
         gradient,
         mode: Mode,
+        tone: Optional["ToneMap"] = None,
     ) -> str:
         if gray is None or gray.size == 0:
             return ""
 
+        gray, color_frame = as_uint8(gray), as_uint8(color_frame)
+        # Run-length and sub-cell output only exist in the vectorized encoder
+        if (
+            self.engine == ConversionEngine.REFERENCE
+            and not self.coalesce
+            and mode not in SUBCELL_SIZE
+        ):
+            if tone is not None:
+                gray = tone.apply(gray)
+                color_frame = None if color_frame is None else tone.apply(color_frame)
+            return self.convert_reference(gray, color_frame, gradient, mode)
+        return self.convert_vectorized(gray, color_frame, gradient, mode, tone)
+
+    def convert_vectorized(
+        self,
+        gray: np.ndarray,
+        color_frame: Optional[np.ndarray],
+        gradient,
+        mode: Mode,
+        tone: Optional["ToneMap"] = None,
+    ) -> str:
+        """Convert whole planes at once using lookup tables."""
+        glyphs, colors, background = self.cells(gray, color_frame, gradient, mode, tone)
+        return self.encode(glyphs, colors, charset_for(mode, gradient), mode, background)
+
+    def cells(
+        self,
+        gray: np.ndarray,
+        color_frame: Optional[np.ndarray],
+        gradient,
+        mode: Mode,
+        tone: Optional["ToneMap"] = None,
+    ) -> Tuple[np.ndarray, Optional[np.ndarray], Optional[np.ndarray]]:
+        """
+        Map the resized planes to cells.
+
+        Returns the glyph index of every cell (into `charset_for(mode, gradient)`),
+        its colour and its background colour. The colour is the BGR pixel for
+        RGB and the sub-cell modes, the gray value for GRAYSCALE, the palette
+        code for the indexed modes, or None when the mode has no colour. Only
+        the HALFBLOCK and QUADRANT modes have a background.
+
+        For sub-cell modes the planes must be SUBCELL_SIZE[mode] times larger
+        than the cell grid (see `Resizer.compute_size`).
+
+        An optional `tone` map is folded into the glyph lookup table and
+        applied to the colour plane. Planes of other numeric types are
+        converted with `as_uint8`.
+        """
+        gray, color_frame = as_uint8(gray), as_uint8(color_frame)
+        if tone is not None and tone.is_identity:
+            tone = None
+
+        if mode in SUBCELL_SIZE:
+            if tone is not None:
+                gray = tone.apply(gray)
+                color_frame = None if color_frame is None else tone.apply(color_frame)
+            return subcell_cells(gray, color_frame, mode)
+
+        bands = self._bands(gray.shape[0])
+        if len(bands) > 1:
+            results = self._map_bands(
+                lambda band: self._band_cells(
+                    gray[band],
+                    None if color_frame is None else color_frame[band],
+                    gradient,
+                    mode,
+                    tone,
+                ),
+                bands,
+            )
+            glyphs = np.concatenate([r[0] for r in results])
+            colors = None if results[0][1] is None else np.concatenate([r[1] for r in results])
+            return glyphs, colors, None
+        return self._band_cells(gray, color_frame, gradient, mode, tone)
+
+    def _band_cells(
+        self,
+        gray: np.ndarray,
+        color_frame: Optional[np.ndarray],
+        gradient,
+        mode: Mode,
+        tone: Optional["ToneMap"],
+    ) -> Tuple[np.ndarray, Optional[np.ndarray], None]:
+        """`cells` for a single band of gradient-based modes."""
+        lut = glyph_lut(gradient) if tone is None else tone.glyph_lut(gradient)
+        glyphs = cv2.LUT(gray, lut)
+
+        if tone is not None and color_frame is not None and mode != Mode.GRAYSCALE:
+            color_frame = tone.apply(color_frame)
+
+        if mode == Mode.RGB and color_frame is not None:
+            colors = color_frame
+        elif mode == Mode.GRAYSCALE:
+            colors = gray if tone is None else tone.apply(gray)
+        elif mode in PALETTE_MODES and color_frame is not None:
+            colors = quantize(color_frame, PALETTE_MODES[mode])
+        else:
+            colors = None
+        return glyphs, colors, None
+
+    def encode(
+        self,
+        glyphs: np.ndarray,
+        colors: Optional[np.ndarray],
+        charset: str,
+        mode: Mode,
+        background: Optional[np.ndarray] = None,
+    ) -> str:
+        """Encode a cell grid as one line of text per row."""
+        bands = self._bands(glyphs.shape[0])
+        if len(bands) > 1:
+            return "\n".join(
+                self._map_bands(
+                    lambda band: self._encode_band(
+                        glyphs[band],
+                        None if colors is None else colors[band],
+                        charset,
+                        mode,
+                        None if background is None else background[band],
+                    ),
+                    bands,
+                )
+            )
+        return self._encode_band(glyphs, colors, charset, mode, background)
+
+    def _encode_band(
+        self,
+        glyphs: np.ndarray,
+        colors: Optional[np.ndarray],
+        charset: str,
+        mode: Mode,
+        background: Optional[np.ndarray],
+    ) -> str:
+        """`encode` for a single band of rows."""
+        shape = glyphs.shape
+        sgr = resets = None
+        if self.coalesce and colors is not None:
+            sgr = self.color_runs(colors, mode, background)
+            resets = np.zeros(shape, dtype=bool)
+            resets[:, -1] = True
+
+        parts = self.cell_parts(glyphs, colors, charset, mode, None, sgr, resets, background)
+        return assemble(parts, shape)
+
+    def color_runs(
+        self, colors: np.ndarray, mode: Mode, background: Optional[np.ndarray] = None
+    ) -> np.ndarray:
+        """Cells opening a new colour run, honouring the configured tolerance."""
+        if mode == Mode.GRAYSCALE:
+            # Gray levels are ~11 units apart on the 0–255 scale
+            levels = np.take(gray_level_lut(), colors)
+            return run_starts(levels, self.tolerance * 23 // 255)
+        if mode in PALETTE_MODES:
+            return run_starts(colors, 0)
+        if background is not None:
+            colors = np.concatenate([colors, background], axis=2)
+        return run_starts(colors, self.tolerance)
+
+    def cell_parts(
+        self,
+        glyphs: np.ndarray,
+        colors: Optional[np.ndarray],
+        charset: str,
+        mode: Mode,
+        keep: Optional[np.ndarray] = None,
+        sgr: Optional[np.ndarray] = None,
+        resets: Optional[np.ndarray] = None,
+        background: Optional[np.ndarray] = None,
+    ) -> list:
+        """
+        Byte segments of every cell: colour escape, glyph and reset.
+
+        `keep`, `sgr` and `resets` select which cells write their glyph, their
+        colour escape and a trailing reset (None means every cell).
+        """
+        shape = glyphs.shape
+        glyph_part = gather(glyph_table(charset), glyphs, keep)
+        if colors is None:
+            return [glyph_part]
+
+        if mode == Mode.GRAYSCALE:
+            color_parts = [gather(gray_sgr_table(), colors, sgr)]
+        elif mode in PALETTE_MODES:
+            color_parts = [gather(palette_sgr_table(PALETTE_MODES[mode]), colors, sgr)]
+        elif background is None:
+            color_parts = [
+                constant(constant_table("\033[38;2;"), shape, sgr),
+                gather(number_table(";"), colors[..., 2], sgr),
+                gather(number_table(";"), colors[..., 1], sgr),
+                gather(number_table("m"), colors[..., 0], sgr),
+            ]
+        else:
+            # Foreground and background in one sequence: 38;2;R;G;B;48;2;R;G;B
+            color_parts = [
+                constant(constant_table("\033[38;2;"), shape, sgr),
+                gather(number_table(";"), colors[..., 2], sgr),
+                gather(number_table(";"), colors[..., 1], sgr),
+                gather(number_table(";48;2;"), colors[..., 0], sgr),
+                gather(number_table(";"), background[..., 2], sgr),
+                gather(number_table(";"), background[..., 1], sgr),
+                gather(number_table("m"), background[..., 0], sgr),
+            ]
+
+        return [*color_parts, glyph_part, constant(constant_table(RESET), shape, resets)]
+
+    def convert_reference(
+        self,
+        gray: np.ndarray,
+        color_frame: Optional[np.ndarray],
+        gradient,
+        mode: Mode,
+    ) -> str:
+        """Convert pixel by pixel (original implementation)."""
         h, w = gray.shape
         ascii_lines = []
         for y in range(h):
@@ -76,6 +543,12 @@ class Converter:
                     row.append(rgb_to_ansi(r, g, b, char))
                 elif mode == Mode.GRAYSCALE:
                     row.append(gray_to_ansi(pixel_val, char))
+                elif mode == Mode.ANSI256 and color_frame is not None:
+                    b, g, r = color_frame[y, x]
+                    row.append(rgb_to_ansi256(r, g, b, char))
+                elif mode == Mode.ANSI16 and color_frame is not None:
+                    b, g, r = color_frame[y, x]
+                    row.append(rgb_to_ansi16(r, g, b, char))
                 else:
                     row.append(char)
             ascii_lines.append("".join(row))
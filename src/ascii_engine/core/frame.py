@@ -0,0 +1,109 @@
+from typing import Optional, Tuple
+
+import numpy as np
+
+from .converter import Converter, PALETTE_MODES, gray_level_lut
+from .palette import xterm_256_to_rgb
+from ..settings import Mode
+
+_DEFAULT_ENCODER = Converter()
+
+# RGB of every xterm-256 code, used to turn indexed colours back into pixels
+_XTERM_RGB = np.array([xterm_256_to_rgb(code) for code in range(256)], dtype=np.uint8)
+
+
+class AsciiFrame:
+    """A converted frame stored as compact cell planes.
+
+    - `glyphs`: (h, w) uint8 index of each cell's character in `charset`.
+    - `colors`: optional uint8 colour plane. (h, w, 3) BGR for RGB and the
+      sub-cell modes, (h, w) gray values for GRAYSCALE, (h, w) palette codes
+      for the indexed modes, None for plain ASCII.
+    - `background`: optional (h, w, 3) BGR background plane (HALFBLOCK and
+      QUADRANT modes).
+    - `timestamp`: presentation time in seconds (source time for files,
+      capture time for cameras); None when unknown.
+
+    Text is only produced when a sink asks for it through `to_ansi`,
+    `to_text` or `to_pixels`.
+    """
+
+    __slots__ = ("glyphs", "colors", "charset", "mode", "encoder", "background", "timestamp")
+
+    def __init__(
+        self,
+        glyphs: np.ndarray,
+        colors: Optional[np.ndarray],
+        charset: str,
+        mode: Mode,
+        encoder: Optional[Converter] = None,
+        background: Optional[np.ndarray] = None,
+        timestamp: Optional[float] = None,
+    ):
+        self.glyphs = glyphs
+        self.colors = colors
+        self.charset = charset
+        self.mode = mode
+        self.encoder = encoder or _DEFAULT_ENCODER
+        self.background = background
+        self.timestamp = timestamp
+
+    @property
+    def shape(self) -> Tuple[int, int]:
+        """Grid size as (rows, columns)."""
+        return self.glyphs.shape
+
+    @property
+    def nbytes(self) -> int:
+        """Memory used by the cell planes."""
+        planes = (self.glyphs, self.colors, self.background)
+        return sum(p.nbytes for p in planes if p is not None)
+
+    def to_ansi(self) -> str:
+        """Serialize to text with ANSI colour escapes (same output as `Converter.convert`)."""
+        if self.glyphs.size == 0:
+            return ""
+        return self.encoder.encode(
+            self.glyphs, self.colors, self.charset, self.mode, self.background
+        )
+
+    def to_text(self) -> str:
+        """Serialize to plain text, without colours."""
+        if self.glyphs.size == 0:
+            return ""
+        return self.encoder.encode(self.glyphs, None, self.charset, self.mode)
+
+    def lines(self) -> list[str]:
+        """Plain text rows of the frame."""
+        return self.to_text().split("\n") if self.glyphs.size else []
+
+    def to_pixels(self, default_fg=(255, 255, 255)) -> np.ndarray:
+        """
+        Foreground colour of every cell as an (h, w, 3) RGB array.
+
+        Indexed and grayscale colours are decoded with the xterm palette, like
+        a terminal (or the ANSI parser in `media`) would show them.
+        """
+        if self.colors is None:
+            pixels = np.empty(self.shape + (3,), dtype=np.uint8)
+            pixels[:] = default_fg
+            return pixels
+        if self.mode == Mode.GRAYSCALE:
+            return _XTERM_RGB[232 + np.take(gray_level_lut(), self.colors)]
+        if self.mode in PALETTE_MODES:
+            return _XTERM_RGB[self.colors]
+        return np.ascontiguousarray(self.colors[..., ::-1])
+
+    def background_pixels(self, default_bg=(0, 0, 0)) -> np.ndarray:
+        """Background colour of every cell as an (h, w, 3) RGB array."""
+        if self.background is None:
+            pixels = np.empty(self.shape + (3,), dtype=np.uint8)
+            pixels[:] = default_bg
+            return pixels
+        return np.ascontiguousarray(self.background[..., ::-1])
+
+    def __str__(self) -> str:
+        return self.to_ansi()
+
+    def __repr__(self) -> str:
+        return f"AsciiFrame(shape={self.shape}, mode={self.mode.name})"
@@ -0,0 +1,110 @@
+"""Indexed colour palettes (xterm-256 and ANSI-16) and their lookup cubes.
+
+Quantizing a cell to a palette entry is a single table lookup: the BGR colour
+is reduced to 5 bits per channel and used to index a precomputed 32×32×32
+cube holding the nearest palette entry for each bucket.
+"""
+
+from functools import lru_cache
+from typing import Tuple
+
+import numpy as np
+
+# Approximate 16-color palette (terminals are free to customize these)
+ANSI_16_RGB: list[Tuple[int, int, int]] = [
+    (0, 0, 0),
+    (128, 0, 0),
+    (0, 128, 0),
+    (128, 128, 0),
+    (0, 0, 128),
+    (128, 0, 128),
+    (0, 128, 128),
+    (192, 192, 192),
+    (128, 128, 128),
+    (255, 0, 0),
+    (0, 255, 0),
+    (255, 255, 0),
+    (0, 0, 255),
+    (255, 0, 255),
+    (0, 255, 255),
+    (255, 255, 255),
+]
+
+CUBE_BITS = 5
+CUBE_SIZE = 1 << CUBE_BITS
+
+
+def xterm_256_to_rgb(code: int) -> Tuple[int, int, int]:
+    """Convert xterm-256 color code to an RGB tuple.
+
+    Implements the standard 256-color mapping (16 + 6*6*6 + 24 grayscale).
+    """
+    if code < 16:
+        return ANSI_16_RGB[code]
+    if 16 <= code <= 231:
+        c = code - 16
+        r = (c // 36) % 6
+        g = (c // 6) % 6
+        b = c % 6
+        scale = [0, 95, 135, 175, 215, 255]
+        return (scale[r], scale[g], scale[b])
+    if 232 <= code <= 255:
+        v = 8 + (code - 232) * 10
+        return (v, v, v)
+    return (255, 255, 255)
+
+
+@lru_cache(maxsize=None)
+def palette_cube(colors: int) -> np.ndarray:
+    """
+    Build the lookup cube for a 256 or 16 colour palette.
+
+    Returns a flat array of CUBE_SIZE³ palette codes indexed by
+    (r >> 3) * 1024 + (g >> 3) * 32 + (b >> 3). The 256-colour cube only uses
+    codes 16–255, whose RGB values are fixed by the xterm standard.
+    """
+    if colors == 256:
+        codes = np.arange(16, 256)
+    elif colors == 16:
+        codes = np.arange(16)
+    else:
+        raise ValueError(f"Unsupported palette size: {colors}")
+
+    palette = np.array([xterm_256_to_rgb(int(c)) for c in codes], dtype=np.float32)
+
+    # Centre of every bucket, in (r, g, b) order
+    step = 256 // CUBE_SIZE
+    axis = np.arange(CUBE_SIZE, dtype=np.float32) * step + step / 2
+    r, g, b = np.meshgrid(axis, axis, axis, indexing="ij")
+    centres = np.stack([r.ravel(), g.ravel(), b.ravel()], axis=1)
+
+    # Squared distances via |c|² - 2 c·p + |p|² to avoid a (N, P, 3) temporary
+    dist = (
+        (centres**2).sum(axis=1)[:, None]
+        - 2.0 * centres @ palette.T
+        + (palette**2).sum(axis=1)[None, :]
+    )
+    return codes[np.argmin(dist, axis=1)].astype(np.uint8)
+
+
+def quantize(color_frame: np.ndarray, colors: int) -> np.ndarray:
+    """Map a BGR uint8 image to palette codes with one cube lookup per pixel."""
+    shift = 8 - CUBE_BITS
+    b = color_frame[..., 0] >> shift
+    g = color_frame[..., 1] >> shift
+    r = color_frame[..., 2] >> shift
+    index = (r.astype(np.intp) << (2 * CUBE_BITS)) | (g.astype(np.intp) << CUBE_BITS) | b
+    return np.take(palette_cube(colors), index)
+
+
+def nearest_code(r: int, g: int, b: int, colors: int) -> int:
+    """Palette code of a single RGB colour (scalar version of `quantize`)."""
+    shift = 8 - CUBE_BITS
+    index = (int(r) >> shift << (2 * CUBE_BITS)) | (int(g) >> shift << CUBE_BITS) | (int(b) >> shift)
+    return int(palette_cube(colors)[index])
+
+
+def ansi_16_sgr(code: int) -> str:
+    """SGR foreground sequence for an ANSI-16 code (30–37 normal, 90–97 bright)."""
+    base = 30 + code if code < 8 else 90 + code - 8
+    return f"\033[{base}m"
@@ -0,0 +1,128 @@
+"""Segment-parallel video conversion.
+
+The video is split into frame ranges; each range is converted by a worker
+process that opens its own `cv2.VideoCapture`, seeks to the first frame of
+the range and converts it independently. Segments come back in order, so
+the result is the same frame sequence a serial pass would produce.
+
+Only a few segments are in flight at a time, which keeps memory bounded
+for long videos while every core stays busy. Workers send back only the
+cell planes; the frames are rebuilt in the parent around its own encoder.
+"""
+
+import math
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Deque, Iterator, List, Optional, Tuple
+
+import numpy as np
+
+import cv2
+
+from .frame import AsciiFrame
+from .time_manager import source_time
+from ..log import get_logger
+from ..settings import Mode
+
+logger = get_logger(__name__)
+
+# Upper bound on frames per segment, so results stream back regularly
+MAX_SEGMENT_FRAMES = 240
+
+# Processor of the current worker process, set by `_init_worker`
+_worker_processor = None
+
+# glyphs, colors, charset, mode, background, timestamp: a frame without its encoder
+FramePlanes = Tuple[np.ndarray, Optional[np.ndarray], str, Mode, Optional[np.ndarray], float]
+
+
+def _init_worker(processor) -> None:
+    global _worker_processor
+    _worker_processor = processor
+
+
+def _convert_segment(source: str, start: int, stop: Optional[int]) -> List[FramePlanes]:
+    """Convert frames [start, stop) of `source`; `stop=None` reads to the end."""
+    cap = cv2.VideoCapture(source)
+    frames: List[FramePlanes] = []
+    fps = cap.get(cv2.CAP_PROP_FPS) or 0.0
+    interval = 1.0 / fps if fps > 0 else 0.0
+    try:
+        if start > 0:
+            cap.set(cv2.CAP_PROP_POS_FRAMES, start)
+        index = start
+        while stop is None or index < stop:
+            ok, frame = cap.read()
+            if not ok:
+                break
+            timestamp = source_time(cap, index, interval)
+            ascii_frame = _worker_processor.process_frame(frame)
+            if ascii_frame is not None:
+                frames.append((
+                    ascii_frame.glyphs,
+                    ascii_frame.colors,
+                    ascii_frame.charset,
+                    ascii_frame.mode,
+                    ascii_frame.background,
+                    timestamp,
+                ))
+            index += 1
+    finally:
+        cap.release()
+    return frames
+
+
+def frame_count(source: str) -> int:
+    """Number of frames reported by the container (0 when unknown)."""
+    cap = cv2.VideoCapture(source)
+    try:
+        return max(0, int(cap.get(cv2.CAP_PROP_FRAME_COUNT) or 0))
+    finally:
+        cap.release()
+
+
+def split_segments(total: int, jobs: int, max_frames: int = MAX_SEGMENT_FRAMES) -> List[Tuple[int, Optional[int]]]:
+    """
+    Split `total` frames into [start, stop) ranges for `jobs` workers.
+
+    The last range is open-ended (stop=None) so frames beyond an
+    underestimated frame count are not lost.
+    """
+    size = max(1, min(math.ceil(total / max(1, jobs)), max_frames))
+    starts = list(range(0, total, size)) or [0]
+    ranges: List[Tuple[int, Optional[int]]] = [(s, s + size) for s in starts]
+    ranges[-1] = (ranges[-1][0], None)
+    return ranges
+
+
+def iter_segment_frames(processor, source: str, jobs: int) -> Iterator[AsciiFrame]:
+    """
+    Convert `source` on `jobs` worker processes and yield frames in order.
+
+    `processor` is pickled once into every worker and must be able to run
+    `process_frame` on its own.
+    """
+    ranges = split_segments(frame_count(source), jobs)
+    logger.debug("Converting %s in %d segments on %d processes", source, len(ranges), jobs)
+
+    encoder = processor.ascii_converter
+
+    def frames(future: Future) -> Iterator[AsciiFrame]:
+        for glyphs, colors, charset, mode, background, timestamp in future.result():
+            yield AsciiFrame(glyphs, colors, charset, mode, encoder, background, timestamp)
+
+    pending: Deque[Future] = deque()
+    with ProcessPoolExecutor(
+        max_workers=jobs, initializer=_init_worker, initargs=(processor,)
+    ) as pool:
+        try:
+            for start, stop in ranges:
+                pending.append(pool.submit(_convert_segment, source, start, stop))
+                # Keep a couple of segments per worker in flight
+                if len(pending) >= jobs * 2:
+                    yield from frames(pending.popleft())
+            while pending:
+                yield from frames(pending.popleft())
+        finally:
+            for future in pending:
+                future.cancel()
@@ -0,0 +1,216 @@
+"""Threaded capture → convert → render pipeline.
+
+Stages run concurrently and are connected by bounded queues:
+
+    capture thread ──► [input queue] ──► N conversion workers ──► [output queue] ──► consumer
+
+The bounded queues provide backpressure (a fast capture blocks instead of
+buffering the whole video) and the consumer gets frames back in capture order,
+so decoding, conversion and terminal output overlap and throughput
+approaches the slowest stage instead of the sum of all of them.
+"""
+
+import heapq
+import queue
+import threading
+from dataclasses import dataclass
+from typing import Any, Callable, Iterator, Optional, Tuple
+
+import numpy as np
+
+from .time_manager import Backoff
+from ..log import get_logger
+
+# Marks the end of the stream in a queue
+_END = object()
+
+
+@dataclass
+class PipelineStats:
+    """Counters and queue depths, safe to read while the pipeline runs."""
+
+    captured: int = 0
+    converted: int = 0
+    rendered: int = 0
+    input_depth: int = 0
+    output_depth: int = 0
+    max_input_depth: int = 0
+    max_output_depth: int = 0
+
+
+class FramePipeline:
+    """Runs capture and conversion on separate threads.
+
+    - `read`: returns (ok, frame) like `cv2.VideoCapture.read`.
+    - `convert`: turns a frame into the object handed to the consumer; runs
+      on `workers` threads at once.
+    - `sink`: optional callback used by `run`; `results` yields instead.
+    - `retry_on_fail`: keep reading when `read` fails (live cameras).
+
+    Converted frames are always handed over in capture order, on the thread
+    that calls `run` or iterates `results`.
+    """
+
+    def __init__(
+        self,
+        read: Callable[[], Tuple[bool, Optional[np.ndarray]]],
+        convert: Callable[[np.ndarray], Any],
+        sink: Optional[Callable[[Any], None]] = None,
+        workers: int = 2,
+        queue_size: int = 4,
+        retry_on_fail: bool = False,
+    ):
+        self.logger = get_logger(__name__)
+        self.read = read
+        self.convert = convert
+        self.sink = sink
+        self.workers = max(1, int(workers))
+        self.retry_on_fail = retry_on_fail
+
+        self.input_queue: queue.Queue = queue.Queue(maxsize=max(1, queue_size))
+        self.output_queue: queue.Queue = queue.Queue(maxsize=max(1, queue_size))
+        self.stats = PipelineStats()
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._error: Optional[BaseException] = None
+
+    # ────────────────────────────────────────────────
+    # Public API
+    # ────────────────────────────────────────────────
+
+    def run(self) -> PipelineStats:
+        """Feed every result to `sink` until the source ends, `stop()` is called or a stage fails."""
+        if self.sink is None:
+            raise ValueError("FramePipeline.run needs a sink")
+        for result in self.results():
+            self.sink(result)
+        return self.stats
+
+    def results(self) -> Iterator[Any]:
+        """Start the worker threads and yield converted frames in capture order.
+
+        Closing the generator early (or an exception in the consumer) stops
+        the pipeline. Stage errors are re-raised here.
+        """
+        threads = [threading.Thread(target=self._capture_loop, name="pipeline-capture", daemon=True)]
+        threads += [
+            threading.Thread(target=self._convert_loop, name=f"pipeline-convert-{i}", daemon=True)
+            for i in range(self.workers)
+        ]
+        for t in threads:
+            t.start()
+
+        try:
+            yield from self._ordered()
+        finally:
+            self.stop()
+            for t in threads:
+                t.join(timeout=1.0)
+
+        if self._error is not None:
+            raise self._error
+
+    def stop(self) -> None:
+        """Ask every stage to finish as soon as possible."""
+        self._stop.set()
+
+    def queue_depths(self) -> Tuple[int, int]:
+        """Current number of frames waiting in the (input, output) queues."""
+        return self.input_queue.qsize(), self.output_queue.qsize()
+
+    # ────────────────────────────────────────────────
+    # Stages
+    # ────────────────────────────────────────────────
+
+    def _put(self, q: queue.Queue, item) -> bool:
+        """Blocking put that gives up when the pipeline is stopped."""
+        while not self._stop.is_set():
+            try:
+                q.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _get(self, q: queue.Queue):
+        """Blocking get that returns _END when the pipeline is stopped."""
+        while not self._stop.is_set():
+            try:
+                return q.get(timeout=0.1)
+            except queue.Empty:
+                continue
+        return _END
+
+    def _update_depths(self) -> None:
+        stats = self.stats
+        stats.input_depth, stats.output_depth = self.queue_depths()
+        stats.max_input_depth = max(stats.max_input_depth, stats.input_depth)
+        stats.max_output_depth = max(stats.max_output_depth, stats.output_depth)
+
+    def _fail(self, exc: BaseException) -> None:
+        if self._error is None:
+            self._error = exc
+        self.stop()
+
+    def _capture_loop(self) -> None:
+        seq = 0
+        backoff = Backoff()
+        try:
+            while not self._stop.is_set():
+                ok, frame = self.read()
+                if not ok:
+                    if self.retry_on_fail:
+                        backoff.wait()
+                        continue
+                    break
+                backoff.reset()
+                if not self._put(self.input_queue, (seq, frame)):
+                    return
+                seq += 1
+                self.stats.captured = seq
+                self._update_depths()
+        except Exception as exc:
+            self._fail(exc)
+        finally:
+            # One end marker per worker
+            for _ in range(self.workers):
+                if not self._put(self.input_queue, _END):
+                    break
+
+    def _convert_loop(self) -> None:
+        try:
+            while True:
+                item = self._get(self.input_queue)
+                if item is _END:
+                    break
+                seq, frame = item
+                result = self.convert(frame)
+                if not self._put(self.output_queue, (seq, result)):
+                    return
+                with self._lock:
+                    self.stats.converted += 1
+        except Exception as exc:
+            self._fail(exc)
+        finally:
+            self._put(self.output_queue, _END)
+
+    def _ordered(self) -> Iterator[Any]:
+        """Reassemble converted frames in capture order."""
+        pending: list = []
+        next_seq = 0
+        finished = 0
+        while finished < self.workers:
+            # Short timeouts in `_get` keep Ctrl+C responsive on this thread
+            item = self._get(self.output_queue)
+            if item is _END:
+                if self._stop.is_set():
+                    return
+                finished += 1
+                continue
+            heapq.heappush(pending, item)
+            while pending and pending[0][0] == next_seq:
+                _, result = heapq.heappop(pending)
+                self._update_depths()
+                yield result
+                next_seq += 1
+                self.stats.rendered = next_seq
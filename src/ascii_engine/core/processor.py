@@ -1,18 +1,35 @@
+import time
 from abc import ABC, abstractmethod
-from typing import Optional, Union
+from dataclasses import replace
+from typing import Callable, Iterator, List, Optional, Sequence, Tuple, Union
 
 import cv2
-import time
 import numpy as np
 
 from .validator import FileValidator
 from .resizer import Resizer
-from .converter import Converter
-
-from ..utils import clear_console, COLORS
-from ..settings import Mode, Gradient, get_gradient_ramp
+from .converter import Converter, charset_for
+from .subcell import SUBCELL_SIZE
+from .tone import ToneMap
+from .renderer import DiffRenderer
+from .frame import AsciiFrame
+from .pipeline import FramePipeline
+from .sinks import FrameSink, ListSink, TerminalSink
+from .time_manager import Backoff, FPSController, FrameScheduler, source_time
+from .parallel import frame_count, iter_segment_frames
+from .still import image_size, is_still_image, read_image, reduction_factor
+from .cache import CacheWriter, FrameCache
+from .quality import QualityController, QualityLevel, quality_levels
+
+from ..utils import COLORS
+from ..settings import Mode, Gradient, get_gradient_ramp, resolve_mode
 from ..log import get_logger
-from .time_manager import FPSController
+
+# A captured frame with its presentation time, in seconds
+TimedFrame = Tuple[np.ndarray, float]
+
+# Returns (ok, (frame, timestamp)), like cv2.VideoCapture.read plus the time
+FrameReader = Callable[[], Tuple[bool, Optional[TimedFrame]]]
 
 
 class Processor(ABC):
@@ -29,17 +46,56 @@ class Processor(ABC):
         validator: Optional[FileValidator] = None,
         resizer: Optional[Resizer] = None,
         ascii_converter: Optional[Converter] = None,
+        renderer: Optional[DiffRenderer] = None,
+        tone: Optional[ToneMap] = None,
+        pipeline_workers: int = 0,
+        sync_playback: bool = True,
+        jobs: int = 1,
+        cache: Optional[FrameCache] = None,
+        adaptive_quality: bool = False,
+        target_fps: float = 0.0,
     ):
         self.logger = get_logger(__name__)
         self.target_width = int(target_width)
         self.scale_factor = float(scale)
         self.gradient = get_gradient_ramp(sequence)
-        self.mode = mode
+        self.mode = resolve_mode(mode)
         self.invert = invert
         self.mirror = mirror
+        # Invert is applied through the tone curve, on the resized planes
+        tone = tone or ToneMap()
+        self.tone = replace(tone, invert=True) if invert else tone
         self.validator = validator or FileValidator()
         self.resizer = resizer or Resizer()
         self.ascii_converter = ascii_converter or Converter()
+        self.renderer = renderer or DiffRenderer(self.ascii_converter)
+        # > 0 runs capture, conversion and output on separate threads
+        self.pipeline_workers = max(0, int(pipeline_workers))
+        self.pipeline: Optional[FramePipeline] = None
+        # Skip late frames of files when the output is only a live preview
+        self.sync_playback = sync_playback
+        self.scheduler: Optional[FrameScheduler] = None
+        # > 1 converts video files in segments on that many processes
+        self.jobs = max(1, int(jobs))
+        # Converted frames of files, reused across runs
+        self.cache = cache
+        self.source_fps: float = 0.0
+        # True when frames are delivered on the source clock
+        self.paced = False
+        # Live previews lower width/colours/interpolation to hold `target_fps`
+        # (0 = the source frame rate)
+        self.adaptive_quality = adaptive_quality
+        self.target_fps = float(target_fps)
+        self.quality: Optional[QualityController] = None
+        # Seconds spent in the last `process_frame`
+        self.convert_time = 0.0
+
+    def __getstate__(self) -> dict:
+        # Running pipelines and schedulers stay in the parent process
+        state = self.__dict__.copy()
+        state["pipeline"] = None
+        state["scheduler"] = None
+        return state
 
     def _validate_source(self, source: Union[str, int]) -> None:
         if not self.validator.validate(source):
@@ -48,107 +104,368 @@ class Processor(ABC):
             raise ValueError(f"{COLORS.RED.value}Invalid camera index: {source}")
 
     @abstractmethod
-    def process_frame(self, frame: np.ndarray) -> str:
+    def process_frame(self, frame: np.ndarray) -> Optional[AsciiFrame]:
         """Core ASCII conversion logic for a single frame/image."""
 
     @abstractmethod
-    def start_processing(self, source: Union[str, int]) -> str:
-        """Main entry point to process source and return or display result."""
+    def iter_frames(self, source: Union[str, int], realtime: bool = False) -> Iterator[AsciiFrame]:
+        """
+        Open `source` and return an iterator over its converted frames.
+
+        With `realtime`, files play on their own clock and frames that are
+        already late are skipped before conversion.
+        """
+
+    def run(self, source: Union[str, int], sinks: Optional[Sequence[FrameSink]] = None) -> int:
+        """
+        Stream every frame of `source` to `sinks` as it is converted.
+
+        Defaults to a terminal preview. Frames are not kept, so memory use does
+        not grow with the length of the source. Returns the number of frames.
+        """
+        if sinks is None:
+            sinks = [self.terminal_sink()]
+
+        realtime = self.sync_playback and all(sink.realtime for sink in sinks)
+        frames = self.iter_frames(source, realtime)
+        self.quality = self.quality_controller(source, realtime)
+        baseline = (self.target_width, self.mode, self.resizer.interpolation)
+        count = 0
+        try:
+            for sink in sinks:
+                sink.open(self.source_fps, paced=self.paced)
+            for frame in frames:
+                started = time.perf_counter()
+                for sink in sinks:
+                    sink.write(frame)
+                count += 1
+                if self.quality is not None:
+                    self._adapt_quality(time.perf_counter() - started)
+
+        except KeyboardInterrupt:
+            self.logger.debug("Processing interrupted by user.")
+
+        finally:
+            # Releases the capture, then lets sinks flush their output
+            frames.close()
+            for sink in sinks:
+                sink.close()
+            if self.quality is not None:
+                # The next run starts again from the configured quality
+                self.target_width, self.mode, self.resizer.interpolation = baseline
+                self.quality = None
+
+        return count
+
+    def quality_controller(self, source: Union[str, int], realtime: bool) -> Optional[QualityController]:
+        """Adaptive quality for live conversion (camera or scheduled playback), else None."""
+        live = self.scheduler is not None or not isinstance(source, str)
+        fps = self.target_fps or self.source_fps
+        if not (self.adaptive_quality and realtime and live and fps > 0):
+            return None
+        levels = quality_levels(
+            self.resizer.effective_width(self.target_width), self.mode, self.resizer.interpolation
+        )
+        return QualityController(fps, levels)
+
+    def _adapt_quality(self, write_time: float) -> None:
+        """Feed the cost of the last frame to the controller and apply its decision."""
+        # Pipeline workers convert in parallel, so each one only needs a share of the budget
+        convert_time = self.convert_time / max(1, self.pipeline_workers)
+        level = self.quality.update(convert_time + write_time)
+        if level is not None:
+            self.apply_quality(level)
+
+    def apply_quality(self, level: QualityLevel) -> None:
+        """Convert the next frames with the settings of `level`."""
+        self.target_width = level.width
+        self.mode = level.mode
+        self.resizer.interpolation = level.interpolation
+
+    def start_processing(self, source: Union[str, int]) -> List[AsciiFrame]:
+        """Show `source` in the terminal and return all of its frames.
+
+        Keeps every frame in memory; prefer `run` with sinks for long sources.
+        """
+        collected = ListSink()
+        self.run(source, [self.terminal_sink(), collected])
+        return collected.frames
+
+    def cache_settings(self) -> tuple:
+        """Every setting that changes the converted cell planes, for cache keys."""
+        return (
+            self.resizer.effective_width(self.target_width),
+            self.scale_factor,
+            self.resizer.interpolation,
+            self.mode.name,
+            self.gradient,
+            self.tone.params,
+            self.mirror,
+        )
+
+    def terminal_sink(self) -> TerminalSink:
+        """Terminal preview sink sharing this processor's renderer."""
+        return TerminalSink(self.renderer, status=self.status_line)
+
+    def status_line(self) -> Optional[str]:
+        """Scheduler drops, pipeline queue depths and quality level, for the terminal status line."""
+        parts: List[str] = []
+        if self.scheduler is not None:
+            stats = self.scheduler.stats
+            parts.append(f"Dropped: {stats.dropped} Late: {stats.late}")
+        if self.pipeline is not None:
+            depth_in, depth_out = self.pipeline.queue_depths()
+            size_in, size_out = self.pipeline.input_queue.maxsize, self.pipeline.output_queue.maxsize
+            parts.append(f"Queue: in {depth_in}/{size_in} out {depth_out}/{size_out}")
+        if self.quality is not None:
+            quality = self.quality
+            parts.append(f"Quality: {len(quality.levels) - 1 - quality.index}/{len(quality.levels) - 1}")
+        return " | ".join(parts) or None
 
 
 class FrameProcessor(Processor):
     """Processor for video files and live camera."""
 
-    def process_frame(self, frame: np.ndarray) -> str:
+    def process_frame(self, frame: np.ndarray) -> Optional[AsciiFrame]:
         if frame is None or frame.size == 0:
-            return ""
-
-        if len(frame.shape) != 3:
-            frame = cv2.cvtColor(frame, cv2.COLOR_GRAY2BGR)
-        elif frame.shape[2] == 4:
-            # Remove alpha channel (common in PNGs)
-            frame = cv2.cvtColor(frame, cv2.COLOR_BGRA2BGR)
-        elif frame.shape[2] != 3:
-            raise ValueError(f"Unsupported frame format: {frame.shape}")
+            return None
+
+        started = time.perf_counter()
+        # Adaptive quality may switch modes between frames
+        mode = self.mode
+        gray, color_frame = self.prepare_frame(frame, mode)
+        glyphs, colors, background = self.ascii_converter.cells(
+            gray, color_frame, self.gradient, mode, self.tone
+        )
+        self.convert_time = time.perf_counter() - started
+        return AsciiFrame(
+            glyphs,
+            colors,
+            charset_for(mode, self.gradient),
+            mode,
+            self.ascii_converter,
+            background,
+        )
 
-        if self.invert:
-            frame = cv2.bitwise_not(frame)
-        if self.mirror:
-            frame = cv2.flip(frame, 1)
+    def prepare_frame(self, frame: np.ndarray, mode: Optional[Mode] = None) -> Tuple[np.ndarray, np.ndarray]:
+        """Resize to the output grid, then normalize channels and apply mirror.
 
-        gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
-        h, w = gray.shape
+        The frame is resized once, first, so every other per-pixel step runs
+        on the small grid. Sub-cell modes get a plane with several pixels per
+        output cell.
+        """
+        if len(frame.shape) == 3 and frame.shape[2] not in (3, 4):
+            raise ValueError(f"Unsupported frame format: {frame.shape}")
 
+        h, w = frame.shape[:2]
         new_w, new_h = self.resizer.compute_size(
-            self.target_width, w, h, self.scale_factor
+            self.target_width, w, h, self.scale_factor, SUBCELL_SIZE.get(mode or self.mode, (1, 1))
         )
+        small = self.resizer.resize(frame, (new_w, new_h))
+        if self.mirror:
+            small = cv2.flip(small, 1)
 
-        gray = self.resizer.resize(gray, (new_w, new_h))
-        color_frame = self.resizer.resize(frame, (new_w, new_h))
+        if len(small.shape) != 3:
+            gray = small
+            color_frame = cv2.cvtColor(small, cv2.COLOR_GRAY2BGR)
+        else:
+            if small.shape[2] == 4:
+                # Remove alpha channel (common in PNGs)
+                small = cv2.cvtColor(small, cv2.COLOR_BGRA2BGR)
+            color_frame = small
+            gray = cv2.cvtColor(color_frame, cv2.COLOR_BGR2GRAY)
 
-        return self.ascii_converter.convert(gray, color_frame, self.gradient, self.mode)
+        return gray, color_frame
 
-    def start_processing(self, source: Union[str, int]) -> str:
+    def iter_frames(self, source: Union[str, int], realtime: bool = False) -> Iterator[AsciiFrame]:
         self._validate_source(source)
-        ascii_art: list[str] = []
+        self.paced = False
+        # Still images decode in one pass; caching them only fills the disk
+        if self.cache is None or not isinstance(source, str) or is_still_image(source):
+            return self._open_frames(source, realtime)
+
+        key = self.cache.key(source, self.cache_settings())
+        cached = self.cache.get(key, self.ascii_converter)
+        if cached is not None:
+            self.logger.debug("Frame cache hit for %s", source)
+            self.source_fps = self.cache.fps(key)
+            self.scheduler = None
+            self.paced = realtime and self.source_fps > 0
+            return self._cached_frames(cached) if self.paced else cached
+
+        frames = self._open_frames(source, realtime)
+        # Scheduled playback drops frames, so only complete runs are stored
+        writer = self.cache.writer(key, self.source_fps) if self.scheduler is None else None
+        return self._store_frames(frames, writer) if writer else frames
+
+    def _cached_frames(self, frames: Iterator[AsciiFrame]) -> Iterator[AsciiFrame]:
+        """Replay cached frames on the source clock."""
+        pacer = FPSController(self.source_fps)
+        for ascii_frame in frames:
+            pacer.wait_next_frame()
+            yield ascii_frame
+        self.logger.debug("Cached replay jitter (ms): %s", pacer.jitter_percentiles())
+
+    def _store_frames(self, frames: Iterator[AsciiFrame], writer: CacheWriter) -> Iterator[AsciiFrame]:
+        """Pass frames through while saving them to the cache."""
+        completed = False
+        try:
+            for ascii_frame in frames:
+                writer.write(ascii_frame)
+                yield ascii_frame
+            completed = True
+        finally:
+            if completed:
+                writer.commit()
+            else:
+                writer.abort()
+            close = getattr(frames, "close", None)
+            if close is not None:
+                close()
+
+    def _open_frames(self, source: Union[str, int], realtime: bool) -> Iterator[AsciiFrame]:
+        # Still images: one reduced-resolution decode, no capture loop
+        if isinstance(source, str) and is_still_image(source):
+            image = self.load_image(source)
+            if image is not None:
+                self.source_fps = 0.0
+                self.scheduler = None
+                return self._still_frames(image)
 
         cap = cv2.VideoCapture(source)
         if not cap.isOpened():
             raise RuntimeError(f"{COLORS.RED.value}Failed to open video/camera source")
 
-        # Get native video FPS; if unavailable don't throttle
-        video_fps = cap.get(cv2.CAP_PROP_FPS) or 0.0
-        
-        # FPS controller for throttling and smoothing
-        fps_ctrl = FPSController(video_fps)
-        try:
-            frame_count = 0
-            while True:
-
-                ret, frame = cap.read()
-                if not ret:
-                    if source == 0: # Camera
-                        # For the camera: continue (live), but add small sleep to avoid saturation
-                        time.sleep(0.001)  # Avoid CPU to 100% in live
-                        continue
-                    else:
-                        break  # End of video/image sequence
-                    
-                # Delta time since last frame
-                dt = fps_ctrl.begin_frame()
-
-                ascii_art.append(self.process_frame(frame))
-                ascii_art_str = ascii_art[-1]
-
-                if fps_ctrl.should_render(dt):
-                    # Read next frame
-
-                    clear_console()
-                    # Use logger to output rendered ASCII frame (keeps centralized formatting)
-                    if ascii_art_str:
-                        print(ascii_art_str)
-                    else:
-                        self.logger.warning("Empty frame received.")
-
-                    # Throttle and update smoothed FPS via FPSController
-                    smoothed = fps_ctrl.get_smoothed_fps()
-                    if smoothed is not None:
-                        print(f"{COLORS.CYAN.value}FPS: {smoothed:.1f}")
-
-                    print(f"{COLORS.YELLOW.value}Press 'Ctrl' + 'C' to exit...")
-
-                if frame_count == 0:
-                    clear_console()
-                    print(ascii_art_str or "Processing...")  # Initial frame output
+        # Native video FPS; 0 when unavailable
+        self.source_fps = cap.get(cv2.CAP_PROP_FPS) or 0.0
 
-                frame_count += 1
-
-
-        except KeyboardInterrupt:
-            self.logger.debug("Processing interrupted by user.")
+        # Cameras are always live; files need a known frame rate to be scheduled
+        self.scheduler = None
+        if realtime and isinstance(source, str) and self.source_fps > 0:
+            self.scheduler = FrameScheduler(self.source_fps)
+            self.paced = True
 
+        # Exports of video files can be split across processes
+        if self.jobs > 1 and not realtime and isinstance(source, str) and frame_count(source) > 1:
+            cap.release()
+            return iter_segment_frames(self, source, self.jobs)
+        return self._frames(cap, source)
+
+    def load_image(self, path: str) -> Optional[np.ndarray]:
+        """Decode a still image at the smallest resolution the output grid needs."""
+        factor = 1
+        size = image_size(path)
+        if size is not None:
+            needed = self.resizer.compute_size(
+                self.target_width, size[0], size[1], self.scale_factor,
+                SUBCELL_SIZE.get(self.mode, (1, 1)),
+            )
+            factor = reduction_factor(size, needed)
+        self.logger.debug("Decoding %s at 1/%d resolution", path, factor)
+        return read_image(path, factor)
+
+    def _still_frames(self, image: np.ndarray) -> Iterator[AsciiFrame]:
+        ascii_frame = self.process_frame(image)
+        if ascii_frame is None:
+            self.logger.warning("Empty frame received.")
+            return
+        ascii_frame.timestamp = 0.0
+        yield ascii_frame
+
+    def _timed_reader(self, cap: cv2.VideoCapture, source: Union[str, int]) -> FrameReader:
+        """Reader returning (ok, (frame, timestamp)): source time for files, capture time for cameras."""
+        scheduler = self.scheduler
+        interval = 1.0 / self.source_fps if self.source_fps > 0 else 0.0
+        index = 0
+
+        def read() -> Tuple[bool, Optional[TimedFrame]]:
+            nonlocal index
+            ok, frame = scheduler.read(cap) if scheduler else cap.read()
+            if not ok:
+                return False, None
+            if scheduler is not None:
+                timestamp = scheduler.timestamp
+            elif isinstance(source, str):
+                timestamp = source_time(cap, index, interval)
+            else:
+                timestamp = time.perf_counter()
+            index += 1
+            return True, (frame, timestamp)
+
+        return read
+
+    def _process_timed(self, item: TimedFrame) -> Optional[AsciiFrame]:
+        frame, timestamp = item
+        ascii_frame = self.process_frame(frame)
+        if ascii_frame is not None:
+            ascii_frame.timestamp = timestamp
+        return ascii_frame
+
+    def _frames(self, cap: cv2.VideoCapture, source: Union[str, int]) -> Iterator[AsciiFrame]:
+        scheduler = self.scheduler
+        read = self._timed_reader(cap, source)
+        try:
+            if self.pipeline_workers > 0:
+                yield from self._pipeline_frames(read, source)
+            else:
+                yield from self._serial_frames(read, source)
         finally:
             # Release video capture resources
             cap.release()
-
-        return "\n\n".join(ascii_art)
\ No newline at end of file
+            if scheduler is not None:
+                stats = scheduler.stats
+                self.logger.debug(
+                    "Playback finished: %d shown, %d dropped, %d late, max lag %.1f ms",
+                    stats.shown,
+                    stats.dropped,
+                    stats.late,
+                    stats.max_lag * 1000,
+                )
+                self.logger.debug("Playback jitter (ms): %s", scheduler.fps_ctrl.jitter_percentiles())
+
+    def _serial_frames(self, read: FrameReader, source: Union[str, int]) -> Iterator[AsciiFrame]:
+        """Read and convert one frame at a time."""
+        backoff = Backoff()
+        while True:
+
+            ret, item = read()
+            if not ret:
+                if source == 0: # Camera
+                    # For the camera: keep trying (live), backing off so an idle camera doesn't spin
+                    backoff.wait()
+                    continue
+                else:
+                    break  # End of video/image sequence
+            backoff.reset()
+
+            ascii_frame = self._process_timed(item)
+            if ascii_frame is None:
+                self.logger.warning("Empty frame received.")
+                continue
+            yield ascii_frame
+
+    def _pipeline_frames(self, read: FrameReader, source: Union[str, int]) -> Iterator[AsciiFrame]:
+        """Overlap capture and conversion using bounded queues."""
+        self.pipeline = FramePipeline(
+            read=read,
+            convert=self._process_timed,
+            workers=self.pipeline_workers,
+            queue_size=max(2, self.pipeline_workers * 2),
+            retry_on_fail=(source == 0),
+        )
+        try:
+            for ascii_frame in self.pipeline.results():
+                if ascii_frame is None:
+                    self.logger.warning("Empty frame received.")
+                    continue
+                yield ascii_frame
+        finally:
+            stats = self.pipeline.stats
+            self.logger.debug(
+                "Pipeline finished: %d captured, %d rendered, max queue depth in=%d out=%d",
+                stats.captured,
+                stats.rendered,
+                stats.max_input_depth,
+                stats.max_output_depth,
+            )
+            self.pipeline = None
@@ -0,0 +1,154 @@
+"""Adaptive quality: hold a target frame rate by trading output quality.
+
+Live previews measure how long each frame takes to convert and write. When
+that cost stays above the frame budget, quality is stepped down one level:
+first a cheaper resize interpolation, then fewer colours
+(RGB → ANSI256 → ANSI16), then a narrower grid. When the cost stays well
+under the budget, it is stepped back up.
+
+The thresholds are apart (hysteresis) and stepping up needs a longer quiet
+period than stepping down. An upgrade that is undone right away doubles the
+wait before the next one, so the quality settles instead of oscillating.
+"""
+
+from dataclasses import dataclass, replace
+from typing import List, Optional
+
+import cv2
+
+from ..log import get_logger
+from ..settings import Mode
+from .resizer import INTERPOLATION
+
+logger = get_logger(__name__)
+
+# Cheaper interpolations, tried in order
+INTERPOLATION_STEPS = (cv2.INTER_LINEAR, cv2.INTER_NEAREST)
+# Fewer colours per mode
+COLOR_STEPS = {
+    Mode.RGB: (Mode.ANSI256, Mode.ANSI16),
+    Mode.ANSI256: (Mode.ANSI16,),
+}
+# Fractions of the configured width
+WIDTH_STEPS = (0.85, 0.7, 0.55, 0.4)
+MIN_WIDTH = 20
+
+
+@dataclass(frozen=True)
+class QualityLevel:
+    """Settings applied at one step of the ladder."""
+
+    width: int
+    mode: Mode
+    interpolation: int
+
+    def describe(self) -> str:
+        try:
+            interpolation = INTERPOLATION(self.interpolation).name
+        except ValueError:
+            interpolation = str(self.interpolation)
+        return f"width={self.width} mode={self.mode.name} interpolation={interpolation}"
+
+
+def quality_levels(width: int, mode: Mode, interpolation: int) -> List[QualityLevel]:
+    """Quality ladder from the configured settings (first) to the cheapest."""
+    levels = [QualityLevel(int(width), mode, interpolation)]
+
+    for step in INTERPOLATION_STEPS:
+        if interpolation != cv2.INTER_NEAREST and step != levels[-1].interpolation:
+            levels.append(replace(levels[-1], interpolation=step))
+    for step in COLOR_STEPS.get(mode, ()):
+        levels.append(replace(levels[-1], mode=step))
+    for fraction in WIDTH_STEPS:
+        step = max(MIN_WIDTH, int(width * fraction))
+        if step < levels[-1].width:
+            levels.append(replace(levels[-1], width=step))
+    return levels
+
+
+class QualityController:
+    """
+    Steps through `quality_levels` to keep the per-frame cost within
+    `1 / target_fps`.
+
+    - `down_ratio`: cost / budget above which quality drops.
+    - `up_ratio`: cost / budget below which quality rises.
+    - `down_after` / `up_after`: consecutive frames past a threshold
+      before acting.
+    """
+
+    def __init__(
+        self,
+        target_fps: float,
+        levels: List[QualityLevel],
+        smoothing_alpha: float = 0.2,
+        down_ratio: float = 0.95,
+        up_ratio: float = 0.6,
+        down_after: int = 8,
+        up_after: int = 48,
+        max_up_after: int = 768,
+    ):
+        if target_fps <= 0:
+            raise ValueError("Adaptive quality needs a positive target FPS")
+        self.budget = 1.0 / target_fps
+        self.levels = levels
+        self.index = 0
+        self.alpha = smoothing_alpha
+        self.down_ratio = down_ratio
+        self.up_ratio = up_ratio
+        self.down_after = down_after
+        self.base_up_after = up_after
+        self.up_after = up_after
+        self.max_up_after = max_up_after
+        self.changes = 0
+
+        self.cost: Optional[float] = None
+        self._over = 0
+        self._under = 0
+        self._last_raised = False
+
+    @property
+    def level(self) -> QualityLevel:
+        return self.levels[self.index]
+
+    def update(self, seconds: float) -> Optional[QualityLevel]:
+        """Record the cost of one frame; returns the new level when it changes."""
+        if self.cost is None:
+            self.cost = seconds
+        else:
+            self.cost = self.alpha * seconds + (1 - self.alpha) * self.cost
+
+        load = self.cost / self.budget
+        self._over = self._over + 1 if load > self.down_ratio else 0
+        self._under = self._under + 1 if load < self.up_ratio else 0
+
+        if self._over >= self.down_after and self.index + 1 < len(self.levels):
+            if self._last_raised:
+                # The last upgrade didn't hold: wait longer before the next one
+                self.up_after = min(self.up_after * 2, self.max_up_after)
+            return self._step(+1, load)
+        if self._under >= self.up_after and self.index > 0:
+            return self._step(-1, load)
+        return None
+
+    def _step(self, direction: int, load: float) -> QualityLevel:
+        self.index += direction
+        self.changes += 1
+        raised = direction < 0
+        if raised and self._last_raised:
+            # Two upgrades in a row: the load went down for good
+            self.up_after = self.base_up_after
+        self._last_raised = raised
+        # Start measuring the new level from scratch
+        self.cost = None
+        self._over = self._under = 0
+        logger.info(
+            "Quality %s to level %d/%d (%s), frame cost %.0f%% of the %.1f ms budget",
+            "lowered" if direction > 0 else "raised",
+            self.index,
+            len(self.levels) - 1,
+            self.level.describe(),
+            load * 100,
+            self.budget * 1000,
+        )
+        return self.level
@@ -0,0 +1,149 @@
+from functools import lru_cache
+from typing import Optional
+
+import numpy as np
+
+from .converter import Converter, ByteTable, assemble, byte_table, gather
+from .frame import AsciiFrame
+from ..settings import Mode
+from ..log import get_logger
+
+# Cursor home, and clear from the cursor to the end of the screen
+CURSOR_HOME = "\033[H"
+CLEAR_BELOW = "\033[J"
+CLEAR_SCREEN = "\033[2J"
+
+
+@lru_cache(maxsize=8)
+def row_table(rows: int) -> ByteTable:
+    """Byte table with the start of a cursor move ("\\033[ROW;") for each row."""
+    return byte_table([f"\033[{y + 1};" for y in range(rows)])
+
+
+@lru_cache(maxsize=8)
+def column_table(columns: int) -> ByteTable:
+    """Byte table with the end of a cursor move ("COLH") for each column."""
+    return byte_table([f"{x + 1}H" for x in range(columns)])
+
+
+class DiffRenderer:
+    """Responsibility: turn cell grids into terminal output, redrawing only what changed.
+
+    Keeps the glyphs and colours of the previous frame. Each new frame is
+    compared against them and only the runs of changed cells are written,
+    each one preceded by a cursor-positioning sequence. Every
+    `keyframe_interval` frames (and whenever the grid size or mode changes) the whole
+    frame is redrawn to recover from anything else that wrote to the terminal.
+    """
+
+    def __init__(self, converter: Optional[Converter] = None, keyframe_interval: int = 120):
+        self.logger = get_logger(__name__)
+        self.converter = converter or Converter()
+        self.keyframe_interval = max(1, int(keyframe_interval))
+
+        self._glyphs: Optional[np.ndarray] = None
+        self._colors: Optional[np.ndarray] = None
+        self._background: Optional[np.ndarray] = None
+        self._style: Optional[tuple] = None
+        self._frames_since_keyframe = 0
+
+    def reset(self) -> None:
+        """Forget the previous frame so the next render is a full redraw."""
+        self._glyphs = None
+        self._colors = None
+        self._background = None
+        self._style = None
+        self._frames_since_keyframe = 0
+
+    def render_frame(self, frame: AsciiFrame) -> str:
+        """Render an AsciiFrame (see `render`)."""
+        return self.render(frame.glyphs, frame.colors, frame.charset, frame.mode, frame.background)
+
+    def render(
+        self,
+        glyphs: np.ndarray,
+        colors: Optional[np.ndarray],
+        charset: str,
+        mode: Mode,
+        background: Optional[np.ndarray] = None,
+    ) -> str:
+        """
+        Return the terminal output that brings the screen up to date.
+
+        The cursor is left at the start of the line below the frame, so
+        status lines can be written right after it.
+        """
+        h = glyphs.shape[0]
+        previous = self._glyphs
+
+        # Cell values mean something else after a mode or charset change
+        style = (mode, charset)
+        if style != self._style or self._needs_keyframe(glyphs, colors, background):
+            # Clear the whole screen only when the layout changed
+            prefix = CLEAR_SCREEN if previous is not None and previous.shape != glyphs.shape else ""
+            text = self.converter.encode(glyphs, colors, charset, mode, background)
+            body = prefix + CURSOR_HOME + text + CLEAR_BELOW
+            self._frames_since_keyframe = 0
+        else:
+            body = self._render_changes(glyphs, colors, charset, mode, background)
+            self._frames_since_keyframe += 1
+
+        self._style = style
+        self._glyphs = glyphs.copy()
+        self._colors = None if colors is None else colors.copy()
+        self._background = None if background is None else background.copy()
+        return f"{body}\033[{h + 1};1H"
+
+    def _needs_keyframe(
+        self,
+        glyphs: np.ndarray,
+        colors: Optional[np.ndarray],
+        background: Optional[np.ndarray],
+    ) -> bool:
+        for old, new in ((self._glyphs, glyphs), (self._colors, colors), (self._background, background)):
+            if (old is None) != (new is None) or (new is not None and old.shape != new.shape):
+                return True
+        return self._frames_since_keyframe + 1 >= self.keyframe_interval
+
+    def _render_changes(
+        self,
+        glyphs: np.ndarray,
+        colors: Optional[np.ndarray],
+        charset: str,
+        mode: Mode,
+        background: Optional[np.ndarray],
+    ) -> str:
+        """Write only the runs of cells whose glyph or colour changed."""
+        changed = glyphs != self._glyphs
+        for old, new in ((self._colors, colors), (self._background, background)):
+            if new is not None:
+                diff = new != old
+                changed |= diff.any(axis=2) if diff.ndim == 3 else diff
+
+        if not changed.any():
+            return ""
+
+        h, w = glyphs.shape
+        starts = changed.copy()
+        starts[:, 1:] &= ~changed[:, :-1]
+        ends = changed.copy()
+        ends[:, :-1] &= ~changed[:, 1:]
+
+        sgr = resets = None
+        if colors is not None:
+            if self.converter.coalesce:
+                sgr = changed & (starts | self.converter.color_runs(colors, mode, background))
+                resets = ends
+            else:
+                sgr = resets = changed
+
+        rows = np.broadcast_to(np.arange(h)[:, None], (h, w))
+        columns = np.broadcast_to(np.arange(w)[None, :], (h, w))
+        parts = [
+            gather(row_table(h), rows, starts),
+            gather(column_table(w), columns, starts),
+            *self.converter.cell_parts(
+                glyphs, colors, charset, mode, changed, sgr, resets, background
+            ),
+        ]
+        return assemble(parts, (h, w), newline=False)
@@ -1,11 +1,12 @@
-from typing import Tuple
+from typing import Dict, Optional, Tuple
 from enum import Enum
+import time
 
 import cv2
 
 from ..log import get_logger
 from .frames_utils import scale_height
-from ..utils import get_terminal_size
+from ..utils import get_terminal_size, terminal_resize_count, watch_terminal_resize
 
 # ============================================================
 #                  INTERPOLATION ENUM & HELPERS
@@ -29,16 +30,68 @@ class Resizer:
     focused on higher-level concerns (SRP, Open/Closed).
     """
 
-    def __init__(self, interpolation: str = "AREA"):
+    # Without SIGWINCH, re-read the terminal width at most this often (seconds)
+    POLL_INTERVAL = 0.5
+
+    def __init__(self, interpolation: str = "AREA", fit_terminal: bool = True):
         self.logger = get_logger(__name__)
         self.interpolation = self.get_interpolation_method(interpolation)
+        # False for output that isn't shown on this terminal (e.g. network clients)
+        self.fit_terminal = fit_terminal
+
+        # Target sizes per source resolution, valid for the current terminal width
+        self._sizes: Dict[tuple, Tuple[int, int]] = {}
+        self._columns: Optional[int] = None
+        self._resize_seen = -1
+        self._checked_at = 0.0
+        self._watching = watch_terminal_resize()
+
+    def _terminal_columns(self) -> int:
+        """Terminal width, only re-read after a resize (or periodically without SIGWINCH)."""
+        now = time.perf_counter()
+        if self._watching:
+            stale = terminal_resize_count() != self._resize_seen
+        else:
+            stale = now - self._checked_at >= self.POLL_INTERVAL
+
+        if stale or self._columns is None:
+            self._resize_seen = terminal_resize_count()
+            self._checked_at = now
+            columns = get_terminal_size()[0]
+            if columns != self._columns:
+                self._columns = columns
+                self._sizes.clear()
+        return self._columns
 
     def compute_size(
-        self, target_width: int, orig_w: int, orig_h: int, scale_factor: float
+        self,
+        target_width: int,
+        orig_w: int,
+        orig_h: int,
+        scale_factor: float,
+        subcell: Tuple[int, int] = (1, 1),
     ) -> Tuple[int, int]:
-        new_w = min(int(target_width), get_terminal_size()[0])
-        new_h = scale_height(new_w, orig_w, orig_h, float(scale_factor))
-        return new_w, new_h
+        """
+        Pixel size to resize to. The cell grid is `target_width` columns
+        (capped to the terminal) by the aspect-corrected number of rows;
+        `subcell` is how many pixels each cell packs as (columns, rows).
+
+        Sizes are cached per source resolution until the terminal is resized.
+        """
+        key = (int(target_width), orig_w, orig_h, float(scale_factor), subcell)
+        self._terminal_columns()
+        size = self._sizes.get(key)
+        if size is None:
+            new_w = self.effective_width(target_width)
+            new_h = scale_height(new_w, orig_w, orig_h, float(scale_factor))
+            size = self._sizes[key] = (new_w * subcell[0], new_h * subcell[1])
+        return size
+
+    def effective_width(self, target_width: int) -> int:
+        """Output columns: `target_width` capped to the terminal width."""
+        if not self.fit_terminal:
+            return int(target_width)
+        return min(int(target_width), self._terminal_columns())
 
     def resize(self, image, size: Tuple[int, int]):
         return cv2.resize(image, (size[0], size[1]), interpolation=self.interpolation)
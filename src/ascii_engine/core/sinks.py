@@ -0,0 +1,119 @@
+"""Frame sinks: consumers that receive converted frames as they are produced.
+
+`Processor.run` streams every frame to a list of sinks, so nothing has to
+keep the whole video in memory. Terminal output lives here; file exporters
+(text, images, video) are in `media.sinks`.
+"""
+
+from abc import ABC, abstractmethod
+from typing import Callable, List, Optional
+
+from .frame import AsciiFrame
+from .renderer import CLEAR_SCREEN, CURSOR_HOME, DiffRenderer
+from .terminal import TerminalWriter
+from .time_manager import FPSController
+from ..utils import COLORS
+
+
+class FrameSink(ABC):
+    """Consumes frames one at a time, in order.
+
+    Sinks with `realtime = True` only show the current frame, so frames that
+    arrive too late for them may be skipped before they are converted.
+    """
+
+    realtime: bool = False
+
+    def open(self, source_fps: float, paced: bool = False) -> None:
+        """
+        Called once before the first frame.
+
+        `source_fps` is the source frame rate (0 if unknown); `paced` is True
+        when frames already arrive on the source clock.
+        """
+
+    @abstractmethod
+    def write(self, frame: AsciiFrame) -> None:
+        """Consume one frame."""
+
+    def close(self) -> None:
+        """Called once after the last frame, also when processing is interrupted."""
+
+    def __enter__(self) -> "FrameSink":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+class TerminalSink(FrameSink):
+    """Live preview: redraws changed cells, throttled to the source frame rate.
+
+    - `status`: optional callable returning an extra status line (or None).
+    - `writer`: terminal writer; each frame goes out as one synchronized write
+      from its output thread.
+    """
+
+    realtime = True
+
+    def __init__(
+        self,
+        renderer: Optional[DiffRenderer] = None,
+        status: Optional[Callable[[], Optional[str]]] = None,
+        writer: Optional[TerminalWriter] = None,
+    ):
+        self.renderer = renderer or DiffRenderer()
+        self.status = status
+        self.writer = writer or TerminalWriter()
+        self.fps_ctrl = FPSController()
+        self.frame_count = 0
+
+    def open(self, source_fps: float, paced: bool = False) -> None:
+        # Don't throttle paced frames or when the source frame rate is unknown
+        self.fps_ctrl = FPSController(None if paced else (source_fps or None))
+        self.frame_count = 0
+
+        # Start from a clean screen, then only redraw what changes
+        self.renderer.reset()
+        self.writer.submit(CLEAR_SCREEN + CURSOR_HOME)
+
+    def write(self, frame: AsciiFrame) -> None:
+        # Delta time since last frame
+        dt = self.fps_ctrl.begin_frame()
+
+        # Always show the first frame, then follow the FPS controller
+        if self.fps_ctrl.should_render(dt) or self.frame_count == 0:
+            self._display(frame)
+        self.frame_count += 1
+
+    def _display(self, frame: AsciiFrame) -> None:
+        """Write the frame changes plus the status lines to the terminal."""
+        # Terminal behind: drop the queued deltas and send one full redraw instead
+        congested = self.writer.congested
+        if congested:
+            self.renderer.reset()
+        output = self.renderer.render_frame(frame)
+
+        smoothed = self.fps_ctrl.get_smoothed_fps()
+        if smoothed is not None:
+            output += f"{COLORS.CYAN.value}FPS: {smoothed:.1f}\033[K\n"
+
+        status = self.status() if self.status else None
+        if status:
+            output += f"{COLORS.CYAN.value}{status}\033[K\n"
+
+        output += f"{COLORS.YELLOW.value}Press 'Ctrl' + 'C' to exit...\033[K{COLORS.RESET.value}\n"
+        self.writer.submit(output, replace=congested)
+
+    def close(self) -> None:
+        self.writer.close()
+
+
+class ListSink(FrameSink):
+    """Collects every frame in memory (what `start_processing` returns)."""
+
+    def __init__(self):
+        self.frames: List[AsciiFrame] = []
+
+    def write(self, frame: AsciiFrame) -> None:
+        self.frames.append(frame)
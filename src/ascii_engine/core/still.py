@@ -0,0 +1,65 @@
+"""Still-image decoding at reduced resolution.
+
+Output grids are only a few hundred pixels wide, so large photos don't need
+a full decode. The image size is read from the file header (Pillow only
+parses the header on open) and OpenCV's reduced decoders are used when the
+image is at least twice as large as needed. For JPEGs the scaling happens
+inside the DCT, so decoding is several times faster and uses a fraction of
+the memory.
+"""
+
+import os
+from typing import Optional, Tuple
+
+import cv2
+import numpy as np
+from PIL import Image
+
+from ..log import get_logger
+
+logger = get_logger(__name__)
+
+# Formats decoded with cv2.imread; animated formats (GIF) stay on VideoCapture
+IMAGE_EXTENSIONS = {".png", ".jpg", ".jpeg", ".bmp", ".webp", ".tif", ".tiff"}
+
+# Reduction factor → imread flag
+REDUCED_FLAGS = {
+    8: cv2.IMREAD_REDUCED_COLOR_8,
+    4: cv2.IMREAD_REDUCED_COLOR_4,
+    2: cv2.IMREAD_REDUCED_COLOR_2,
+    1: cv2.IMREAD_COLOR,
+}
+
+
+def is_still_image(path: str) -> bool:
+    """True for file types handled by the still-image path."""
+    return os.path.splitext(path)[1].lower() in IMAGE_EXTENSIONS
+
+
+def image_size(path: str) -> Optional[Tuple[int, int]]:
+    """(width, height) read from the file header, None if unreadable."""
+    try:
+        with Image.open(path) as img:
+            return img.size
+    except Exception:
+        return None
+
+
+def reduction_factor(size: Tuple[int, int], needed: Tuple[int, int]) -> int:
+    """Largest decode reduction keeping the image at least twice the `needed` size."""
+    w, h = size
+    need_w, need_h = needed
+    for factor in (8, 4, 2):
+        if w // factor >= 2 * need_w and h // factor >= 2 * need_h:
+            return factor
+    return 1
+
+
+def read_image(path: str, factor: int = 1) -> Optional[np.ndarray]:
+    """Decode `path` as BGR, downscaled by `factor` (1, 2, 4 or 8) while decoding."""
+    # imdecode also handles non-ASCII paths on Windows
+    data = np.fromfile(path, dtype=np.uint8)
+    image = cv2.imdecode(data, REDUCED_FLAGS.get(factor, cv2.IMREAD_COLOR))
+    if image is None:
+        logger.warning("Failed to decode image: %s", path)
+    return image
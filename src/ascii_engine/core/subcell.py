@@ -0,0 +1,115 @@
+"""Sub-cell renderers: pack several pixels into each terminal cell.
+
+- HALFBLOCK: 1×2 pixels per cell, drawn as "▀" with the top pixel as the
+  foreground colour and the bottom pixel as the background colour.
+- QUADRANT: 2×2 pixels per cell, split into a bright and a dark group; the
+  glyph is the quadrant block matching the bright pixels, coloured with the
+  mean of each group.
+- BRAILLE: 2×4 pixels per cell, one Braille dot per pixel brighter than the
+  frame mean, coloured with the mean of the lit pixels.
+
+All renderers work on whole arrays: the resized planes are reshaped into
+(rows, py, cols, px) blocks and reduced per cell.
+"""
+
+from typing import Optional, Tuple
+
+import numpy as np
+
+from ..settings import Mode
+
+# Pixels per cell as (columns, rows)
+SUBCELL_SIZE: dict[Mode, Tuple[int, int]] = {
+    Mode.HALFBLOCK: (1, 2),
+    Mode.QUADRANT: (2, 2),
+    Mode.BRAILLE: (2, 4),
+}
+
+# Quadrant glyphs indexed by bits: top-left=1, top-right=2, bottom-left=4, bottom-right=8
+QUADRANT_CHARS = " ▘▝▀▖▌▞▛▗▚▐▜▄▙▟█"
+
+# Braille patterns U+2800–U+28FF, indexed by their dot bits
+BRAILLE_CHARS = "".join(chr(0x2800 + bits) for bits in range(256))
+
+SUBCELL_CHARSET: dict[Mode, str] = {
+    Mode.HALFBLOCK: "▀",
+    Mode.QUADRANT: QUADRANT_CHARS,
+    Mode.BRAILLE: BRAILLE_CHARS,
+}
+
+_QUADRANT_BITS = np.array([[1, 2], [4, 8]], dtype=np.uint8)[None, :, None, :]
+_BRAILLE_BITS = np.array(
+    [[0x01, 0x08], [0x02, 0x10], [0x04, 0x20], [0x40, 0x80]], dtype=np.uint8
+)[None, :, None, :]
+
+SubcellPlanes = Tuple[np.ndarray, np.ndarray, Optional[np.ndarray]]
+
+
+def _blocks(plane: np.ndarray, px: int, py: int) -> np.ndarray:
+    """Reshape an image into (rows, py, cols, px[, channels]) cell blocks."""
+    rows, cols = plane.shape[0] // py, plane.shape[1] // px
+    plane = plane[: rows * py, : cols * px]
+    return plane.reshape((rows, py, cols, px) + plane.shape[2:])
+
+
+def _masked_mean(colors: np.ndarray, mask: np.ndarray, fallback: np.ndarray) -> np.ndarray:
+    """Mean colour of the pixels selected by `mask` in each cell block."""
+    weights = mask[..., None].astype(np.uint16)
+    total = (colors.astype(np.uint16) * weights).sum(axis=(1, 3))
+    count = weights.sum(axis=(1, 3))
+    mean = total // np.maximum(count, 1)
+    return np.where(count > 0, mean, fallback).astype(np.uint8)
+
+
+def halfblock_cells(gray: np.ndarray, color_frame: np.ndarray) -> SubcellPlanes:
+    """1×2 pixels per cell: "▀" with top pixel as foreground, bottom as background."""
+    rows = color_frame.shape[0] // 2
+    top = np.ascontiguousarray(color_frame[0 : rows * 2 : 2])
+    bottom = np.ascontiguousarray(color_frame[1 : rows * 2 : 2])
+    glyphs = np.zeros(top.shape[:2], dtype=np.uint8)
+    return glyphs, top, bottom
+
+
+def quadrant_cells(gray: np.ndarray, color_frame: np.ndarray) -> SubcellPlanes:
+    """2×2 pixels per cell: quadrant block of the pixels brighter than the cell mean."""
+    g = _blocks(gray, 2, 2)
+    c = _blocks(color_frame, 2, 2)
+    mean = g.mean(axis=(1, 3), keepdims=True)
+    lit = g > mean
+
+    glyphs = (lit * _QUADRANT_BITS).sum(axis=(1, 3), dtype=np.uint8)
+    average = c.mean(axis=(1, 3)).astype(np.uint8)
+    fg = _masked_mean(c, lit, average)
+    bg = _masked_mean(c, ~lit, average)
+    return glyphs, fg, bg
+
+
+def braille_cells(gray: np.ndarray, color_frame: np.ndarray) -> SubcellPlanes:
+    """2×4 pixels per cell: one Braille dot per pixel brighter than the frame mean."""
+    g = _blocks(gray, 2, 4)
+    c = _blocks(color_frame, 2, 4)
+    lit = g > gray.mean()
+
+    glyphs = (lit * _BRAILLE_BITS).sum(axis=(1, 3), dtype=np.uint8)
+    average = c.mean(axis=(1, 3)).astype(np.uint8)
+    fg = _masked_mean(c, lit, average)
+    return glyphs, fg, None
+
+
+_RENDERERS = {
+    Mode.HALFBLOCK: halfblock_cells,
+    Mode.QUADRANT: quadrant_cells,
+    Mode.BRAILLE: braille_cells,
+}
+
+
+def subcell_cells(gray: np.ndarray, color_frame: Optional[np.ndarray], mode: Mode) -> SubcellPlanes:
+    """
+    Convert pixel-resolution planes into glyph, foreground and background planes.
+
+    `gray` and `color_frame` must be SUBCELL_SIZE[mode] times larger than the
+    cell grid. Returns (glyphs, fg BGR, bg BGR or None).
+    """
+    if color_frame is None:
+        color_frame = np.repeat(gray[..., None], 3, axis=2)
+    return _RENDERERS[mode](gray, color_frame)
@@ -0,0 +1,163 @@
+"""Buffered terminal output from a dedicated writer thread.
+
+A frame is encoded to bytes once, wrapped in synchronized-output mode
+(DEC 2026: the terminal shows it only when complete, so it never tears) and
+handed to a background thread that writes it with a single `os.write`.
+Conversion of the next frame continues while the current one is written.
+
+Output is double buffered: the thread writes the front buffer while new
+frames are appended to the back buffer. When the terminal falls behind,
+the pending deltas can be replaced by one full redraw (`replace=True`), so
+the backlog never grows beyond a frame.
+"""
+
+import os
+import sys
+import threading
+from typing import Optional, TextIO
+
+from ..log import get_logger
+
+logger = get_logger(__name__)
+
+SYNC_BEGIN = b"\033[?2026h"
+SYNC_END = b"\033[?2026l"
+
+
+class TerminalWriter:
+    """
+    Writes whole frames to `stream` (stdout by default) from a background thread.
+
+    - `synchronized`: wrap every frame in DEC 2026 begin/end markers
+      (terminals without support ignore them).
+    - `max_pending`: bytes waiting in the back buffer above which the writer
+      counts as congested.
+    """
+
+    def __init__(
+        self,
+        stream: Optional[TextIO] = None,
+        synchronized: bool = True,
+        max_pending: int = 1 << 20,
+    ):
+        self.stream = stream or sys.stdout
+        self.synchronized = synchronized
+        self.max_pending = max_pending
+        self.fd = self._fileno(self.stream)
+
+        self.frames = 0
+        self.replaced = 0
+        self.writes = 0
+        self.bytes_written = 0
+
+        self._back = bytearray()
+        self._busy = False
+        self._closed = False
+        self._cond = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+
+    @staticmethod
+    def _fileno(stream: TextIO) -> Optional[int]:
+        """Descriptor for raw writes; None to go through the stream object."""
+        # On Windows colorama may wrap stdout to translate ANSI codes
+        if os.name == "nt":
+            return None
+        try:
+            return stream.fileno()
+        except (AttributeError, OSError, ValueError):
+            return None
+
+    @property
+    def pending_bytes(self) -> int:
+        return len(self._back)
+
+    @property
+    def congested(self) -> bool:
+        """True when the terminal is not keeping up with the submitted frames."""
+        return len(self._back) > self.max_pending
+
+    def start(self) -> None:
+        """Start the writer thread (done automatically by the first `submit`)."""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        # Text already buffered by print() must come out before our raw writes
+        self.stream.flush()
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, name="terminal-writer", daemon=True)
+        self._thread.start()
+
+    def submit(self, text: str, replace: bool = False) -> None:
+        """
+        Queue one frame for output.
+
+        With `replace`, frames not written yet are discarded; only use it when
+        `text` redraws the whole screen.
+        """
+        data = text.encode("utf-8", errors="replace")
+        if self.synchronized:
+            data = SYNC_BEGIN + data + SYNC_END
+
+        self.start()
+        with self._cond:
+            if replace and self._back:
+                self._back.clear()
+                self.replaced += 1
+            self._back += data
+            self.frames += 1
+            self._cond.notify()
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                while not self._back and not self._closed:
+                    self._cond.wait()
+                if not self._back:
+                    return
+                # Swap buffers: the back buffer becomes the one being written
+                front, self._back = self._back, bytearray()
+                self._busy = True
+            try:
+                self._write(front)
+            except Exception as exc:
+                logger.error("Terminal write failed: %s", exc)
+            finally:
+                with self._cond:
+                    self._busy = False
+                    self._cond.notify_all()
+
+    def _write(self, data: bytearray) -> None:
+        self.writes += 1
+        self.bytes_written += len(data)
+        if self.fd is None:
+            self.stream.write(data.decode("utf-8"))
+            self.stream.flush()
+            return
+
+        view = memoryview(data)
+        while view:
+            # os.write may write less than asked (e.g. a full pipe)
+            written = os.write(self.fd, view)
+            view = view[written:]
+
+    def flush(self) -> None:
+        """Block until every submitted frame has been written."""
+        with self._cond:
+            self._cond.wait_for(lambda: not self._back and not self._busy)
+
+    def close(self) -> None:
+        """Write the remaining frames and stop the thread."""
+        if self._thread is None:
+            return
+        self.flush()
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+        self._thread.join()
+        self._thread = None
+        logger.debug(
+            "Terminal writer: %d frames, %d writes, %d bytes, %d backlogs replaced",
+            self.frames,
+            self.writes,
+            self.bytes_written,
+            self.replaced,
+        )
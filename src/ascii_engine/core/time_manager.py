@@ -1,12 +1,75 @@
 import time
-from typing import Optional
+from collections import deque
+from dataclasses import dataclass
+from typing import Deque, Dict, Optional, Sequence, Tuple
+
+import cv2
+import numpy as np
+
+# Wake up this long before a deadline and spin for the rest (seconds).
+# OS sleeps overshoot by up to a scheduler tick, spinning doesn't.
+SPIN_THRESHOLD = 0.002
+
+
+def sleep_until(deadline: float, spin: float = SPIN_THRESHOLD) -> float:
+    """
+    Hybrid wait for a `time.perf_counter()` deadline: sleep until `spin`
+    seconds before it, then busy-wait. Returns how late we woke up (seconds).
+    """
+    remaining = deadline - time.perf_counter()
+    if remaining > spin:
+        time.sleep(remaining - spin)
+    while time.perf_counter() < deadline:
+        pass
+    return time.perf_counter() - deadline
+
+
+def source_time(cap: cv2.VideoCapture, index: int, interval: float) -> float:
+    """
+    Source time of the frame `cap` last grabbed, in seconds.
+
+    Uses `CAP_PROP_POS_MSEC`; containers that don't report it fall back to
+    `index * interval`, with `index` the 0-based number of that frame.
+    """
+    msec = cap.get(cv2.CAP_PROP_POS_MSEC)
+    if msec and msec > 0:
+        return msec / 1000.0
+    return index * interval if interval else 0.0
+
+
+class Backoff:
+    """Growing sleep for retry loops (e.g. a camera that returns no frame)."""
+
+    def __init__(self, initial: float = 0.001, maximum: float = 0.05):
+        self.initial = initial
+        self.maximum = maximum
+        self.delay = initial
+
+    def wait(self) -> None:
+        time.sleep(self.delay)
+        self.delay = min(self.delay * 2, self.maximum)
+
+    def reset(self) -> None:
+        self.delay = self.initial
 
 
 class FPSController:
-    """Delta-time FPS controller without sleep, with frame skipping and EMA smoothing."""
+    """
+    Delta-time FPS controller with frame skipping and EMA smoothing.
+
+    `begin_frame`/`should_render` never sleep (frames are skipped instead).
+    For pacing, `wait_next_frame` and `sleep_until` sleep most of the wait
+    and spin the last `spin` seconds, and `wait_next_frame` follows an
+    absolute schedule so errors don't accumulate. Wake-up errors are kept for
+    `jitter_percentiles`.
+    """
 
     def __init__(
-        self, target_fps: Optional[float] = None, smoothing_alpha: float = 0.2
+        self,
+        target_fps: Optional[float] = None,
+        smoothing_alpha: float = 0.2,
+        spin: float = SPIN_THRESHOLD,
+        jitter_window: int = 1000,
     ):
         self.target_fps = target_fps
         self.frame_interval = 1.0 / target_fps if target_fps else None
@@ -17,6 +80,13 @@ class FPSController:
         self.smoothed_fps = None
         self.alpha = smoothing_alpha
 
+        # Pacing
+        self.spin = spin
+        self.schedule_start: Optional[float] = None
+        self.slot = 0
+        self.resyncs = 0
+        self.jitter: Deque[float] = deque(maxlen=jitter_window)
+
     def begin_frame(self) -> float:
         """Return delta time since last frame."""
         now = time.perf_counter()
@@ -55,4 +125,120 @@ class FPSController:
     def set_target_fps(self, fps: Optional[float]):
         """Set a new target FPS and update frame interval."""
         self.target_fps = fps
-        self.frame_interval = 1.0 / fps if fps else None
\ No newline at end of file
+        self.frame_interval = 1.0 / fps if fps else None
+        self.schedule_start = None
+
+    # ────────────────────────────────────────────────
+    # Pacing
+    # ────────────────────────────────────────────────
+
+    def sleep_until(self, deadline: float) -> float:
+        """Hybrid sleep/spin until `deadline` (perf_counter time); records the jitter."""
+        if deadline <= time.perf_counter():
+            return 0.0
+        late = sleep_until(deadline, self.spin)
+        self.jitter.append(late)
+        return late
+
+    def wait_next_frame(self) -> float:
+        """
+        Wait for the next slot of the schedule `start + k * frame_interval`.
+
+        Deadlines come from the schedule, not from the previous wake-up, so
+        drift never accumulates. When more than a whole interval behind, the
+        schedule skips the missed slots instead of bursting to catch up.
+        Returns the delta time since the previous frame.
+        """
+        if self.frame_interval is None:
+            return self.begin_frame()
+
+        now = time.perf_counter()
+        if self.schedule_start is None:
+            self.schedule_start, self.slot = now, 0
+        else:
+            self.slot += 1
+            deadline = self.schedule_start + self.slot * self.frame_interval
+            if now - deadline > self.frame_interval:
+                self.slot = int((now - self.schedule_start) / self.frame_interval) + 1
+                self.resyncs += 1
+            self.sleep_until(self.schedule_start + self.slot * self.frame_interval)
+        return self.begin_frame()
+
+    def jitter_percentiles(self, percentiles: Sequence[float] = (50, 95, 99)) -> Dict[str, float]:
+        """Wake-up error percentiles in milliseconds, e.g. {"p50": 0.01, ...}."""
+        if not self.jitter:
+            return {}
+        values = np.percentile(np.fromiter(self.jitter, dtype=np.float64), percentiles) * 1000.0
+        return {f"p{p:g}": float(v) for p, v in zip(percentiles, values)}
+
+
+@dataclass
+class SchedulerStats:
+    """Playback counters of a FrameScheduler."""
+
+    shown: int = 0  # frames decoded and handed over
+    dropped: int = 0  # frames skipped with grab() because they were late
+    late: int = 0  # frames shown beyond the tolerance (max_drop reached)
+    max_lag: float = 0.0  # worst lag seen, in seconds
+
+
+class FrameScheduler:
+    """
+    Keeps file playback on the source clock.
+
+    Each frame's timestamp (`CAP_PROP_POS_MSEC`) is compared with the wall
+    clock since playback started:
+    - early frames wait until they are due;
+    - frames later than `tolerance` (one frame interval by default) are
+      skipped with `cap.grab()`, without decoding or converting them.
+
+    At most `max_drop` frames in a row are skipped, so a slow consumer still
+    sees regular updates.
+    """
+
+    def __init__(self, source_fps: float, tolerance: Optional[float] = None, max_drop: int = 8):
+        self.fps_ctrl = FPSController(source_fps)
+        self.tolerance = tolerance if tolerance is not None else (self.fps_ctrl.frame_interval or 0.0)
+        self.max_drop = max_drop
+        self.stats = SchedulerStats()
+
+        self._start: Optional[float] = None
+        self._origin = 0.0
+        self._index = 0
+        # Source time of the last frame returned by `read`
+        self.timestamp = 0.0
+
+    def read(self, cap: cv2.VideoCapture) -> Tuple[bool, Optional[np.ndarray]]:
+        """Like `cap.read()`, but skips late frames and waits for early ones."""
+        dropped_in_row = 0
+        while True:
+            if not cap.grab():
+                return False, None
+
+            now = time.perf_counter()
+            timestamp = source_time(cap, self._index, self.fps_ctrl.frame_interval or 0.0)
+            self._index += 1
+            if self._start is None:
+                self._start, self._origin = now, timestamp
+
+            # > 0: behind schedule, < 0: ahead of it
+            lag = (now - self._start) - (timestamp - self._origin)
+            if lag > self.tolerance and dropped_in_row < self.max_drop:
+                self.stats.dropped += 1
+                dropped_in_row += 1
+                continue
+            break
+
+        if lag < 0:
+            self.fps_ctrl.sleep_until(now - lag)
+        else:
+            self.stats.max_lag = max(self.stats.max_lag, lag)
+            if lag > self.tolerance:
+                self.stats.late += 1
+
+        ok, frame = cap.retrieve()
+        if ok:
+            self.timestamp = timestamp
+            self.stats.shown += 1
+            self.fps_ctrl.begin_frame()
+        return ok, frame
@@ -0,0 +1,72 @@
+from dataclasses import dataclass
+from functools import lru_cache
+
+import cv2
+import numpy as np
+
+from .converter import glyph_lut
+
+
+@lru_cache(maxsize=32)
+def tone_lut(brightness: int, contrast: float, gamma: float, invert: bool) -> np.ndarray:
+    """
+    Build the 256-entry tone curve.
+
+    Applied in order: gamma, contrast (around mid-gray), brightness offset,
+    clipping to [0, 255] and finally inversion.
+    """
+    v = np.arange(256, dtype=np.float64) / 255.0
+    if gamma > 0 and gamma != 1.0:
+        v = v ** (1.0 / gamma)
+    v = (v - 0.5) * contrast + 0.5
+    v = v * 255.0 + brightness
+    lut = np.clip(np.rint(v), 0, 255).astype(np.uint8)
+    if invert:
+        lut = 255 - lut
+    return lut
+
+
+@lru_cache(maxsize=32)
+def toned_glyph_lut(
+    brightness: int, contrast: float, gamma: float, invert: bool, gradient: str
+) -> np.ndarray:
+    """Luminance → glyph index table with the tone curve folded in."""
+    return np.take(glyph_lut(gradient), tone_lut(brightness, contrast, gamma, invert))
+
+
+@dataclass(frozen=True)
+class ToneMap:
+    """Brightness, contrast, gamma and invert folded into one lookup table.
+
+    The table is applied with a single `cv2.LUT` call on the resized planes,
+    so the per-frame cost does not depend on how many adjustments are on.
+    """
+
+    brightness: int = 0  # -255..255 offset
+    contrast: float = 1.0  # 1.0 = unchanged
+    gamma: float = 1.0  # > 1 brightens mid-tones
+    invert: bool = False
+
+    @property
+    def params(self) -> tuple:
+        return int(self.brightness), float(self.contrast), float(self.gamma), bool(self.invert)
+
+    @property
+    def lut(self) -> np.ndarray:
+        return tone_lut(*self.params)
+
+    @property
+    def is_identity(self) -> bool:
+        return self.brightness == 0 and self.contrast == 1.0 and self.gamma == 1.0 and not self.invert
+
+    def apply(self, plane: np.ndarray) -> np.ndarray:
+        """Tone-map a uint8 plane (gray or BGR)."""
+        if self.is_identity:
+            return plane
+        return cv2.LUT(plane, self.lut)
+
+    def glyph_lut(self, gradient: str) -> np.ndarray:
+        """Luminance → glyph index table with the tone curve folded in."""
+        if self.is_identity:
+            return glyph_lut(gradient)
+        return toned_glyph_lut(*self.params, gradient)
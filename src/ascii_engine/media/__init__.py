@@ -1,3 +1,27 @@
-from .media import frame_to_text, frames_to_images, images_to_video
+from .media import (
+    frame_to_text,
+    frames_to_images,
+    frames_to_video,
+    images_to_video,
+    FrameExporter,
+    VideoEncoder,
+)
+from .sinks import TextSink, ImageSink, VideoSink, ContainerSink
+from .container import ContainerWriter, FrameContainer
+from .player import ContainerPlayer
 
-__all__ = ["frame_to_text", "frames_to_images", "images_to_video"]
+__all__ = [
+    "frame_to_text",
+    "frames_to_images",
+    "frames_to_video",
+    "images_to_video",
+    "FrameExporter",
+    "VideoEncoder",
+    "TextSink",
+    "ImageSink",
+    "VideoSink",
+    "ContainerSink",
+    "ContainerWriter",
+    "FrameContainer",
+    "ContainerPlayer",
+]
@@ -0,0 +1,150 @@
+"""Glyph-atlas rendering of frames into images.
+
+Every character is rasterized once, with the real font metrics, into an
+alpha mask the size of one cell. A frame is then composed entirely with
+NumPy: the masks are gathered by glyph index and tiled into the image, and
+each pixel is the foreground colour blended over the background by the mask.
+Glyphs sit in their cell exactly where `ImageDraw.text` at the cell's top
+left corner would put them; the parts of a glyph that stick out of its
+cell are clipped.
+
+Braille patterns (U+2800–U+28FF) are drawn as dots instead. Most monospace
+fonts, the bundled one included, have no glyphs for them.
+"""
+
+from __future__ import annotations
+
+from typing import Dict, Iterable, Tuple
+
+import cv2
+import numpy as np
+from PIL import Image, ImageDraw
+
+from ..core.frame import AsciiFrame
+
+BRAILLE_BASE = 0x2800
+# (column, row) of the dot of each Braille bit
+_BRAILLE_DOTS = ((0, 0), (0, 1), (0, 2), (1, 0), (1, 1), (1, 2), (0, 3), (1, 3))
+_SUPERSAMPLE = 4
+
+
+def cell_size(font) -> Tuple[int, int]:
+    """(width, height) of a character cell: advance width and ascent + descent."""
+    left, top, right, bottom = font.getbbox("M")
+    try:
+        width = font.getlength("M")
+    except AttributeError:
+        width = right - left
+    try:
+        ascent, descent = font.getmetrics()
+        height = ascent + descent
+    except AttributeError:
+        # Bitmap fonts have no metrics; use the bounding box of tall glyphs
+        height = font.getbbox("Mgjy|")[3]
+    return max(1, int(round(width))), max(1, int(height))
+
+
+def boost_saturation(pixels: np.ndarray, factor: float) -> np.ndarray:
+    """Scale the HLS saturation of an RGB array by `factor`."""
+    hls = cv2.cvtColor(pixels, cv2.COLOR_RGB2HLS).astype(np.float32)
+    hls[..., 2] = np.clip(hls[..., 2] * factor, 0, 255)
+    return cv2.cvtColor(hls.astype(np.uint8), cv2.COLOR_HLS2RGB)
+
+
+class GlyphAtlas:
+    """Alpha masks of the characters drawn so far, one cell each."""
+
+    def __init__(self, font, chars: Iterable[str] = ""):
+        self.font = font
+        self.cell = cell_size(font)
+        self.index: Dict[str, int] = {}
+        self.masks = np.zeros((0, self.cell[1], self.cell[0]), dtype=np.uint8)
+        self._charsets: Dict[str, np.ndarray] = {}
+        # Index 0 is the blank cell (also used for padding)
+        self.add(" ")
+        self.add(chars)
+
+    def _rasterize(self, ch: str) -> np.ndarray:
+        if BRAILLE_BASE <= ord(ch) <= BRAILLE_BASE + 0xFF:
+            return self._braille(ord(ch) - BRAILLE_BASE)
+        mask = Image.new("L", self.cell, 0)
+        ImageDraw.Draw(mask).text((0, 0), ch, font=self.font, fill=255)
+        return np.asarray(mask)
+
+    def _braille(self, bits: int) -> np.ndarray:
+        """Antialiased dots of a Braille pattern on a 2×4 grid filling the cell."""
+        w, h = self.cell[0] * _SUPERSAMPLE, self.cell[1] * _SUPERSAMPLE
+        dx, dy = w / 2, h / 4
+        radius = max(0.35 * min(dx, dy), _SUPERSAMPLE / 2)
+        mask = Image.new("L", (w, h), 0)
+        draw = ImageDraw.Draw(mask)
+        for bit, (col, row) in enumerate(_BRAILLE_DOTS):
+            if bits >> bit & 1:
+                x, y = (col + 0.5) * dx, (row + 0.5) * dy
+                draw.ellipse((x - radius, y - radius, x + radius, y + radius), fill=255)
+        return np.asarray(mask.resize(self.cell, Image.Resampling.BOX))
+
+    def add(self, chars: Iterable[str]) -> None:
+        """Rasterize the characters not in the atlas yet."""
+        new = [ch for ch in dict.fromkeys(chars) if ch not in self.index]
+        if not new:
+            return
+        for ch in new:
+            self.index[ch] = len(self.index)
+        self.masks = np.concatenate([self.masks, np.stack([self._rasterize(ch) for ch in new])])
+
+    def charset_indices(self, charset: str) -> np.ndarray:
+        """Atlas index of every position of `charset` (glyph index → atlas index)."""
+        table = self._charsets.get(charset)
+        if table is None:
+            self.add(charset)
+            table = self._charsets[charset] = np.array([self.index[ch] for ch in charset], dtype=np.intp)
+        return table
+
+    def compose(self, glyphs: np.ndarray, fg: np.ndarray, bg: np.ndarray) -> np.ndarray:
+        """
+        Image of a cell grid: `glyphs` are atlas indices (rows, cols), `fg`/`bg`
+        are (rows, cols, 3) RGB colours. Returns (rows * cell_h, cols * cell_w, 3).
+        """
+        rows, cols = glyphs.shape
+        cw, ch = self.cell
+        # (rows, cols, ch, cw) → (rows, ch, cols, cw) → full-resolution alpha
+        alpha = self.masks[glyphs].transpose(0, 2, 1, 3).reshape(rows * ch, cols * cw, 1)
+        alpha = alpha.astype(np.uint16)
+
+        fg_px = np.repeat(np.repeat(fg.astype(np.uint16), ch, axis=0), cw, axis=1)
+        bg_px = np.repeat(np.repeat(bg.astype(np.uint16), ch, axis=0), cw, axis=1)
+        out = (fg_px * alpha + bg_px * (255 - alpha) + 127) // 255
+        return out.astype(np.uint8)
+
+    # ────────────────────────────────────────────────
+    # Frames
+    # ────────────────────────────────────────────────
+
+    def frame_planes(
+        self, frame: AsciiFrame, default_fg=(255, 255, 255), default_bg=(0, 0, 0)
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Atlas indices and fg/bg colours of an AsciiFrame, straight from its planes."""
+        glyphs = self.charset_indices(frame.charset)[frame.glyphs]
+        return glyphs, frame.to_pixels(default_fg), frame.background_pixels(default_bg)
+
+    def grid_planes(
+        self, grid: list, default_fg=(255, 255, 255), default_bg=(0, 0, 0)
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Same for a parsed (char, fg, bg) grid; short rows are padded with blanks."""
+        rows = len(grid)
+        cols = max((len(row) for row in grid), default=0)
+        self.add(ch for row in grid for ch, _, _ in row)
+        glyphs = np.zeros((rows, cols), dtype=np.intp)
+        fg = np.empty((rows, cols, 3), dtype=np.uint8)
+        bg = np.empty((rows, cols, 3), dtype=np.uint8)
+        fg[:] = default_fg
+        bg[:] = default_bg
+        for y, row in enumerate(grid):
+            if not row:
+                continue
+            chars, fgs, bgs = zip(*row)
+            glyphs[y, : len(row)] = [self.index[ch] for ch in chars]
+            fg[y, : len(row)] = fgs
+            bg[y, : len(row)] = bgs
+        return glyphs, fg, bg
@@ -0,0 +1,323 @@
+"""Binary container for converted frames (`.asciv`), read through mmap.
+
+Layout (little-endian):
+
+    header   64 bytes   magic, version, frame count, offsets of the
+                        metadata block and of the frame index
+    metadata JSON       mode, charset, fps, plane shapes/dtypes, keyframe interval
+    records  ...        per frame: length (u32), flags (u16), timestamp (f64),
+                        then the payload
+    index    N entries  offset, length, flags, keyframe number, timestamp
+
+A frame payload is the glyph, colour and background planes back to back,
+in the fixed layout given by the metadata. With compression on, keyframes
+are zlib-compressed planes and the frames between them are zlib-compressed
+XOR deltas against the previous frame (mostly zeros, so they shrink a lot).
+
+The file is written incrementally; the index and the final header go in on
+`close`. A file whose writer never closed can still be read: the records
+are scanned instead. Reading any frame costs one index lookup plus at most
+`keyframe_interval` delta decodes (none for uncompressed files), and
+sequential reads decode each frame exactly once.
+"""
+
+from __future__ import annotations
+
+import json
+import mmap
+import struct
+import zlib
+from pathlib import Path
+from typing import Iterator, List, Optional, Tuple, Union
+
+import numpy as np
+
+from ..core.frame import AsciiFrame
+from ..log import get_logger
+from ..settings import get_mode
+
+logger = get_logger(__name__)
+
+MAGIC = b"ASCIIV\x00\x01"
+VERSION = 1
+EXTENSION = ".asciv"
+
+# magic, version, flags, frame count, metadata offset, metadata length, index offset
+HEADER = struct.Struct("<8sHHIQQQ")
+HEADER_SIZE = 64
+# payload length, flags, timestamp
+RECORD = struct.Struct("<IHd")
+
+FLAG_KEYFRAME = 1
+FLAG_ZLIB = 2
+
+INDEX_DTYPE = np.dtype(
+    [("offset", "<u8"), ("length", "<u4"), ("flags", "<u2"), ("key", "<u4"), ("time", "<f8")]
+)
+
+PLANES = ("glyphs", "colors", "background")
+
+
+def _frame_planes(frame: AsciiFrame) -> dict:
+    return {"glyphs": frame.glyphs, "colors": frame.colors, "background": frame.background}
+
+
+class ContainerWriter:
+    """
+    Writes frames to a `.asciv` file as they are produced.
+
+    - `keyframe_interval`: frames between full frames (bounds seek cost).
+    - `compress`: zlib keyframes and XOR deltas; off gives fixed-size records.
+    """
+
+    def __init__(
+        self,
+        path: Union[str, Path],
+        fps: float = 0.0,
+        keyframe_interval: int = 48,
+        compress: bool = True,
+        level: int = 1,
+    ):
+        self.path = Path(path)
+        self.fps = float(fps)
+        self.keyframe_interval = max(1, int(keyframe_interval))
+        self.compress = compress
+        self.level = level
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._file = open(self.path, "wb")
+        self._file.write(b"\x00" * HEADER_SIZE)
+        self._meta: Optional[dict] = None
+        self._meta_span = (0, 0)
+        self._index: List[tuple] = []
+        self._previous: Optional[np.ndarray] = None
+        self._key = 0
+
+    @property
+    def count(self) -> int:
+        return len(self._index)
+
+    def _layout(self, frame: AsciiFrame) -> dict:
+        return {
+            name: {"shape": list(p.shape), "dtype": p.dtype.str}
+            for name, p in _frame_planes(frame).items() if p is not None
+        }
+
+    def _write_meta(self, frame: AsciiFrame) -> None:
+        self._meta = {
+            "mode": frame.mode.name,
+            "charset": frame.charset,
+            "fps": self.fps,
+            "keyframe_interval": self.keyframe_interval,
+            "compress": self.compress,
+            "planes": self._layout(frame),
+        }
+        data = json.dumps(self._meta).encode("utf-8")
+        self._meta_span = (self._file.tell(), len(data))
+        self._file.write(data)
+
+    def write(self, frame: AsciiFrame, timestamp: Optional[float] = None) -> None:
+        """Append a frame. Its layout must match the first frame's."""
+        if self._meta is None:
+            self._write_meta(frame)
+        elif self._layout(frame) != self._meta["planes"]:
+            raise ValueError("Frame layout differs from the first frame of the container")
+
+        if timestamp is None:
+            timestamp = self.count / self.fps if self.fps > 0 else float(self.count)
+
+        raw = np.concatenate(
+            [np.ascontiguousarray(p).reshape(-1).view(np.uint8) for p in _frame_planes(frame).values() if p is not None]
+        )
+        keyframe = (
+            not self.compress or self._previous is None or self.count % self.keyframe_interval == 0
+        )
+        if keyframe:
+            self._key = self.count
+            payload = raw.tobytes()
+            flags = FLAG_KEYFRAME
+        else:
+            payload = np.bitwise_xor(raw, self._previous).tobytes()
+            flags = 0
+        if self.compress:
+            payload = zlib.compress(payload, self.level)
+            flags |= FLAG_ZLIB
+        self._previous = raw
+
+        offset = self._file.tell()
+        self._file.write(RECORD.pack(len(payload), flags, timestamp))
+        self._file.write(payload)
+        self._index.append((offset + RECORD.size, len(payload), flags, self._key, timestamp))
+
+    def close(self) -> None:
+        """Write the index and the final header."""
+        if self._file.closed:
+            return
+        index_offset = self._file.tell()
+        np.array(self._index, dtype=INDEX_DTYPE).tofile(self._file)
+        self._file.seek(0)
+        self._file.write(
+            HEADER.pack(MAGIC, VERSION, 0, self.count, self._meta_span[0], self._meta_span[1], index_offset)
+        )
+        self._file.close()
+        logger.info("Saved %d frames to: %s", self.count, self.path)
+
+    def __enter__(self) -> "ContainerWriter":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+class FrameContainer:
+    """Random-access reader of a `.asciv` file; frames are decoded on demand."""
+
+    def __init__(self, path: Union[str, Path], encoder=None):
+        self.path = Path(path)
+        self.encoder = encoder
+        self._file = open(self.path, "rb")
+        self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        if len(self._map) < HEADER_SIZE:
+            self._release()
+            raise ValueError(f"Not an ASCII video container: {self.path}")
+
+        magic, version, _, count, meta_offset, meta_length, index_offset = HEADER.unpack_from(self._map, 0)
+        if magic != MAGIC and magic != b"\x00" * 8:
+            raise ValueError(f"Not an ASCII video container: {self.path}")
+        if meta_length == 0 and len(self._map) == HEADER_SIZE:
+            # Header only: closed (or abandoned) before the first frame
+            self._release()
+            raise ValueError(f"Container has no frames: {self.path}")
+        if meta_length == 0:
+            # Writer never closed: metadata follows the header
+            meta_offset = HEADER_SIZE
+            meta_length = self._meta_length(meta_offset)
+        self.meta = json.loads(self._map[meta_offset : meta_offset + meta_length].decode("utf-8"))
+
+        if index_offset:
+            self.index = np.frombuffer(self._map, dtype=INDEX_DTYPE, count=count, offset=index_offset)
+        else:
+            logger.warning("Container was not closed, scanning frames: %s", self.path)
+            self.index = self._scan(meta_offset + meta_length)
+
+        self.mode = get_mode(self.meta["mode"])
+        self.charset = self.meta["charset"]
+        self.fps = float(self.meta.get("fps", 0.0))
+        self._layout = [
+            (name, tuple(spec["shape"]), np.dtype(spec["dtype"]))
+            for name, spec in self.meta["planes"].items()
+        ]
+        self._cached: Tuple[int, Optional[np.ndarray]] = (-1, None)
+
+    def _meta_length(self, start: int) -> int:
+        """Length of the JSON block of an unclosed file."""
+        decoder = json.JSONDecoder()
+        text = self._map[start : start + 65536].decode("utf-8", errors="ignore")
+        _, end = decoder.raw_decode(text)
+        return len(text[:end].encode("utf-8"))
+
+    def _scan(self, offset: int) -> np.ndarray:
+        """Rebuild the index from the frame records."""
+        entries = []
+        key = 0
+        size = len(self._map)
+        while offset + RECORD.size <= size:
+            length, flags, timestamp = RECORD.unpack_from(self._map, offset)
+            start = offset + RECORD.size
+            if start + length > size:
+                break  # truncated record
+            if flags & FLAG_KEYFRAME:
+                key = len(entries)
+            entries.append((start, length, flags, key, timestamp))
+            offset = start + length
+        return np.array(entries, dtype=INDEX_DTYPE)
+
+    # ────────────────────────────────────────────────
+    # Access
+    # ────────────────────────────────────────────────
+
+    def __len__(self) -> int:
+        return len(self.index)
+
+    @property
+    def timestamps(self) -> np.ndarray:
+        """Source time of every frame, in seconds."""
+        return self.index["time"]
+
+    @property
+    def duration(self) -> float:
+        if not len(self):
+            return 0.0
+        last = float(self.timestamps[-1])
+        return last + (1.0 / self.fps if self.fps > 0 else 0.0)
+
+    def frame_at(self, seconds: float) -> int:
+        """Index of the frame shown at `seconds`."""
+        i = int(np.searchsorted(self.timestamps, seconds, side="right")) - 1
+        return min(max(i, 0), max(len(self) - 1, 0))
+
+    def _payload(self, i: int) -> np.ndarray:
+        entry = self.index[i]
+        start = int(entry["offset"])
+        data = self._map[start : start + int(entry["length"])]
+        if entry["flags"] & FLAG_ZLIB:
+            data = zlib.decompress(data)
+        return np.frombuffer(data, dtype=np.uint8)
+
+    def _raw(self, i: int) -> np.ndarray:
+        """Plane bytes of frame `i`, applying deltas from its keyframe."""
+        last, raw = self._cached
+        key = int(self.index[i]["key"])
+        # Continue from the last decoded frame when it is on the way
+        if raw is not None and key <= last <= i:
+            start = last + 1
+        else:
+            start = key + 1
+            raw = self._payload(key)
+        for j in range(start, i + 1):
+            raw = np.bitwise_xor(raw, self._payload(j))
+        self._cached = (i, raw)
+        return raw
+
+    def __getitem__(self, i: int) -> AsciiFrame:
+        if i < 0:
+            i += len(self)
+        if not 0 <= i < len(self):
+            raise IndexError(i)
+
+        raw = self._raw(i)
+        planes = {}
+        pos = 0
+        for name, shape, dtype in self._layout:
+            nbytes = int(np.prod(shape)) * dtype.itemsize
+            planes[name] = raw[pos : pos + nbytes].view(dtype).reshape(shape).copy()
+            pos += nbytes
+        return AsciiFrame(
+            planes["glyphs"],
+            planes.get("colors"),
+            self.charset,
+            self.mode,
+            self.encoder,
+            planes.get("background"),
+            float(self.timestamps[i]),
+        )
+
+    def __iter__(self) -> Iterator[AsciiFrame]:
+        for i in range(len(self)):
+            yield self[i]
+
+    def _release(self) -> None:
+        self._map.close()
+        self._file.close()
+
+    def close(self) -> None:
+        # Drop views into the map before closing it
+        self.index = self.index.copy() if len(self.index) else self.index
+        self._cached = (-1, None)
+        self._release()
+
+    def __enter__(self) -> "FrameContainer":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
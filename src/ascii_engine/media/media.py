@@ -2,69 +2,44 @@
 
 This module provides two main helpers used by the CLI:
 - `frames_to_images(frames, out_dir, ...)` converts a list of ASCII/ANSI frames
-  (each frame is a multiline string) into PNG images.
+  (multiline strings or `AsciiFrame`s) into PNG images.
 - `images_to_video(img_dir_or_list, output_path, fps)` packs images into an MP4
   using cv2.
+- `frames_to_video(frames, output_path, fps, ...)` renders frames straight into
+  an MP4, without image files in between.
 
 The ANSI parser implemented is conservative but supports TrueColor SGR
-(`38;2;R;G;B`) and 256-color SGR (`38;5;N`) as foreground and background.
+(`38;2;R;G;B`), 256-color SGR (`38;5;N`) and the basic 16 colors (`30–37`,
+`90–97`) as foreground and background.
 """
 
 from __future__ import annotations
 
+from concurrent.futures import ProcessPoolExecutor
 from typing import List, Optional, Sequence, Tuple, Union
-from PIL import Image, ImageDraw, ImageFont
+from PIL import Image, ImageFont
 from pathlib import Path
 from tqdm import tqdm
 import cv2
+import numpy as np
 
-import colorsys
 import re
+from ..core.frame import AsciiFrame
+from ..core.palette import xterm_256_to_rgb as _xterm_256_to_rgb
 from ..log import get_logger
+from ..settings import Mode
+from .atlas import GlyphAtlas, boost_saturation
 
 
 logger = get_logger(__name__)
 
 ESC_SGR = re.compile(r"\x1b\[([^m]*)m")
 
-
-def _xterm_256_to_rgb(code: int) -> Tuple[int, int, int]:
-    """Convert xterm-256 color code to an RGB tuple.
-
-    Implements the standard 256-color mapping (16 + 6*6*6 + 24 grayscale).
-    """
-    if code < 16:
-        # approximate 16-color palette
-        base = [
-            (0, 0, 0),
-            (128, 0, 0),
-            (0, 128, 0),
-            (128, 128, 0),
-            (0, 0, 128),
-            (128, 0, 128),
-            (0, 128, 128),
-            (192, 192, 192),
-            (128, 128, 128),
-            (255, 0, 0),
-            (0, 255, 0),
-            (255, 255, 0),
-            (0, 0, 255),
-            (255, 0, 255),
-            (0, 255, 255),
-            (255, 255, 255),
-        ]
-        return base[code]
-    if 16 <= code <= 231:
-        c = code - 16
-        r = (c // 36) % 6
-        g = (c // 6) % 6
-        b = c % 6
-        scale = [0, 95, 135, 175, 215, 255]
-        return (scale[r], scale[g], scale[b])
-    if 232 <= code <= 255:
-        v = 8 + (code - 232) * 10
-        return (v, v, v)
-    return (255, 255, 255)
+# Pillow's default PNG compression
+DEFAULT_COMPRESS_LEVEL = 6
+# Frames whose images use few colours (palette output pays off)
+PALETTE_MODES = (Mode.ASCII, Mode.GRAYSCALE)
+_GRAY_PALETTE = [v for v in range(256) for _ in range(3)]
 
 
 def _parse_sgr_segment(
@@ -116,8 +91,16 @@ def _parse_sgr_segment(
                     i += 3
                 else:
                     i += 2
+            elif 30 <= code <= 37 or 90 <= code <= 97:
+                # basic / bright 16-color foreground
+                cur_fg = _xterm_256_to_rgb(code - 30 if code < 90 else code - 90 + 8)
+                i += 1
+            elif 40 <= code <= 47 or 100 <= code <= 107:
+                # basic / bright 16-color background
+                cur_bg = _xterm_256_to_rgb(code - 40 if code < 100 else code - 100 + 8)
+                i += 1
             else:
-                # unsupported/ignored codes (like 1=bold, 30-37 simple colors)
+                # unsupported/ignored codes (like 1=bold)
                 i += 1
     except Exception:
         # ignore parse problems and keep current colors
@@ -155,27 +138,20 @@ def _parse_ansi_to_grid(text: str, default_fg=(255, 255, 255), default_bg=(0, 0,
     return grid
 
 
-def _boost_rgb(rgb: Tuple[int, int, int], factor: float) -> Tuple[int, int, int]:
-    """Increase perceived color saturation by `factor` (1.0 = no change)."""
-    try:
-        r, g, b = rgb
-        # normalize to 0..1
-        h, l, s = colorsys.rgb_to_hls(r / 255.0, g / 255.0, b / 255.0)
-        s = max(0.0, min(1.0, s * factor))
-        nr, ng, nb = colorsys.hls_to_rgb(h, l, s)
-        return (int(nr * 255), int(ng * 255), int(nb * 255))
-    except Exception:
-        return rgb
+def write_text_frame(frame: Union[str, AsciiFrame], output_file: Union[str, Path]) -> None:
+    """Write a single frame to `output_file`."""
+    with open(output_file, "w", encoding="utf-8") as f:
+        f.write(str(frame))
 
 
 def frame_to_text(
-        frames: List[str], 
+        frames: Sequence[Union[str, AsciiFrame]], 
         output_path: Union[str, Path] = "output_texts"
 ) -> None:
     """
     Save frame to a text file.
     Does not support ANSI or grayscale color output.
-    - `frames`: list of multiline strings to save.
+    - `frames`: list of multiline strings or AsciiFrames to save.
     - `output_path`: directory where text files will be written (created if missing).
     """
 
@@ -184,97 +160,313 @@ def frame_to_text(
 
     try:
         for idx, frame in enumerate(frames):
-            output_file: Path = out_dir / f"frame_{idx:04d}.txt"
-            with open(output_file, "w", encoding="utf-8") as f:
-                f.write(frame)
+            write_text_frame(frame, out_dir / f"frame_{idx:04d}.txt")
     except Exception as e:
         logger.error("Failed to save file: %s", e)
     
     logger.info("Saved %d text files to: %s", len(frames), out_dir)
 
 
+def load_font(font_path: Optional[str] = None, font_size: int = 14):
+    """Load a TTF font, falling back to Pillow's default font."""
+    try:
+        if font_path and Path(font_path).exists():
+            return ImageFont.truetype(str(font_path), font_size)
+        logger.warning("Font path not found, using default font.")
+    except Exception:
+        pass
+    return ImageFont.load_default()
+
+
+def render_frame_array(
+    frame: Union[str, AsciiFrame],
+    font,
+    default_fg=(255, 255, 255),
+    default_bg=(0, 0, 0),
+    color_boost: float = 1.0,
+    atlas: Optional[GlyphAtlas] = None,
+) -> Optional[np.ndarray]:
+    """Draw one ASCII/ANSI frame into an (h, w, 3) RGB array; None for an empty frame.
+
+    Pass the same `atlas` for every frame of an export so each glyph is only
+    rasterized once.
+    """
+    atlas = atlas or GlyphAtlas(font)
+    if isinstance(frame, AsciiFrame):
+        planes = atlas.frame_planes(frame, default_fg, default_bg) if frame.glyphs.size else None
+    else:
+        grid = _parse_ansi_to_grid(frame, default_fg, default_bg)
+        planes = atlas.grid_planes(grid, default_fg, default_bg) if grid else None
+
+    if planes is None or planes[0].size == 0:
+        return None
+
+    glyphs, fg, bg = planes
+    if color_boost and color_boost != 1.0:
+        fg = boost_saturation(fg, color_boost)
+    return atlas.compose(glyphs, fg, bg)
+
+
+def render_frame_image(
+    frame: Union[str, AsciiFrame],
+    font,
+    default_fg=(255, 255, 255),
+    default_bg=(0, 0, 0),
+    color_boost: float = 1.0,
+    atlas: Optional[GlyphAtlas] = None,
+) -> Image.Image:
+    """Draw one ASCII/ANSI frame into an RGB image (see `render_frame_array`)."""
+    pixels = render_frame_array(frame, font, default_fg, default_bg, color_boost, atlas)
+    if pixels is None:
+        # empty image guard
+        return Image.new("RGB", (10, 10), color=default_bg)
+    return Image.fromarray(pixels, "RGB")
+
+
+def palette_image(pixels: np.ndarray) -> Optional[Image.Image]:
+    """Lossless palette ("P") image of `pixels`, None when they use more than 256 colours."""
+    red = pixels[..., 0]
+    if np.array_equal(red, pixels[..., 1]) and np.array_equal(red, pixels[..., 2]):
+        # Gray pixels (the usual ASCII/grayscale frame): the value is the index
+        img = Image.fromarray(np.ascontiguousarray(red), "P")
+        img.putpalette(_GRAY_PALETTE)
+        return img
+
+    packed = (
+        pixels[..., 0].astype(np.uint32) << 16 | pixels[..., 1].astype(np.uint32) << 8 | pixels[..., 2]
+    )
+    colors, indices = np.unique(packed, return_inverse=True)
+    if len(colors) > 256:
+        return None
+    palette = np.stack([(colors >> 16) & 255, (colors >> 8) & 255, colors & 255], axis=1)
+    img = Image.fromarray(indices.reshape(packed.shape).astype(np.uint8), "P")
+    img.putpalette(palette.astype(np.uint8).ravel().tolist())
+    return img
+
+
+class FrameExporter:
+    """
+    Renders frames and saves them as PNGs; can be sent to worker processes.
+
+    - `compress_level`: PNG zlib level, 0 (fastest) to 9 (smallest).
+    - `palette`: save ASCII and grayscale frames (and text frames) as
+      palette images when they fit in 256 colours, which is smaller and
+      faster to encode. Falls back to RGB otherwise, so it is always lossless.
+    """
+
+    def __init__(
+        self,
+        font_path: Optional[str] = None,
+        font_size: int = 14,
+        default_fg=(255, 255, 255),
+        default_bg=(0, 0, 0),
+        color_boost: float = 1.0,
+        compress_level: int = DEFAULT_COMPRESS_LEVEL,
+        palette: bool = False,
+    ):
+        self.font_path = font_path
+        self.font_size = font_size
+        self.default_fg = default_fg
+        self.default_bg = default_bg
+        self.color_boost = color_boost
+        self.compress_level = min(max(int(compress_level), 0), 9)
+        self.palette = palette
+        self.font = None
+        self.atlas: Optional[GlyphAtlas] = None
+
+    def __getstate__(self) -> dict:
+        # Fonts don't pickle; each process loads its own
+        state = self.__dict__.copy()
+        state["font"] = None
+        state["atlas"] = None
+        return state
+
+    def load(self) -> None:
+        """Load the font and its glyph atlas (done on first use)."""
+        self.font = load_font(self.font_path, self.font_size)
+        self.atlas = GlyphAtlas(self.font)
+
+    def render(self, frame: Union[str, AsciiFrame]) -> Optional[np.ndarray]:
+        """RGB pixels of a frame (None when empty)."""
+        if self.atlas is None:
+            self.load()
+        return render_frame_array(
+            frame, self.font, self.default_fg, self.default_bg, self.color_boost, self.atlas
+        )
+
+    def save(
+        self,
+        pixels: Optional[np.ndarray],
+        path: Union[str, Path],
+        frame: Union[str, AsciiFrame, None] = None,
+    ) -> None:
+        """Write rendered pixels to `path`; `frame` tells whether a palette may fit."""
+        img = None
+        if pixels is None:
+            # empty image guard
+            img = Image.new("RGB", (10, 10), color=self.default_bg)
+        elif self.palette and (not isinstance(frame, AsciiFrame) or frame.mode in PALETTE_MODES):
+            img = palette_image(pixels)
+        if img is None:
+            img = Image.fromarray(pixels, "RGB")
+        img.save(path, compress_level=self.compress_level)
+
+    def export(self, frame: Union[str, AsciiFrame], path: Union[str, Path]) -> str:
+        self.save(self.render(frame), path, frame)
+        return str(path)
+
+
+# Exporter of the current worker process, set by `_init_exporter`
+_exporter: Optional[FrameExporter] = None
+
+
+def _init_exporter(exporter: FrameExporter) -> None:
+    global _exporter
+    _exporter = exporter
+
+
+def export_frame(job: Tuple[Union[str, AsciiFrame], str]) -> str:
+    return _exporter.export(*job)
+
+
+def save_pixels(job: Tuple[Optional[np.ndarray], str, Union[str, AsciiFrame, None]]) -> str:
+    pixels, path, frame = job
+    _exporter.save(pixels, path, frame)
+    return path
+
+
+def export_pool(exporter: FrameExporter, workers: int) -> ProcessPoolExecutor:
+    """Process pool whose workers render and save with a copy of `exporter` (see `export_frame`, `save_pixels`)."""
+    return ProcessPoolExecutor(max_workers=workers, initializer=_init_exporter, initargs=(exporter,))
+
+
 def frames_to_images(
-    frames: Sequence[str],
+    frames: Sequence[Union[str, AsciiFrame]],
     out_dir: Union[str, Path] = "output_frames",
     font_path: Optional[str] = None,
     font_size: int = 14,
     default_fg=(255, 255, 255),
     default_bg=(0, 0, 0),
     color_boost: float = 1.0,
+    workers: int = 0,
+    compress_level: int = DEFAULT_COMPRESS_LEVEL,
+    palette: bool = False,
 ) -> List[str]:
     """Convert a sequence of ASCII/ANSI frames into PNG images.
 
-    - `frames`: iterable of multiline strings (each frame).
+    - `frames`: iterable of multiline strings or AsciiFrames (each frame).
     - `out_dir`: directory where PNGs will be written (created if missing).
     - `font_path`: optional TTF font path. Falls back to Pillow's default.
     - `font_size`: size used when `font_path` is provided; ignored for default font.
+    - `workers`: processes rendering and saving frames (0 = in this process).
+    - `compress_level` / `palette`: PNG options (see `FrameExporter`).
 
-    Returns the list of written image file paths.
+    Returns the list of written image file paths, in frame order.
     """
     out_dir = Path(out_dir)
     out_dir.mkdir(parents=True, exist_ok=True)
 
-    # load font
-    font = None
-    try:
-        if font_path and Path(font_path).exists():
-            font = ImageFont.truetype(str(font_path), font_size)
-        else:
-            logger.warning("Font path not found, using default font.")
-            font = ImageFont.load_default()
-    except Exception:
-        font = ImageFont.load_default()
+    exporter = FrameExporter(
+        font_path, font_size, default_fg, default_bg, color_boost, compress_level, palette
+    )
+    jobs = [(frame, str(out_dir / f"frame_{i:05d}.png")) for i, frame in enumerate(frames)]
 
     bar_format="{l_bar}{bar} | {percentage:3.0f}% | {n_fmt}/{total_fmt} | {elapsed} → {remaining}"
+    progress = dict(bar_format=bar_format, total=len(jobs), desc="Converting frames to images")
 
-    created: List[str] = []
-    for i, frame in tqdm(
-        enumerate(frames),
-        bar_format=bar_format,
-        total=len(frames),
-        desc="Converting frames to images",
-    ):
-        grid = _parse_ansi_to_grid(frame, default_fg, default_bg)
-
-        if not grid:
-            # empty image guard
-            img = Image.new("RGB", (10, 10), color=default_bg)
-            p = out_dir / f"frame_{i:05d}.png"
-            img.save(p)
-            created.append(str(p))
-            continue
-
-        cols = max((len(r) for r in grid), default=0)
-        rows = len(grid)
-
-        # fallback conservative sizes
-        char_w, char_h = (8, 16)
-
-        img_w = max(1, cols * char_w)
-        img_h = max(1, rows * char_h)
-
-        img = Image.new("RGB", (img_w, img_h), color=default_bg)
-        draw = ImageDraw.Draw(img)
-
-        for y, row in enumerate(grid):
-            for x, (ch, fg, bg) in enumerate(row):
-                px = x * char_w
-                py = y * char_h
-                if bg != default_bg:
-                    draw.rectangle([px, py, px + char_w, py + char_h], fill=bg)
-                draw_fg = fg
-                if color_boost and color_boost != 1.0:
-                    draw_fg = _boost_rgb(fg, color_boost)
-                draw.text((px, py), ch, font=font, fill=draw_fg)
-
-        p = out_dir / f"frame_{i:05d}.png"
-        img.save(p)
-        created.append(str(p))
+    if workers > 1 and len(jobs) > 1:
+        with export_pool(exporter, workers) as pool:
+            # map keeps the frame order; chunks amortize the transfer of frames
+            chunksize = max(1, min(16, len(jobs) // (workers * 4)))
+            created = list(tqdm(pool.map(export_frame, jobs, chunksize=chunksize), **progress))
+    else:
+        created = [exporter.export(frame, path) for frame, path in tqdm(jobs, **progress)]
 
     logger.info("Saved %d images to: %s", len(created), out_dir)
     return created
 
 
+class VideoEncoder:
+    """Feeds frame buffers to cv2.VideoWriter as they are produced.
+
+    The video takes the size of the first frame; later frames of another
+    size (e.g. after a terminal resize) are scaled to it.
+    """
+
+    def __init__(self, output_path: Union[str, Path] = "out.mp4", fps: float = 12, fourcc: str = "mp4v"):
+        self.output_path = Path(output_path)
+        self.fps = fps
+        self.fourcc = fourcc
+        self.size: Optional[Tuple[int, int]] = None
+        self.count = 0
+        self.resized = 0
+        self._writer: Optional[cv2.VideoWriter] = None
+
+    def write(self, pixels: np.ndarray, rgb: bool = True) -> None:
+        """Append one (h, w, 3) frame, RGB by default (BGR with `rgb=False`)."""
+        h, w = pixels.shape[:2]
+        if self._writer is None:
+            self.output_path.parent.mkdir(parents=True, exist_ok=True)
+            self.size = (w, h)
+            self._writer = cv2.VideoWriter(
+                str(self.output_path), cv2.VideoWriter_fourcc(*self.fourcc), self.fps, self.size
+            )
+            if not self._writer.isOpened():
+                raise RuntimeError(f"Failed to open video writer: {self.output_path}")
+        elif (w, h) != self.size:
+            pixels = cv2.resize(pixels, self.size, interpolation=cv2.INTER_AREA)
+            self.resized += 1
+
+        self._writer.write(cv2.cvtColor(pixels, cv2.COLOR_RGB2BGR) if rgb else pixels)
+        self.count += 1
+
+    def close(self) -> None:
+        if self._writer is None:
+            return
+        self._writer.release()
+        self._writer = None
+        if self.resized:
+            logger.warning("Scaled %d frames of a different size to %dx%d.", self.resized, *self.size)
+        logger.info("Video saved to: %s", self.output_path)
+
+    def __enter__(self) -> "VideoEncoder":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+def frames_to_video(
+    frames: Sequence[Union[str, AsciiFrame]],
+    output_path: Union[str, Path] = "out.mp4",
+    fps: int = 12,
+    font_path: Optional[str] = None,
+    font_size: int = 14,
+    default_fg=(255, 255, 255),
+    default_bg=(0, 0, 0),
+    color_boost: float = 1.0,
+) -> Path:
+    """Render ASCII/ANSI frames straight into a video, without image files.
+
+    Takes the same rendering options as `frames_to_images`. Returns the
+    `output_path`.
+    """
+    font = load_font(font_path, font_size)
+    atlas = GlyphAtlas(font)
+
+    bar_format="{l_bar}{bar} | {percentage:3.0f}% | {n_fmt}/{total_fmt} | {elapsed} → {remaining}"
+
+    with VideoEncoder(output_path, fps) as video:
+        for frame in tqdm(frames, bar_format=bar_format, total=len(frames), desc="Encoding video"):
+            pixels = render_frame_array(frame, font, default_fg, default_bg, color_boost, atlas)
+            if pixels is not None:
+                video.write(pixels)
+
+    if video.count == 0:
+        raise RuntimeError("No frames to encode")
+    return Path(output_path)
+
+
 def images_to_video(
     img_dir_or_list: Union[str, Path, Sequence[str]],
     output_path: Union[str, Path] = "out.mp4",
@@ -308,18 +500,12 @@ def images_to_video(
         logger.error("No image files found in the specified directory/list.")
         raise FileNotFoundError("No image files found for video creation")
 
-    # read first image to get dimensions
-    first_frame = cv2.imread(files[0])
-    
-    if first_frame is None:
+    # the first image must be readable, it gives the video size
+    if cv2.imread(files[0]) is None:
         logger.error("Error reading image file: %s", files[0])
         raise RuntimeError(f"Failed to read image file: {files[0]}")
 
-    height, width, _ = first_frame.shape
-    
-    # create video writer
-    fourcc = cv2.VideoWriter_fourcc(*'mp4v')
-    video = cv2.VideoWriter(str(out_path), fourcc, fps, (width, height))
+    video = VideoEncoder(out_path, fps)
     try:
         for f in files:
             img = cv2.imread(f)
@@ -328,12 +514,11 @@ def images_to_video(
                 logger.warning("Skipping unreadable image file: %s", f)
                 continue
             
-            video.write(img)
+            video.write(img, rgb=False)
     except Exception as e:
         logger.error("Error during video creation: %s", e)
         raise
     finally:
-        video.release()
+        video.close()
 
-    logger.info("Video saved to: %s", out_path)
     return out_path
\ No newline at end of file
@@ -0,0 +1,134 @@
+"""Playback of stored `.asciv` containers in the terminal.
+
+Frames come straight from the container, so playback only reads and
+writes: no video decoding and no ASCII conversion. Each frame is shown at
+its stored timestamp (scaled by `speed`) against the wall clock; when the
+terminal can't keep up, frames that are already late are skipped instead of
+slowing playback down.
+"""
+
+from __future__ import annotations
+
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional, Union
+
+from ..core.sinks import FrameSink, TerminalSink
+from ..core.time_manager import FPSController
+from ..log import get_logger
+from .container import FrameContainer
+
+logger = get_logger(__name__)
+
+
+@dataclass
+class PlaybackStats:
+    """Counters of a playback run."""
+
+    shown: int = 0
+    skipped: int = 0
+    loops: int = 0
+
+
+class ContainerPlayer:
+    """
+    Plays a container on a sink (the terminal by default).
+
+    - `speed`: playback rate (2.0 = twice as fast).
+    - `start`: position to start from, in seconds.
+    - `loop`: restart from `start` at the end (kiosk mode).
+    """
+
+    def __init__(
+        self,
+        path: Union[str, Path],
+        speed: float = 1.0,
+        start: float = 0.0,
+        loop: bool = False,
+        sink: Optional[FrameSink] = None,
+    ):
+        if speed <= 0:
+            raise ValueError("Playback speed must be positive")
+        self.container = FrameContainer(path)
+        if not len(self.container):
+            self.container.close()
+            raise ValueError(f"{path} has no frames")
+        self.speed = float(speed)
+        self.start = max(0.0, float(start))
+        self.loop = loop
+        self.sink = sink or TerminalSink(status=self.status_line)
+        self.stats = PlaybackStats()
+        self.pacer = FPSController(self.container.fps * self.speed or None)
+        self._position = 0
+
+    def status_line(self) -> str:
+        c = self.container
+        seconds = float(c.timestamps[self._position]) if len(c) else 0.0
+        return (
+            f"Frame {self._position + 1}/{len(c)}  {seconds:6.2f}s / {c.duration:.2f}s  "
+            f"x{self.speed:g}  Skipped: {self.stats.skipped}"
+        )
+
+    def past_end(self) -> bool:
+        """Whether `start` is after the last frame."""
+        c = self.container
+        return self.start > float(c.timestamps[-1]) and self.start >= c.duration
+
+    def _play_once(self) -> None:
+        c = self.container
+        timestamps = c.timestamps
+        first = c.frame_at(self.start)
+        origin = float(timestamps[first])
+        clock = time.perf_counter()
+
+        i = first
+        while i < len(c):
+            # Media time reached on the wall clock
+            now = origin + (time.perf_counter() - clock) * self.speed
+            due = c.frame_at(now)
+            if due > i:
+                # Late: jump to the frame that should be on screen now
+                self.stats.skipped += due - i
+                i = due
+
+            # Deadlines are absolute (start + timestamp), so waits never drift
+            self.pacer.sleep_until(clock + (float(timestamps[i]) - origin) / self.speed)
+
+            self._position = i
+            self.sink.write(c[i])
+            self.stats.shown += 1
+            i += 1
+
+    def play(self) -> PlaybackStats:
+        """Play until the end (forever with `loop`) or Ctrl+C."""
+        if self.past_end():
+            logger.warning(
+                "Start position %.2fs is past the end (%.2fs), nothing to play.",
+                self.start,
+                self.container.duration,
+            )
+            self.container.close()
+            return self.stats
+
+        self.sink.open(self.container.fps * self.speed, paced=True)
+        try:
+            while True:
+                self._play_once()
+                if not self.loop:
+                    break
+                self.stats.loops += 1
+        except KeyboardInterrupt:
+            logger.debug("Playback interrupted by user.")
+        finally:
+            self.sink.close()
+            self.container.close()
+
+        logger.debug(
+            "Playback finished: %d shown, %d skipped, %d loops, jitter (ms): %s",
+            self.stats.shown,
+            self.stats.skipped,
+            self.stats.loops,
+            self.pacer.jitter_percentiles(),
+        )
+        return self.stats
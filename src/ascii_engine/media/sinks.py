@@ -0,0 +1,234 @@
+"""File sinks: export frames while they are being converted.
+
+Each sink writes a frame as soon as it receives it, so exports start right
+away and memory use stays constant however long the source is.
+"""
+
+from __future__ import annotations
+
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from pathlib import Path
+from typing import Deque, List, Optional, Union
+
+import numpy as np
+
+from ..core.frame import AsciiFrame
+from ..core.sinks import FrameSink
+from ..log import get_logger
+from .container import ContainerWriter
+from .media import (
+    DEFAULT_COMPRESS_LEVEL,
+    FrameExporter,
+    VideoEncoder,
+    export_frame,
+    export_pool,
+    save_pixels,
+    write_text_frame,
+)
+
+logger = get_logger(__name__)
+
+
+class TextSink(FrameSink):
+    """Writes every frame to `frame_XXXX.txt` (or `pattern`) in `out_dir`."""
+
+    def __init__(
+        self, out_dir: Union[str, Path] = "output_texts", pattern: str = "frame_{index:04d}.txt"
+    ):
+        self.out_dir = Path(out_dir)
+        self.pattern = pattern
+        self.count = 0
+
+    def open(self, source_fps: float, paced: bool = False) -> None:
+        self.out_dir.mkdir(parents=True, exist_ok=True)
+
+    def write(self, frame: AsciiFrame) -> None:
+        try:
+            write_text_frame(frame, self.out_dir / self.pattern.format(index=self.count))
+            self.count += 1
+        except Exception as e:
+            logger.error("Failed to save file: %s", e)
+
+    def close(self) -> None:
+        logger.info("Saved %d text files to: %s", self.count, self.out_dir)
+
+
+class ImageSink(FrameSink):
+    """Renders every frame to `frame_XXXXX.png` (or `pattern`) in `out_dir`.
+
+    - `workers`: processes rendering and saving frames in the background
+      (0 = in the calling thread). File names follow the frame order either way.
+    - `compress_level` / `palette`: PNG options (see `media.FrameExporter`).
+    """
+
+    def __init__(
+        self,
+        out_dir: Union[str, Path] = "output_frames",
+        font_path: Optional[str] = None,
+        font_size: int = 14,
+        default_fg=(255, 255, 255),
+        default_bg=(0, 0, 0),
+        color_boost: float = 1.0,
+        pattern: str = "frame_{index:05d}.png",
+        workers: int = 0,
+        compress_level: int = DEFAULT_COMPRESS_LEVEL,
+        palette: bool = False,
+    ):
+        self.out_dir = Path(out_dir)
+        self.pattern = pattern
+        self.exporter = FrameExporter(
+            font_path, font_size, default_fg, default_bg, color_boost, compress_level, palette
+        )
+        self.workers = max(0, int(workers))
+        self.pool: Optional[ProcessPoolExecutor] = None
+        self.pending: Deque[Future] = deque()
+        self.created: List[str] = []
+
+    def open(self, source_fps: float, paced: bool = False) -> None:
+        self.out_dir.mkdir(parents=True, exist_ok=True)
+        if self.workers > 1:
+            self.pool = export_pool(self.exporter, self.workers)
+        else:
+            self.exporter.load()
+
+    def render(self, frame: AsciiFrame) -> Optional[np.ndarray]:
+        """RGB pixels of a frame (None when empty)."""
+        return self.exporter.render(frame)
+
+    def _next_path(self) -> str:
+        p = str(self.out_dir / self.pattern.format(index=len(self.created)))
+        self.created.append(p)
+        return p
+
+    def save(self, pixels: Optional[np.ndarray], frame: Optional[AsciiFrame] = None) -> None:
+        """Write already rendered pixels as the next image."""
+        if self.pool is None:
+            self.exporter.save(pixels, self._next_path(), frame)
+            return
+        self._submit(save_pixels, (pixels, self._next_path(), frame))
+
+    def write(self, frame: AsciiFrame) -> None:
+        if self.pool is None:
+            self.save(self.render(frame), frame)
+            return
+        self._submit(export_frame, (frame, self._next_path()))
+
+    def _submit(self, fn, job: tuple) -> None:
+        # Bound the frames in flight so memory stays flat on long sources
+        while len(self.pending) >= self.workers * 2:
+            self.pending.popleft().result()
+        self.pending.append(self.pool.submit(fn, job))
+
+    def close(self) -> None:
+        if self.pool is not None:
+            try:
+                while self.pending:
+                    self.pending.popleft().result()
+            finally:
+                self.pool.shutdown(cancel_futures=True)
+                self.pool = None
+        logger.info("Saved %d images to: %s", len(self.created), self.out_dir)
+
+
+class VideoSink(FrameSink):
+    """Renders frames straight into the video encoder of `output_path`.
+
+    - `frames_dir`: also keep every rendered frame as a PNG there (off by
+      default; the video never reads them back). Use this instead of a
+      separate ImageSink, so each frame is rendered once.
+    - `image_options`: extra ImageSink arguments for those PNGs (`workers`,
+      `compress_level`, `palette`...).
+    """
+
+    def __init__(
+        self,
+        output_path: Union[str, Path] = "out.mp4",
+        fps: int = 12,
+        font_path: Optional[str] = None,
+        frames_dir: Optional[Union[str, Path]] = None,
+        **image_options,
+    ):
+        self.output_path = Path(output_path)
+        self.fps = fps
+        # Renders frames; only saves them when `frames_dir` is set
+        self.images = ImageSink(frames_dir or ".", font_path=font_path, **image_options)
+        self.keep_frames = frames_dir is not None
+        self.video: Optional[VideoEncoder] = None
+
+    def open(self, source_fps: float, paced: bool = False) -> None:
+        if self.keep_frames:
+            self.images.open(source_fps, paced)
+        else:
+            self.images.exporter.load()
+        self.video = VideoEncoder(self.output_path, self.fps)
+
+    def write(self, frame: AsciiFrame) -> None:
+        pixels = self.images.render(frame)
+        if pixels is not None:
+            self.video.write(pixels)
+        if self.keep_frames:
+            self.images.save(pixels, frame)
+
+    def close(self) -> None:
+        if self.keep_frames:
+            self.images.close()
+        if self.video is None or self.video.count == 0:
+            logger.warning("No frames written, skipping video creation.")
+            return
+        self.video.close()
+
+
+class ContainerSink(FrameSink):
+    """
+    Appends every frame to a `.asciv` container (see `media.container`).
+
+    The file is created with the first frame, so a source that yields
+    nothing leaves no empty container behind. Frames keep their own
+    timestamps, relative to the first one, so dropped frames and camera
+    captures play back at the times they were taken.
+    """
+
+    def __init__(
+        self,
+        output_path: Union[str, Path] = "out.asciv",
+        keyframe_interval: int = 48,
+        compress: bool = True,
+    ):
+        self.output_path = Path(output_path)
+        self.keyframe_interval = keyframe_interval
+        self.compress = compress
+        self.writer: Optional[ContainerWriter] = None
+        self.fps = 0.0
+        self.skipped = 0
+        self._origin: Optional[float] = None
+
+    def open(self, source_fps: float, paced: bool = False) -> None:
+        self.fps = source_fps
+
+    def write(self, frame: AsciiFrame) -> None:
+        if self.writer is None:
+            self.writer = ContainerWriter(
+                self.output_path,
+                fps=self.fps,
+                keyframe_interval=self.keyframe_interval,
+                compress=self.compress,
+            )
+        timestamp = None
+        if frame.timestamp is not None:
+            if self._origin is None:
+                self._origin = frame.timestamp
+            timestamp = frame.timestamp - self._origin
+        try:
+            self.writer.write(frame, timestamp)
+        except ValueError:
+            # Grid size changed mid-run (terminal resize); the layout is fixed per file
+            self.skipped += 1
+
+    def close(self) -> None:
+        if self.writer is None:
+            logger.warning("No frames written, skipping %s.", self.output_path)
+            return
+        self.writer.close()
+        if self.skipped:
+            logger.warning("Skipped %d frames with a different grid size.", self.skipped)
@@ -0,0 +1,287 @@
+"""Local TCP server streaming one source to many terminal clients.
+
+The source (a camera, or a video file played in a loop) is captured once,
+on a background thread. Each frame is converted and encoded once per view
+(width, mode) that some client is watching, so clients sharing a view
+share the work. The encoded bytes are then fanned out with asyncio.
+
+Any TCP client works (`nc localhost 7777`). A client can pick its own view
+at any time by sending a line with a width and/or a mode, e.g.
+`120 ansi256`.
+
+Every frame is a full redraw, so a client can skip frames freely. Each
+client has a one-frame slot: a slow client only ever gets the newest frame
+and never holds the others back.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import copy
+import threading
+import time
+from dataclasses import dataclass
+from typing import Dict, Iterable, Optional, Tuple, Union
+
+import cv2
+import numpy as np
+
+from .core import FrameProcessor, Resizer
+from .core.renderer import CLEAR_BELOW, CLEAR_SCREEN, CURSOR_HOME
+from .core.terminal import SYNC_BEGIN, SYNC_END
+from .core.time_manager import Backoff, FPSController
+from .log import get_logger
+from .settings import Mode, get_mode, resolve_mode
+
+logger = get_logger(__name__)
+
+# (columns, mode) of a client's view
+View = Tuple[int, Mode]
+
+MIN_WIDTH = 10
+MAX_WIDTH = 400
+
+
+def parse_view(line: str, current: View) -> View:
+    """Apply a client request such as `120`, `ansi16` or `80 rgb` to `current`.
+
+    Unknown words are ignored.
+    """
+    width, mode = current
+    for token in line.split():
+        if token.isdigit():
+            width = min(max(int(token), MIN_WIDTH), MAX_WIDTH)
+        elif token.upper() in Mode.__members__:
+            mode = resolve_mode(get_mode(token))
+    return width, mode
+
+
+class Client:
+    """A connected viewer: its view and a one-frame output slot."""
+
+    def __init__(self, writer: asyncio.StreamWriter):
+        self.writer = writer
+        self.view: Optional[View] = None
+        self.address = writer.get_extra_info("peername")
+        self.slot: asyncio.Queue = asyncio.Queue(maxsize=1)
+        self.sent = 0
+        self.dropped = 0
+
+    def offer(self, data: bytes) -> None:
+        """Queue a frame, replacing one the client hasn't taken yet."""
+        if self.slot.full():
+            self.slot.get_nowait()
+            self.dropped += 1
+        self.slot.put_nowait(data)
+
+
+@dataclass
+class ServerStats:
+    """Counters of a serve run."""
+
+    captured: int = 0
+    encoded: int = 0
+    clients: int = 0
+
+
+class FrameServer:
+    """
+    Serves `source` converted by `processor` to TCP clients on `host:port`.
+
+    New clients start with the processor's width and mode.
+    """
+
+    def __init__(
+        self,
+        processor: FrameProcessor,
+        source: Union[str, int],
+        host: str = "127.0.0.1",
+        port: int = 7777,
+    ):
+        self.processor = processor
+        self.source = source
+        self.host = host
+        self.port = port
+        self.default_view: View = (processor.target_width, processor.mode)
+        self.stats = ServerStats()
+
+        self.clients: set = set()
+        # Clients per view; read by the capture thread
+        self._views: Dict[View, int] = {}
+        self._lock = threading.Lock()
+        self._converters: Dict[View, FrameProcessor] = {}
+        self._stop = threading.Event()
+
+    # ────────────────────────────────────────────────
+    # Conversion (capture thread)
+    # ────────────────────────────────────────────────
+
+    def views(self) -> Tuple[View, ...]:
+        with self._lock:
+            return tuple(self._views)
+
+    def _converter(self, view: View) -> FrameProcessor:
+        """A copy of the processor that converts to `view`, not capped to this terminal."""
+        converter = self._converters.get(view)
+        if converter is None:
+            converter = copy.copy(self.processor)
+            converter.target_width, converter.mode = view
+            converter.resizer = Resizer(fit_terminal=False)
+            converter.resizer.interpolation = self.processor.resizer.interpolation
+            self._converters[view] = converter
+        return converter
+
+    def encode(self, frame: np.ndarray, views: Iterable[View]) -> Dict[View, bytes]:
+        """Convert and encode `frame` once per view."""
+        encodings: Dict[View, bytes] = {}
+        for view in views:
+            ascii_frame = self._converter(view).process_frame(frame)
+            if ascii_frame is None:
+                continue
+            text = CURSOR_HOME + ascii_frame.to_ansi() + CLEAR_BELOW
+            encodings[view] = SYNC_BEGIN + text.encode("utf-8") + SYNC_END
+            self.stats.encoded += 1
+        return encodings
+
+    def _capture(self, cap: cv2.VideoCapture, loop: asyncio.AbstractEventLoop, done: asyncio.Event) -> None:
+        """Read, convert and publish frames until stopped or the camera fails."""
+        live = not isinstance(self.source, str)
+        pacer = FPSController(None if live else (cap.get(cv2.CAP_PROP_FPS) or 24.0))
+        backoff = Backoff()
+        failures = 0
+        try:
+            while not self._stop.is_set():
+                ok, frame = cap.read()
+                if not ok:
+                    if live:
+                        failures += 1
+                        if failures > 100:
+                            logger.error("Camera stopped delivering frames")
+                            break
+                        backoff.wait()
+                        continue
+                    # Files play in a loop
+                    cap.set(cv2.CAP_PROP_POS_FRAMES, 0)
+                    ok, frame = cap.read()
+                    if not ok:
+                        break
+                failures = 0
+                backoff.reset()
+                self.stats.captured += 1
+
+                views = self.views()
+                if views:
+                    encodings = self.encode(frame, views)
+                    loop.call_soon_threadsafe(self._publish, encodings)
+                pacer.wait_next_frame()
+        except Exception as exc:
+            logger.error("Capture failed: %s", exc)
+        finally:
+            cap.release()
+            loop.call_soon_threadsafe(done.set)
+
+    # ────────────────────────────────────────────────
+    # Clients (event loop)
+    # ────────────────────────────────────────────────
+
+    def _publish(self, encodings: Dict[View, bytes]) -> None:
+        for client in self.clients:
+            data = encodings.get(client.view)
+            if data is not None:
+                client.offer(data)
+
+    def _watch(self, client: Client, view: Optional[View]) -> None:
+        """Move `client` to `view` (None to stop watching)."""
+        with self._lock:
+            old = client.view
+            if old in self._views:
+                self._views[old] -= 1
+                if self._views[old] <= 0:
+                    del self._views[old]
+            if view is not None:
+                self._views[view] = self._views.get(view, 0) + 1
+                client.view = view
+
+    async def _send(self, client: Client) -> None:
+        client.writer.write((CLEAR_SCREEN + CURSOR_HOME).encode())
+        try:
+            while True:
+                data = await client.slot.get()
+                client.writer.write(data)
+                # Only this client waits on a full socket; the others keep going
+                await client.writer.drain()
+                client.sent += 1
+        except ConnectionError:
+            pass
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        client = Client(writer)
+        self._watch(client, self.default_view)
+        self.clients.add(client)
+        self.stats.clients += 1
+        logger.info("Client connected: %s (%d watching)", client.address, len(self.clients))
+
+        sender = asyncio.create_task(self._send(client))
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                view = parse_view(line.decode("utf-8", errors="ignore"), client.view)
+                if view != client.view:
+                    self._watch(client, view)
+                    # The grid size may change: start from a blank screen
+                    writer.write(CLEAR_SCREEN.encode())
+                    logger.debug("Client %s switched to %d columns, %s", client.address, view[0], view[1].name)
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            sender.cancel()
+            self.clients.discard(client)
+            self._watch(client, None)
+            writer.close()
+            logger.info(
+                "Client disconnected: %s (%d frames sent, %d dropped)",
+                client.address,
+                client.sent,
+                client.dropped,
+            )
+
+    async def serve(self) -> None:
+        """Serve until the source ends or the task is cancelled."""
+        self.processor._validate_source(self.source)
+        cap = cv2.VideoCapture(self.source)
+        if not cap.isOpened():
+            raise RuntimeError(f"Failed to open video/camera source: {self.source}")
+
+        loop = asyncio.get_running_loop()
+        done = asyncio.Event()
+        server = await asyncio.start_server(self._handle, self.host, self.port)
+        capture = threading.Thread(target=self._capture, args=(cap, loop, done), name="serve-capture", daemon=True)
+        capture.start()
+        logger.info("Serving on %s:%d (connect with: nc %s %d)", self.host, self.port, self.host, self.port)
+        started = time.perf_counter()
+        try:
+            async with server:
+                await done.wait()
+        finally:
+            self._stop.set()
+            server.close()
+            for client in list(self.clients):
+                client.writer.close()
+            await asyncio.to_thread(capture.join)
+            logger.info(
+                "Server stopped after %.0fs: %d frames captured, %d encodings, %d clients",
+                time.perf_counter() - started,
+                self.stats.captured,
+                self.stats.encoded,
+                self.stats.clients,
+            )
+
+    def run(self) -> ServerStats:
+        """Blocking `serve`, stopped with Ctrl+C."""
+        try:
+            asyncio.run(self.serve())
+        except KeyboardInterrupt:
+            logger.debug("Server interrupted by user.")
+        return self.stats
@@ -1,7 +1,7 @@
 from .defaults import DEFAULT_RAW_SETTINGS
 from .loader import AppSettings
 from .manager import SettingsManager
-from .modes import get_mode, Mode
+from .modes import get_mode, resolve_mode, Mode
 from .gradients import Gradient, get_gradient, get_gradient_ramp
 
 __all__ = [
@@ -10,6 +10,7 @@ __all__ = [
     "SettingsManager",
     "Mode",
     "get_mode",
+    "resolve_mode",
     "Gradient",
     "get_gradient",
     "get_gradient_ramp",
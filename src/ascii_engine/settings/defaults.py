@@ -7,4 +7,20 @@ DEFAULT_RAW_SETTINGS = {
     "scale_factor": 0.50,
     "mode": Mode.RGB.name,
     "gradient": Gradient.DETAILED.name,
+    "color_runs": False,
+    "color_tolerance": 0,
+    "brightness": 0,
+    "contrast": 1.0,
+    "gamma": 1.0,
+    "invert": False,
+    "threads": 1,
+    "pipeline_workers": 0,
+    "sync_playback": True,
+    "adaptive_quality": False,
+    "export_workers": 0,
+    "png_compress_level": 6,
+    "png_palette": False,
+    "cache_size_mb": 0,
+    "cache_dir": ".ascii_cache",
+    "cache_hash_contents": False,
 }
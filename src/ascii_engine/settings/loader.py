@@ -6,6 +6,14 @@ from .defaults import DEFAULT_RAW_SETTINGS
 
 from typing import Any
 
+
+def to_bool(value: Any) -> bool:
+    """Parse booleans coming from JSON or text prompts ("true", "yes", "1"...)."""
+    if isinstance(value, str):
+        return value.strip().lower() in ("1", "true", "yes", "y", "on")
+    return bool(value)
+
+
 # Mutable settings at runtime
 @dataclass(frozen=False) 
 class AppSettings:
@@ -15,6 +23,22 @@ class AppSettings:
     scale_factor: float
     mode: Mode
     gradient: Gradient
+    color_runs: bool = False
+    color_tolerance: int = 0
+    brightness: int = 0
+    contrast: float = 1.0
+    gamma: float = 1.0
+    invert: bool = False
+    threads: int = 1
+    pipeline_workers: int = 0
+    sync_playback: bool = True
+    adaptive_quality: bool = False
+    export_workers: int = 0
+    png_compress_level: int = 6
+    png_palette: bool = False
+    cache_size_mb: int = 0
+    cache_dir: str = ".ascii_cache"
+    cache_hash_contents: bool = False
 
     @classmethod
     def default(cls) -> 'AppSettings':
@@ -25,6 +49,22 @@ class AppSettings:
             scale_factor=DEFAULT_RAW_SETTINGS["scale_factor"],
             mode=Mode.RGB,
             gradient=Gradient.DETAILED,
+            color_runs=DEFAULT_RAW_SETTINGS["color_runs"],
+            color_tolerance=DEFAULT_RAW_SETTINGS["color_tolerance"],
+            brightness=DEFAULT_RAW_SETTINGS["brightness"],
+            contrast=DEFAULT_RAW_SETTINGS["contrast"],
+            gamma=DEFAULT_RAW_SETTINGS["gamma"],
+            invert=DEFAULT_RAW_SETTINGS["invert"],
+            threads=DEFAULT_RAW_SETTINGS["threads"],
+            pipeline_workers=DEFAULT_RAW_SETTINGS["pipeline_workers"],
+            sync_playback=DEFAULT_RAW_SETTINGS["sync_playback"],
+            adaptive_quality=DEFAULT_RAW_SETTINGS["adaptive_quality"],
+            export_workers=DEFAULT_RAW_SETTINGS["export_workers"],
+            png_compress_level=DEFAULT_RAW_SETTINGS["png_compress_level"],
+            png_palette=DEFAULT_RAW_SETTINGS["png_palette"],
+            cache_size_mb=DEFAULT_RAW_SETTINGS["cache_size_mb"],
+            cache_dir=DEFAULT_RAW_SETTINGS["cache_dir"],
+            cache_hash_contents=DEFAULT_RAW_SETTINGS["cache_hash_contents"],
         )
     
     @classmethod
@@ -39,6 +79,22 @@ class AppSettings:
             scale_factor=float(data["scale_factor"]),
             mode=get_mode(data["mode"]),
             gradient=get_gradient(data["gradient"]),
+            color_runs=to_bool(data["color_runs"]),
+            color_tolerance=int(data["color_tolerance"]),
+            brightness=int(data["brightness"]),
+            contrast=float(data["contrast"]),
+            gamma=float(data["gamma"]),
+            invert=to_bool(data["invert"]),
+            threads=max(1, int(data["threads"])),
+            pipeline_workers=max(0, int(data["pipeline_workers"])),
+            sync_playback=to_bool(data["sync_playback"]),
+            adaptive_quality=to_bool(data["adaptive_quality"]),
+            export_workers=max(0, int(data["export_workers"])),
+            png_compress_level=min(max(int(data["png_compress_level"]), 0), 9),
+            png_palette=to_bool(data["png_palette"]),
+            cache_size_mb=max(0, int(data["cache_size_mb"])),
+            cache_dir=str(data["cache_dir"]),
+            cache_hash_contents=to_bool(data["cache_hash_contents"]),
         )
 
     def update(self, updates: dict[str, Any]) -> None:
@@ -55,6 +111,15 @@ class AppSettings:
                     setattr(self, key, int(value))
                 elif key == "scale_factor":
                     setattr(self, key, float(value))
+                elif key == "color_runs":
+                    setattr(self, key, to_bool(value))
+                elif key in ("color_tolerance", "brightness", "threads", "pipeline_workers", "cache_size_mb",
+                             "export_workers", "png_compress_level"):
+                    setattr(self, key, int(value))
+                elif key in ("contrast", "gamma"):
+                    setattr(self, key, float(value))
+                elif key in ("invert", "sync_playback", "adaptive_quality", "cache_hash_contents", "png_palette"):
+                    setattr(self, key, to_bool(value))
                 else:
                     setattr(self, key, value)
 
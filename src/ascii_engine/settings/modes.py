@@ -1,5 +1,6 @@
 from enum import Enum, auto
 from ..log import get_logger
+from ..utils.console import get_color_depth
 
 
 logger = get_logger(__name__)
@@ -12,8 +13,13 @@ class Mode(Enum):
     RGB        = auto()
     GRAYSCALE  = auto()
     ASCII      = auto()
-    # Add more in the future without breaking almost anything
-    # BLOCK      = auto()
+    ANSI256    = auto()  # xterm-256 palette, "\033[38;5;Nm"
+    ANSI16     = auto()  # basic 16 colors, "\033[3Xm" / "\033[9Xm"
+    AUTO       = auto()  # resolved from the terminal color depth
+    # Sub-cell modes: several pixels per terminal cell
+    HALFBLOCK  = auto()  # 1×2 pixels, "▀" with fg/bg colour
+    QUADRANT   = auto()  # 2×2 pixels, quadrant blocks
+    BRAILLE    = auto()  # 2×4 pixels, Braille dots
 
 
 def get_mode(name: str) -> Mode:
@@ -32,4 +38,18 @@ def get_mode(name: str) -> Mode:
             ", ".join(m.name for m in Mode),
         )
         return Mode.RGB
-    
\ No newline at end of file
+    
+
+def resolve_mode(mode: Mode) -> Mode:
+    """
+    Resolve Mode.AUTO to the cheapest color mode the terminal can display.
+
+    Other modes are returned unchanged.
+    """
+    if mode != Mode.AUTO:
+        return mode
+
+    depth = get_color_depth()
+    resolved = {24: Mode.RGB, 8: Mode.ANSI256, 4: Mode.ANSI16}.get(depth, Mode.ASCII)
+    logger.debug("Terminal color depth %s bits → mode %s", depth, resolved.name)
+    return resolved
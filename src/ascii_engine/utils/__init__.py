@@ -1,5 +1,12 @@
 from .source_dialog import get_source_via_dialog
-from .console import clear_screen, clear_console, get_terminal_size
+from .console import (
+    clear_screen,
+    clear_console,
+    get_terminal_size,
+    get_color_depth,
+    watch_terminal_resize,
+    terminal_resize_count,
+)
 from .styles import COLORS, init_colors
 
 __all__ = [
@@ -7,5 +14,8 @@ __all__ = [
     "clear_screen",
     "clear_console",
     "get_terminal_size",
+    "get_color_depth",
+    "watch_terminal_resize",
+    "terminal_resize_count",
     "COLORS", "init_colors",
 ]
@@ -1,4 +1,7 @@
+import os
 import shutil
+import signal
+import threading
 from functools import wraps
 
 def clear_screen(func):
@@ -27,3 +30,57 @@ def get_terminal_size() -> tuple[int, int]:
         return size.columns, size.lines
     except Exception:
         return 80, 24  # Safe fallback
+
+
+# Incremented on every SIGWINCH once `watch_terminal_resize` is installed
+_resize_count = 0
+_resize_watched = False
+
+
+def _on_resize(signum, frame, previous=None) -> None:
+    global _resize_count
+    _resize_count += 1
+    if callable(previous):
+        previous(signum, frame)
+
+
+def watch_terminal_resize() -> bool:
+    """
+    Install a SIGWINCH handler counting terminal resizes (POSIX only).
+    Returns False when resizes can't be watched (Windows, non-main thread).
+    """
+    global _resize_watched
+    if _resize_watched:
+        return True
+    if not hasattr(signal, "SIGWINCH") or threading.current_thread() is not threading.main_thread():
+        return False
+    try:
+        previous = signal.getsignal(signal.SIGWINCH)
+        signal.signal(signal.SIGWINCH, lambda s, f: _on_resize(s, f, previous))
+    except (ValueError, OSError):
+        return False
+    _resize_watched = True
+    return True
+
+
+def terminal_resize_count() -> int:
+    """Number of terminal resizes seen since `watch_terminal_resize`."""
+    return _resize_count
+
+
+
+def get_color_depth() -> int:
+    """
+    Guess how many color bits the terminal supports from its environment.
+    Returns 24 (truecolor), 8 (xterm-256), 4 (ANSI-16) or 1 (no color).
+    """
+    colorterm = os.environ.get("COLORTERM", "").lower()
+    term = os.environ.get("TERM", "").lower()
+
+    if os.environ.get("NO_COLOR") or term == "dumb":
+        return 1
+    if colorterm in ("truecolor", "24bit") or os.environ.get("WT_SESSION"):
+        return 24
+    if "256color" in term:
+        return 8
+    return 4
@@ -1,3 +1,4 @@
+import json
 import sys
 from ascii_engine.app import AppEngine
 from ascii_engine.log import setup_logging
@@ -22,16 +23,28 @@ def main() -> None:
             output_path=args.output,
             dry_run=args.dry_run,
             source_type=args.type,
+            jobs=args.jobs,
+            saves=args.save,
         )
+    elif args.command == "play":
+        app.play(args.input, speed=args.speed, start=args.start, loop=args.loop)
+    elif args.command == "serve":
+        app.serve(args.input, host=args.host, port=args.port)
     elif args.command == "status":
         # show basic status information
         app.settings = app.config_manager.load_normalized()
+        if args.json:
+            print(json.dumps(app.status(), indent=2))
+            return
         print("Application settings:")
         try:
             for k, v in vars(app.settings).items():
                 print(f" - {k}: {v}")
         except Exception:
             print(app.settings)
+        print("Frame cache:")
+        for k, v in app.status()["cache"].items():
+            print(f" - {k}: {v}")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,51 @@
+import sys
+from pathlib import Path
+
+import cv2
+import numpy as np
+import pytest
+
+# Run against the sources without installing the package
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from ascii_engine.core import FrameProcessor  # noqa: E402
+from ascii_engine.core.resizer import Resizer  # noqa: E402
+from ascii_engine.settings import Gradient, Mode  # noqa: E402
+
+
+def make_image(seed: int, height: int = 48, width: int = 64) -> np.ndarray:
+    """BGR test image: gradients plus noise, different for every seed."""
+    rng = np.random.default_rng(seed)
+    y, x = np.mgrid[0:height, 0:width]
+    base = np.stack([x * 4 + seed * 7, y * 5 + seed * 3, (x + y) * 2 + seed * 11], axis=-1)
+    noise = rng.integers(0, 40, size=(height, width, 3))
+    return ((base + noise) % 256).astype(np.uint8)
+
+
+@pytest.fixture(scope="session")
+def video_path(tmp_path_factory) -> str:
+    """30-frame MJPG clip whose frames all differ."""
+    path = tmp_path_factory.mktemp("media") / "clip.avi"
+    writer = cv2.VideoWriter(str(path), cv2.VideoWriter_fourcc(*"MJPG"), 10, (64, 48))
+    assert writer.isOpened()
+    for i in range(30):
+        writer.write(make_image(i))
+    writer.release()
+    return str(path)
+
+
+@pytest.fixture(scope="session")
+def make_processor():
+    """FrameProcessor factory with a terminal-independent output size."""
+
+    def build(mode: Mode = Mode.RGB, **kwargs) -> FrameProcessor:
+        return FrameProcessor(
+            target_width=32,
+            scale=0.5,
+            sequence=Gradient.DETAILED,
+            mode=mode,
+            resizer=Resizer(fit_terminal=False),
+            **kwargs,
+        )
+
+    return build
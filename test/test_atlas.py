@@ -0,0 +1,25 @@
+from pathlib import Path
+
+import numpy as np
+from PIL import ImageFont
+
+from ascii_engine.core.subcell import BRAILLE_CHARS
+from ascii_engine.media.atlas import GlyphAtlas
+
+FONT = Path(__file__).resolve().parent.parent / "assets" / "fonts" / "JetBrainsMonoNerdFont-Bold.ttf"
+
+
+def test_braille_patterns_are_drawn_as_dots():
+    atlas = GlyphAtlas(ImageFont.truetype(str(FONT), 14))
+    indices = atlas.charset_indices(BRAILLE_CHARS)
+    masks = atlas.masks[indices]
+
+    # Blank pattern, then ink growing with the number of dots
+    assert masks[0].max() == 0
+    ink = masks.reshape(256, -1).sum(axis=1)
+    dots = np.array([bin(bits).count("1") for bits in range(256)])
+    for count in range(1, 9):
+        assert np.ptp(ink[dots == count]) <= ink[1] // 4
+    assert ink[0xFF] > 7 * ink[0x01]
+    # Every pattern has its own mask (no shared fallback glyph)
+    assert len({mask.tobytes() for mask in masks}) == 256
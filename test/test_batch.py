@@ -0,0 +1,47 @@
+import json
+import shutil
+
+import cv2
+
+from ascii_engine.batch import _output_dirs, expand_inputs, is_batch_input, run_batch
+
+from conftest import make_image
+
+
+def make_inputs(root, video_path):
+    (root / "sub").mkdir(parents=True)
+    for i, name in enumerate(["a.png", "b.jpg", "sub/a.png"]):
+        cv2.imwrite(str(root / name), make_image(i))
+    shutil.copy(video_path, root / "clip.avi")
+    (root / "notes.txt").write_text("not media")
+    (root / "broken.png").write_bytes(b"not an image")
+
+
+def test_expand_inputs(tmp_path, video_path):
+    make_inputs(tmp_path / "in", video_path)
+    names = [p.replace(str(tmp_path / "in"), "") for p in expand_inputs(str(tmp_path / "in"))]
+    assert names == ["/a.png", "/b.jpg", "/broken.png", "/clip.avi", "/sub/a.png"]
+    assert is_batch_input(str(tmp_path / "in")) and is_batch_input(str(tmp_path / "*.png"))
+    assert len(expand_inputs(str(tmp_path / "in" / "**" / "a.png"))) == 2
+
+
+def test_output_names_are_unique(tmp_path):
+    dirs = _output_dirs(["x/a.png", "y/a.png", "b.jpg"], tmp_path)
+    assert [d.name for d in dirs.values()] == ["a", "a_1", "b"]
+
+
+def test_run_batch(tmp_path, video_path, make_processor):
+    make_inputs(tmp_path / "in", video_path)
+    out = tmp_path / "out"
+    paths = expand_inputs(str(tmp_path / "in"))
+    summary = run_batch(paths, make_processor(), out, outputs=["text", "container"], jobs=2)
+
+    assert (summary.files, summary.succeeded, summary.failed) == (5, 4, 1)
+    assert summary.frames == 3 + 30
+    assert summary.failures[0]["path"].endswith("broken.png")
+    assert json.loads((out / "batch_summary.json").read_text())["succeeded"] == 4
+    assert (out / "a.txt").is_file() and (out / "a_1.txt").is_file()
+    assert len(list((out / "clip" / "text").iterdir())) == 30
+    assert (out / "clip.asciv").is_file()
+    # Still images have no container output
+    assert not (out / "a.asciv").exists()
@@ -0,0 +1,98 @@
+import json
+from concurrent.futures import ProcessPoolExecutor
+
+import cv2
+import numpy as np
+
+from ascii_engine.core import FrameCache
+from ascii_engine.core.cache import STATS_FILE
+from ascii_engine.settings import Mode
+
+from conftest import make_image
+
+
+def planes(frame):
+    return [getattr(frame, name) for name in ("glyphs", "colors", "background")]
+
+
+def assert_same_frames(left, right):
+    assert len(left) == len(right)
+    for a, b in zip(left, right):
+        assert a.mode == b.mode and a.charset == b.charset
+        for x, y in zip(planes(a), planes(b)):
+            assert (x is None) == (y is None)
+            if x is not None:
+                np.testing.assert_array_equal(x, y)
+
+
+def test_hit_equals_miss(tmp_path, video_path, make_processor):
+    for mode in (Mode.RGB, Mode.ASCII, Mode.QUADRANT):
+        cache = FrameCache(tmp_path / "cache")
+        processor = make_processor(mode, cache=cache)
+        missed = list(processor.iter_frames(video_path))
+        hit = list(processor.iter_frames(video_path))
+
+        assert (cache.hits, cache.misses) == (1, 1)
+        assert len(missed) == 30
+        assert_same_frames(missed, hit)
+        assert processor.source_fps == 10.0
+
+
+def test_settings_change_the_key(tmp_path, video_path, make_processor):
+    cache = FrameCache(tmp_path / "cache")
+    list(make_processor(Mode.RGB, cache=cache).iter_frames(video_path))
+    list(make_processor(Mode.ANSI256, cache=cache).iter_frames(video_path))
+    assert (cache.hits, cache.misses) == (0, 2)
+    assert cache.status()["entries"] == 2
+
+
+def test_still_images_are_not_cached(tmp_path, make_processor):
+    image = tmp_path / "still.png"
+    cv2.imwrite(str(image), make_image(0))
+    cache = FrameCache(tmp_path / "cache")
+    frames = list(make_processor(cache=cache).iter_frames(str(image)))
+    assert len(frames) == 1
+    assert cache.status()["entries"] == 0
+
+
+def test_entry_larger_than_cache_is_dropped(tmp_path, video_path, make_processor):
+    cache = FrameCache(tmp_path / "cache", max_bytes=20_000)
+    list(make_processor(Mode.ASCII, cache=cache).iter_frames(video_path))
+    assert cache.status()["entries"] == 1
+
+    # Colour planes make the clip too large: it must not evict the first entry
+    list(make_processor(Mode.RGB, cache=cache).iter_frames(video_path))
+    status = cache.status()
+    assert status["entries"] == 1
+    assert status["size_bytes"] <= 20_000
+    assert not [p for p in (tmp_path / "cache").iterdir() if p.name.startswith(".tmp-")]
+
+
+def test_eviction_keeps_recent_entries(tmp_path, video_path, make_processor):
+    modes = (Mode.ASCII, Mode.GRAYSCALE, Mode.ANSI256, Mode.ANSI16)
+    cache = FrameCache(tmp_path / "cache", max_bytes=40_000)
+    for mode in modes:
+        list(make_processor(mode, cache=cache).iter_frames(video_path))
+        assert cache.status()["size_bytes"] <= 40_000
+
+    # The newest entry survives
+    cache.hits = 0
+    list(make_processor(modes[-1], cache=cache).iter_frames(video_path))
+    assert cache.hits == 1
+
+
+def _lookups(root: str) -> int:
+    cache = FrameCache(root)
+    for i in range(25):
+        cache.get(f"missing-{i}")
+    return cache.misses
+
+
+def test_concurrent_statistics_are_not_lost(tmp_path):
+    root = str(tmp_path / "cache")
+    with ProcessPoolExecutor(max_workers=4) as pool:
+        total = sum(pool.map(_lookups, [root] * 8))
+
+    stats = json.loads((tmp_path / "cache" / STATS_FILE).read_text())
+    assert total == stats["misses"] == 200
+    assert stats["hits"] == 0
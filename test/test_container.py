@@ -0,0 +1,137 @@
+import numpy as np
+import pytest
+
+from ascii_engine.core import Converter, ListSink
+from ascii_engine.core.converter import charset_for
+from ascii_engine.core.frame import AsciiFrame
+from ascii_engine.media import ContainerPlayer, ContainerSink, ContainerWriter, FrameContainer
+from ascii_engine.settings import Gradient, Mode, get_gradient_ramp
+
+
+def frames(mode: Mode, count: int = 20):
+    """Frames that change a little at a time, like a video."""
+    rng = np.random.default_rng(0)
+    converter = Converter()
+    ramp = get_gradient_ramp(Gradient.DETAILED)
+    gray = rng.integers(0, 256, size=(16, 24), dtype=np.uint8)
+    color = rng.integers(0, 256, size=(16, 24, 3), dtype=np.uint8)
+    out = []
+    for i in range(count):
+        gray[i % 16] = rng.integers(0, 256, size=24)
+        color[:, i % 24] = rng.integers(0, 256, size=(16, 3))
+        glyphs, colors, background = converter.cells(gray, color, ramp, mode)
+        out.append(AsciiFrame(glyphs, colors, charset_for(mode, ramp), mode, converter, background))
+    return out
+
+
+def assert_same(a: AsciiFrame, b: AsciiFrame) -> None:
+    assert a.mode == b.mode and a.charset == b.charset
+    for name in ("glyphs", "colors", "background"):
+        left, right = getattr(a, name), getattr(b, name)
+        assert (left is None) == (right is None)
+        if left is not None:
+            np.testing.assert_array_equal(left, right)
+
+
+def write(path, source, fps=12.0, **kwargs) -> ContainerWriter:
+    writer = ContainerWriter(path, fps=fps, keyframe_interval=4, **kwargs)
+    for frame in source:
+        writer.write(frame)
+    return writer
+
+
+@pytest.mark.parametrize("mode", [Mode.RGB, Mode.ASCII, Mode.GRAYSCALE, Mode.HALFBLOCK], ids=lambda m: m.name)
+@pytest.mark.parametrize("compress", [True, False])
+def test_round_trip(tmp_path, mode, compress):
+    source = frames(mode)
+    write(tmp_path / "out.asciv", source, compress=compress).close()
+
+    with FrameContainer(tmp_path / "out.asciv") as container:
+        assert len(container) == len(source)
+        assert container.fps == 12.0
+        np.testing.assert_allclose(container.timestamps, np.arange(len(source)) / 12.0)
+        for original, stored in zip(source, container):
+            assert_same(original, stored)
+        # Random access, backwards across keyframes
+        for i in reversed(range(len(source))):
+            assert_same(source[i], container[i])
+
+
+def test_unclosed_file_is_scanned(tmp_path):
+    source = frames(Mode.RGB)
+    writer = write(tmp_path / "open.asciv", source)
+    writer._file.flush()
+    try:
+        with FrameContainer(tmp_path / "open.asciv") as container:
+            assert len(container) == len(source)
+            for original, stored in zip(source, container):
+                assert_same(original, stored)
+    finally:
+        writer.close()
+
+
+def test_truncated_record_is_dropped(tmp_path):
+    source = frames(Mode.RGB)
+    path = tmp_path / "cut.asciv"
+    writer = write(path, source)
+    writer._file.flush()
+    data = path.read_bytes()
+    writer.close()
+    path.write_bytes(data[:-10])
+
+    with FrameContainer(path) as container:
+        assert len(container) == len(source) - 1
+        assert_same(source[-2], container[len(container) - 1])
+
+
+def test_empty_container_is_rejected(tmp_path):
+    ContainerWriter(tmp_path / "empty.asciv").close()
+    with pytest.raises(ValueError):
+        FrameContainer(tmp_path / "empty.asciv")
+    with pytest.raises(ValueError):
+        ContainerPlayer(tmp_path / "empty.asciv", sink=ListSink())
+
+
+def test_sink_without_frames_leaves_no_file(tmp_path):
+    sink = ContainerSink(tmp_path / "none.asciv")
+    sink.open(10.0)
+    sink.close()
+    assert not (tmp_path / "none.asciv").exists()
+
+
+def test_sink_keeps_frame_timestamps(tmp_path):
+    # Capture times with gaps, e.g. frames dropped by the scheduler
+    times = [5.0, 5.1, 5.45, 5.5, 6.2]
+    source = frames(Mode.RGB, count=len(times))
+    for frame, at in zip(source, times):
+        frame.timestamp = at
+
+    sink = ContainerSink(tmp_path / "timed.asciv")
+    sink.open(10.0)
+    for frame in source:
+        sink.write(frame)
+    sink.close()
+
+    with FrameContainer(tmp_path / "timed.asciv") as container:
+        expected = [at - times[0] for at in times]
+        np.testing.assert_allclose(container.timestamps, expected)
+        assert [frame.timestamp for frame in container] == pytest.approx(expected)
+
+
+def test_player_start_past_end(tmp_path):
+    source = frames(Mode.ASCII, count=6)
+    write(tmp_path / "short.asciv", source, fps=1000.0).close()
+
+    sink = ListSink()
+    stats = ContainerPlayer(tmp_path / "short.asciv", start=10.0, loop=True, sink=sink).play()
+    assert stats.shown == 0 and not sink.frames
+
+
+def test_player_shows_every_frame(tmp_path):
+    source = frames(Mode.ASCII, count=6)
+    write(tmp_path / "short.asciv", source, fps=1000.0).close()
+
+    sink = ListSink()
+    stats = ContainerPlayer(tmp_path / "short.asciv", sink=sink).play()
+    assert stats.shown + stats.skipped == len(source)
+    assert_same(source[-1], sink.frames[-1])
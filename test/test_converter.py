@@ -0,0 +1,154 @@
+import pickle
+import re
+import threading
+
+import numpy as np
+import pytest
+
+from ascii_engine.core import Converter, ToneMap
+from ascii_engine.core import converter as converter_module
+from ascii_engine.core.converter import ConversionEngine, charset_for
+from ascii_engine.core.frame import AsciiFrame
+from ascii_engine.core.subcell import SUBCELL_SIZE
+from ascii_engine.settings import Gradient, Mode, get_gradient_ramp
+
+COLOR_MODES = [Mode.RGB, Mode.GRAYSCALE, Mode.ASCII, Mode.ANSI256, Mode.ANSI16]
+SGR = re.compile(r"\033\[[0-9;]*m")
+
+
+def planes(seed: int = 0, height: int = 80, width: int = 50):
+    rng = np.random.default_rng(seed)
+    gray = rng.integers(0, 256, size=(height, width), dtype=np.uint8)
+    color = rng.integers(0, 256, size=(height, width, 3), dtype=np.uint8)
+    # Flat areas, so runs of equal colours exist
+    color[:20, :25] = (10, 200, 30)
+    gray[:20, :25] = 128
+    return gray, color
+
+
+@pytest.mark.parametrize("gradient", list(Gradient), ids=lambda g: g.name)
+@pytest.mark.parametrize("mode", COLOR_MODES, ids=lambda m: m.name)
+def test_vectorized_matches_reference(mode, gradient):
+    gray, color = planes()
+    ramp = get_gradient_ramp(gradient)
+    reference = Converter(engine=ConversionEngine.REFERENCE).convert(gray, color, ramp, mode)
+    assert Converter(engine=ConversionEngine.VECTORIZED).convert(gray, color, ramp, mode) == reference
+
+
+@pytest.mark.parametrize("mode", [Mode.RGB, Mode.ANSI256, Mode.ANSI16], ids=lambda m: m.name)
+def test_coalesced_output_is_shorter_with_same_text(mode):
+    gray, color = planes(2)
+    ramp = get_gradient_ramp(Gradient.BASIC)
+    plain = Converter().convert(gray, color, ramp, mode)
+    coalesced = Converter(coalesce=True).convert(gray, color, ramp, mode)
+
+    assert len(coalesced) < len(plain)
+    assert SGR.sub("", coalesced) == SGR.sub("", plain)
+    # One reset per line
+    assert all(line.endswith("\033[0m") for line in coalesced.split("\n"))
+
+
+def test_coalesced_runs_write_one_escape_per_colour_change():
+    gray = np.full((2, 6), 200, dtype=np.uint8)
+    color = np.zeros((2, 6, 3), dtype=np.uint8)
+    color[:, 3:] = (0, 0, 255)
+    text = Converter(coalesce=True).convert(gray, color, "@ ", Mode.RGB)
+    assert text.split("\n")[0] == "\033[38;2;0;0;0m@@@\033[38;2;255;0;0m@@@\033[0m"
+
+
+def test_tolerance_merges_nearly_equal_colours():
+    gray = np.full((1, 8), 200, dtype=np.uint8)
+    color = np.zeros((1, 8, 3), dtype=np.uint8)
+    color[0, ::2] = (2, 2, 2)
+    exact = Converter(coalesce=True).convert(gray, color, "@ ", Mode.RGB)
+    loose = Converter(coalesce=True, tolerance=4).convert(gray, color, "@ ", Mode.RGB)
+    assert len(SGR.findall(exact)) == 9
+    assert len(SGR.findall(loose)) == 2
+
+
+@pytest.mark.parametrize("mode", COLOR_MODES + list(SUBCELL_SIZE), ids=lambda m: m.name)
+@pytest.mark.parametrize("dtype", [np.float32, np.float64, np.int32])
+def test_other_pixel_types_keep_every_option(mode, dtype):
+    gray, color = planes(4, height=80, width=48)
+    converter = Converter(coalesce=True, tolerance=2)
+    tone = ToneMap(brightness=20, contrast=1.3)
+    expected = converter.convert(gray, color, get_gradient_ramp(Gradient.BASIC), mode, tone)
+
+    # Fractions are truncated and out-of-range values clipped, like uint8 pixels
+    offset = 0.6 if np.issubdtype(dtype, np.floating) else 0
+    wide_gray = gray.astype(dtype) + offset
+    wide_color = color.astype(dtype) + offset
+    wide_gray[gray == 0], wide_gray[gray == 255] = -30, 400
+    text = converter.convert(wide_gray, wide_color, get_gradient_ramp(Gradient.BASIC), mode, tone)
+    assert text == expected
+
+
+def test_unsupported_pixel_type_is_rejected():
+    with pytest.raises(TypeError):
+        Converter().convert(np.full((4, 4), "x"), None, "@ ", Mode.ASCII)
+    with pytest.raises(TypeError):
+        Converter().convert(np.ones((4, 4), dtype=bool), None, "@ ", Mode.ASCII)
+
+
+@pytest.mark.parametrize("mode", COLOR_MODES + list(SUBCELL_SIZE), ids=lambda m: m.name)
+def test_frame_serializes_like_convert(mode):
+    gray, color = planes(3)
+    ramp = get_gradient_ramp(Gradient.DETAILED)
+    converter = Converter()
+    glyphs, colors, background = converter.cells(gray, color, ramp, mode)
+    frame = AsciiFrame(glyphs, colors, charset_for(mode, ramp), mode, converter, background)
+    assert frame.to_ansi() == converter.convert(gray, color, ramp, mode)
+    if mode in COLOR_MODES:
+        assert frame.to_text() == SGR.sub("", frame.to_ansi())
+    assert frame.to_pixels().shape == (*frame.shape, 3)
+
+
+@pytest.mark.parametrize("gradient", [Gradient.BASIC, Gradient.FILLED], ids=lambda g: g.name)
+@pytest.mark.parametrize("mode", COLOR_MODES, ids=lambda m: m.name)
+@pytest.mark.parametrize("coalesce", [False, True])
+def test_threaded_matches_vectorized(mode, gradient, coalesce):
+    gray, color = planes()
+    ramp = get_gradient_ramp(gradient)
+    threaded = Converter(engine=ConversionEngine.THREADED, coalesce=coalesce, workers=4)
+    # 80 rows make four bands, so the band joins are covered
+    assert len(threaded._bands(gray.shape[0])) == 4
+    vectorized = Converter(coalesce=coalesce).convert(gray, color, ramp, mode)
+    assert threaded.convert(gray, color, ramp, mode) == vectorized
+
+
+@pytest.mark.parametrize("mode", list(SUBCELL_SIZE), ids=lambda m: m.name)
+@pytest.mark.parametrize("coalesce", [False, True])
+def test_threaded_matches_vectorized_subcell(mode, coalesce):
+    gray, color = planes(1, height=160, width=60)
+    ramp = get_gradient_ramp(Gradient.DETAILED)
+    vectorized = Converter(coalesce=coalesce).convert(gray, color, ramp, mode)
+    threaded = Converter(ConversionEngine.THREADED, coalesce=coalesce, workers=4)
+    assert threaded.convert(gray, color, ramp, mode) == vectorized
+
+
+def test_threaded_pool_is_created_once(monkeypatch):
+    created = []
+
+    class CountingPool(converter_module.ThreadPoolExecutor):
+        def __init__(self, *args, **kwargs):
+            created.append(self)
+            super().__init__(*args, **kwargs)
+
+    monkeypatch.setattr(converter_module, "ThreadPoolExecutor", CountingPool)
+    gray, color = planes()
+    ramp = get_gradient_ramp(Gradient.BASIC)
+    # A pickled copy starts without a pool but with a working lock
+    threaded = pickle.loads(pickle.dumps(Converter(ConversionEngine.THREADED, workers=4)))
+    expected = Converter().convert(gray, color, ramp, Mode.RGB)
+
+    results = []
+    threads = [
+        threading.Thread(target=lambda: results.append(threaded.convert(gray, color, ramp, Mode.RGB)))
+        for _ in range(8)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert results == [expected] * 8
+    assert len(created) == 1
@@ -0,0 +1,74 @@
+from pathlib import Path
+
+import numpy as np
+import pytest
+from PIL import Image
+
+from ascii_engine.media import frames_to_images
+from ascii_engine.media.media import FrameExporter, palette_image
+from ascii_engine.settings import Mode
+
+
+def pixels_of(path) -> np.ndarray:
+    return np.asarray(Image.open(path).convert("RGB"))
+
+
+@pytest.fixture(scope="module")
+def mode_frames(video_path, make_processor):
+    return {
+        mode: next(iter(make_processor(mode).iter_frames(video_path)))
+        for mode in (Mode.ASCII, Mode.GRAYSCALE, Mode.ANSI256, Mode.RGB)
+    }
+
+
+def test_palette_image_is_lossless():
+    rng = np.random.default_rng(0)
+    gray = np.repeat(rng.integers(0, 256, size=(20, 30, 1), dtype=np.uint8), 3, axis=2)
+    colors = rng.integers(0, 256, size=(200, 3), dtype=np.uint8)
+    few = colors[rng.integers(0, 200, size=(20, 30))]
+    for pixels in (gray, few):
+        img = palette_image(pixels)
+        assert img.mode == "P"
+        np.testing.assert_array_equal(np.asarray(img.convert("RGB")), pixels)
+
+    many = rng.integers(0, 256, size=(20, 30, 3), dtype=np.uint8)
+    assert palette_image(many) is None
+
+
+@pytest.mark.parametrize("mode", [Mode.ASCII, Mode.GRAYSCALE, Mode.ANSI256, Mode.RGB], ids=lambda m: m.name)
+def test_palette_output_matches_rgb_output(tmp_path, mode_frames, mode):
+    frame = mode_frames[mode]
+    plain = FrameExporter(palette=False).export(frame, tmp_path / "plain.png")
+    small = FrameExporter(palette=True).export(frame, tmp_path / "palette.png")
+
+    np.testing.assert_array_equal(pixels_of(small), pixels_of(plain))
+    assert Image.open(plain).mode == "RGB"
+    # Only the modes that usually fit in 256 colours try a palette
+    assert Image.open(small).mode == ("P" if mode in (Mode.ASCII, Mode.GRAYSCALE) else "RGB")
+
+
+def test_compress_level_trades_size_for_speed(tmp_path, mode_frames):
+    frame = mode_frames[Mode.RGB]
+    fast = FrameExporter(compress_level=0).export(frame, tmp_path / "fast.png")
+    small = FrameExporter(compress_level=9).export(frame, tmp_path / "small.png")
+    assert (tmp_path / "fast.png").stat().st_size > (tmp_path / "small.png").stat().st_size
+    np.testing.assert_array_equal(pixels_of(fast), pixels_of(small))
+    assert FrameExporter(compress_level=12).compress_level == 9
+    assert FrameExporter(compress_level=-1).compress_level == 0
+
+
+def test_empty_frame_saves_a_placeholder(tmp_path):
+    exporter = FrameExporter(default_bg=(1, 2, 3))
+    exporter.save(None, tmp_path / "empty.png")
+    pixels = pixels_of(tmp_path / "empty.png")
+    assert pixels.shape == (10, 10, 3) and (pixels == (1, 2, 3)).all()
+
+
+def test_parallel_export_keeps_order_and_output(tmp_path, video_path, make_processor):
+    frames = list(make_processor(Mode.ANSI256).iter_frames(video_path))[:10]
+    serial = frames_to_images(frames, tmp_path / "serial", palette=True)
+    parallel = frames_to_images(frames, tmp_path / "parallel", workers=2, palette=True)
+
+    assert [Path(p).name for p in parallel] == [Path(p).name for p in serial]
+    for left, right in zip(serial, parallel):
+        np.testing.assert_array_equal(pixels_of(left), pixels_of(right))
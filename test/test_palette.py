@@ -0,0 +1,49 @@
+import numpy as np
+import pytest
+
+from ascii_engine.core.palette import CUBE_SIZE, nearest_code, quantize, xterm_256_to_rgb
+
+PALETTE_CODES = {256: np.arange(16, 256), 16: np.arange(16)}
+
+
+def brute_force(rgb: np.ndarray, colors: int):
+    """Nearest palette entry by exhaustive search: (codes, distances)."""
+    codes = PALETTE_CODES[colors]
+    palette = np.array([xterm_256_to_rgb(int(c)) for c in codes], dtype=np.float64)
+    dist = np.linalg.norm(rgb[:, None, :].astype(np.float64) - palette[None], axis=2)
+    return codes[dist.argmin(axis=1)], dist.min(axis=1)
+
+
+def distance(rgb: np.ndarray, codes: np.ndarray) -> np.ndarray:
+    palette = np.array([xterm_256_to_rgb(int(c)) for c in codes], dtype=np.float64)
+    return np.linalg.norm(rgb.astype(np.float64) - palette, axis=1)
+
+
+@pytest.mark.parametrize("colors", [256, 16])
+def test_bucket_centres_are_exact(colors):
+    step = 256 // CUBE_SIZE
+    axis = np.arange(CUBE_SIZE) * step + step // 2
+    rgb = np.stack(np.meshgrid(axis, axis, axis, indexing="ij"), axis=-1).reshape(-1, 3)
+    expected, expected_dist = brute_force(rgb, colors)
+    got = quantize(rgb[:, None, ::-1].astype(np.uint8), colors)[:, 0]
+    # Ties may pick either entry; the distance must be the minimum
+    np.testing.assert_allclose(distance(rgb, got), expected_dist, atol=1e-6)
+    assert (got == expected).mean() > 0.99
+
+
+@pytest.mark.parametrize("colors", [256, 16])
+def test_any_colour_is_within_one_bucket_of_nearest(colors):
+    rgb = np.random.default_rng(0).integers(0, 256, size=(5000, 3))
+    _, best = brute_force(rgb, colors)
+    got = quantize(rgb[:, None, ::-1].astype(np.uint8), colors)[:, 0]
+    # Off by at most twice the distance from a colour to its bucket centre
+    bound = 2 * np.sqrt(3) * (256 // CUBE_SIZE) / 2
+    assert (distance(rgb, got) <= best + bound).all()
+
+
+@pytest.mark.parametrize("colors", [256, 16])
+def test_scalar_lookup_matches_quantize(colors):
+    rgb = np.random.default_rng(1).integers(0, 256, size=(500, 3))
+    got = quantize(rgb[:, None, ::-1].astype(np.uint8), colors)[:, 0]
+    assert [nearest_code(r, g, b, colors) for r, g, b in rgb] == got.tolist()
+    assert got.max() < colors and (colors == 16 or got.min() >= 16)
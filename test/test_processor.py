@@ -0,0 +1,108 @@
+import cv2
+import numpy as np
+import pytest
+
+from ascii_engine.core import ConversionEngine, Converter, ListSink, parallel
+from ascii_engine.settings import Mode
+
+from conftest import make_image
+
+
+def texts(frames):
+    return [frame.to_ansi() for frame in frames]
+
+
+@pytest.fixture(scope="module")
+def serial(video_path, make_processor):
+    return texts(make_processor().iter_frames(video_path))
+
+
+def test_frames_differ(serial):
+    # Ordering checks below are only meaningful if every frame is distinct
+    assert len(serial) == 30
+    assert len(set(serial)) == 30
+
+
+@pytest.mark.parametrize("workers", [1, 2, 4])
+def test_pipeline_keeps_order(video_path, make_processor, serial, workers):
+    processor = make_processor(pipeline_workers=workers)
+    assert texts(processor.iter_frames(video_path)) == serial
+    assert processor.pipeline is None
+
+
+def test_run_streams_every_frame_to_sinks(video_path, make_processor, serial):
+    sinks = [ListSink(), ListSink()]
+    count = make_processor(pipeline_workers=2).run(video_path, sinks)
+
+    assert count == 30
+    for sink in sinks:
+        assert texts(sink.frames) == serial
+
+
+@pytest.mark.parametrize("jobs", [2, 3])
+def test_segments_keep_order(video_path, make_processor, serial, jobs, monkeypatch):
+    # Small segments, so there are more of them than workers
+    monkeypatch.setattr(parallel.split_segments, "__defaults__", (4,))
+    assert len(parallel.split_segments(30, jobs)) > jobs * 2
+    processor = make_processor(jobs=jobs)
+    assert texts(processor.iter_frames(video_path)) == serial
+
+
+@pytest.mark.parametrize("total,jobs", [(30, 3), (7, 4), (1, 2), (500, 2)])
+def test_split_segments_cover_every_frame(total, jobs):
+    ranges = parallel.split_segments(total, jobs, max_frames=64)
+    assert ranges[0][0] == 0 and ranges[-1][1] is None
+    for (_, stop), (start, _) in zip(ranges, ranges[1:]):
+        assert stop == start
+    starts = [start for start, _ in ranges]
+    assert all(b - a <= 64 for a, b in zip(starts, starts[1:]))
+
+
+@pytest.mark.parametrize("options", [{}, {"pipeline_workers": 2}, {"jobs": 2}], ids=["serial", "pipeline", "segments"])
+def test_frames_carry_source_timestamps(video_path, make_processor, options):
+    frames = list(make_processor(**options).iter_frames(video_path))
+    assert [frame.timestamp for frame in frames] == pytest.approx([i / 10 for i in range(30)])
+
+
+def test_segment_frames_use_the_parent_encoder(video_path, make_processor):
+    converter = Converter(engine=ConversionEngine.THREADED, workers=2)
+    processor = make_processor(jobs=2, ascii_converter=converter)
+    frames = list(processor.iter_frames(video_path))
+    assert len(frames) == 30
+    assert all(frame.encoder is converter for frame in frames)
+
+
+def test_prepare_frame_resizes_once_to_the_grid(make_processor, monkeypatch):
+    processor = make_processor()
+    calls = []
+    resize = processor.resizer.resize
+    monkeypatch.setattr(processor.resizer, "resize", lambda image, size: calls.append(size) or resize(image, size))
+
+    image = make_image(0, height=480, width=640)
+    gray, color = processor.prepare_frame(image)
+    assert calls == [(32, 12)]
+    assert gray.shape == (12, 32) and color.shape == (12, 32, 3)
+    np.testing.assert_array_equal(gray, cv2.cvtColor(color, cv2.COLOR_BGR2GRAY))
+
+
+def test_prepare_frame_normalizes_channels(make_processor):
+    processor = make_processor()
+    image = make_image(1, height=480, width=640)
+    gray, color = processor.prepare_frame(image)
+
+    bgra = cv2.cvtColor(image, cv2.COLOR_BGR2BGRA)
+    np.testing.assert_array_equal(processor.prepare_frame(bgra)[1], color)
+    single = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
+    small_gray, small_color = processor.prepare_frame(single)
+    assert small_color.shape == (12, 32, 3)
+    np.testing.assert_array_equal(small_color[..., 0], small_gray)
+
+
+def test_prepare_frame_mirror_and_subcells(make_processor):
+    image = make_image(2, height=480, width=640)
+    gray, _ = make_processor().prepare_frame(image)
+    mirrored, _ = make_processor(mirror=True).prepare_frame(image)
+    np.testing.assert_array_equal(mirrored, gray[:, ::-1])
+
+    braille, _ = make_processor(Mode.BRAILLE).prepare_frame(image)
+    assert braille.shape == (12 * 4, 32 * 2)
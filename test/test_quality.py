@@ -0,0 +1,84 @@
+import cv2
+import pytest
+
+from ascii_engine.core.quality import QualityController, QualityLevel, quality_levels
+from ascii_engine.settings import Mode
+
+
+def controller(levels: int = 4, **kwargs) -> QualityController:
+    ladder = [QualityLevel(100 - i * 10, Mode.RGB, cv2.INTER_AREA) for i in range(levels)]
+    options = dict(smoothing_alpha=1.0, down_after=3, up_after=5)
+    options.update(kwargs)
+    # 10 fps: a 100 ms budget
+    return QualityController(10.0, ladder, **options)
+
+
+def feed(quality: QualityController, seconds: float, frames: int) -> list:
+    return [quality.update(seconds) for _ in range(frames)]
+
+
+def test_ladder_gets_cheaper_step_by_step():
+    levels = quality_levels(100, Mode.RGB, cv2.INTER_AREA)
+    assert levels[0] == QualityLevel(100, Mode.RGB, cv2.INTER_AREA)
+    assert [level.interpolation for level in levels[1:3]] == [cv2.INTER_LINEAR, cv2.INTER_NEAREST]
+    assert [level.mode for level in levels[3:5]] == [Mode.ANSI256, Mode.ANSI16]
+    assert [level.width for level in levels[5:]] == [85, 70, 55, 40]
+    assert len(set(levels)) == len(levels)
+
+
+def test_ladder_skips_steps_that_do_not_apply():
+    levels = quality_levels(22, Mode.ASCII, cv2.INTER_NEAREST)
+    assert levels == [QualityLevel(22, Mode.ASCII, cv2.INTER_NEAREST), QualityLevel(20, Mode.ASCII, cv2.INTER_NEAREST)]
+
+
+def test_target_fps_must_be_positive():
+    with pytest.raises(ValueError):
+        QualityController(0, quality_levels(80, Mode.RGB, cv2.INTER_AREA))
+
+
+def test_load_between_thresholds_keeps_the_level():
+    quality = controller()
+    assert feed(quality, 0.08, 200) == [None] * 200
+    assert quality.index == 0 and quality.changes == 0
+
+
+def test_lowers_only_after_consecutive_slow_frames():
+    quality = controller()
+    assert feed(quality, 0.2, 2) == [None, None]
+    # One fast frame resets the count
+    assert quality.update(0.01) is None
+    assert feed(quality, 0.2, 3) == [None, None, quality.levels[1]]
+    assert quality.index == 1
+
+
+def test_raises_after_a_longer_quiet_period():
+    quality = controller()
+    feed(quality, 0.2, 3)
+    assert feed(quality, 0.02, 4) == [None] * 4
+    assert quality.update(0.02) == quality.levels[0]
+
+
+def test_cheapest_level_is_the_floor():
+    quality = controller(levels=2)
+    feed(quality, 0.5, 30)
+    assert quality.index == 1 and quality.changes == 1
+
+
+def test_upgrade_that_does_not_hold_doubles_the_wait():
+    quality = controller()
+    feed(quality, 0.2, 3)
+    feed(quality, 0.02, 5)
+    assert quality.index == 0
+
+    # Too slow again: back down, and the next upgrade waits twice as long
+    feed(quality, 0.2, 3)
+    assert quality.index == 1 and quality.up_after == 10
+    assert feed(quality, 0.02, 9) == [None] * 9
+    assert quality.update(0.02) == quality.levels[0]
+
+    # Undone again, so the wait keeps growing
+    feed(quality, 0.2, 6)
+    assert quality.index == 2 and quality.up_after == 20
+    # Two upgrades in a row restore the normal wait
+    feed(quality, 0.02, 40)
+    assert quality.index == 0 and quality.up_after == 5
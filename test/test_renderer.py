@@ -0,0 +1,119 @@
+import re
+
+import numpy as np
+import pytest
+
+from ascii_engine.core import Converter
+from ascii_engine.core.converter import charset_for
+from ascii_engine.core.renderer import DiffRenderer
+from ascii_engine.settings import Gradient, Mode, get_gradient_ramp
+
+CONTROL = re.compile(r"\033\[([0-9;]*)([A-Za-z])|(\n)|(.)", re.S)
+
+
+class VirtualTerminal:
+    """Just enough of a terminal to compare what two outputs leave on screen."""
+
+    def __init__(self, rows: int, columns: int):
+        self.rows, self.columns = rows, columns
+        self.cells = [[(" ", None, None)] * columns for _ in range(rows)]
+        self.row = self.col = 0
+        self.fg = self.bg = None
+
+    def _clear(self, start_row: int, start_col: int) -> None:
+        for y in range(start_row, self.rows):
+            for x in range(start_col if y == start_row else 0, self.columns):
+                self.cells[y][x] = (" ", None, None)
+
+    def _sgr(self, params: str) -> None:
+        codes = [int(p) for p in params.split(";") if p] or [0]
+        i = 0
+        while i < len(codes):
+            code = codes[i]
+            if code == 0:
+                self.fg = self.bg = None
+            elif code in (38, 48):
+                size = 4 if codes[i + 1] == 2 else 2
+                value = tuple(codes[i + 1 : i + 1 + size])
+                if code == 38:
+                    self.fg = value
+                else:
+                    self.bg = value
+                i += size
+            elif 30 <= code <= 37 or 90 <= code <= 97:
+                self.fg = (code,)
+            elif 40 <= code <= 47 or 100 <= code <= 107:
+                self.bg = (code,)
+            i += 1
+
+    def feed(self, text: str) -> "VirtualTerminal":
+        for match in CONTROL.finditer(text):
+            params, command, newline, char = match.groups()
+            if newline:
+                self.row, self.col = self.row + 1, 0
+            elif char is not None:
+                self.cells[self.row][self.col] = (char, self.fg, self.bg)
+                self.col += 1
+            elif command == "H":
+                row, _, col = params.partition(";")
+                self.row, self.col = int(row or 1) - 1, int(col or 1) - 1
+            elif command == "J":
+                self._clear(*((0, 0) if params == "2" else (self.row, self.col)))
+            elif command == "m":
+                self._sgr(params)
+        return self
+
+
+def frames(mode: Mode, count: int = 12, seed: int = 0):
+    """Cell planes of a sequence where a few random blocks change each frame."""
+    rng = np.random.default_rng(seed)
+    converter = Converter()
+    ramp = get_gradient_ramp(Gradient.BASIC)
+    gray = rng.integers(0, 256, size=(24, 40), dtype=np.uint8)
+    color = rng.integers(0, 256, size=(24, 40, 3), dtype=np.uint8)
+    if mode in (Mode.HALFBLOCK, Mode.QUADRANT):
+        gray = np.repeat(np.repeat(gray, 2, axis=0), 2, axis=1)
+        color = np.repeat(np.repeat(color, 2, axis=0), 2, axis=1)
+    for _ in range(count):
+        for _ in range(3):
+            y, x = rng.integers(0, gray.shape[0] - 4), rng.integers(0, gray.shape[1] - 6)
+            gray[y : y + 4, x : x + 6] = rng.integers(0, 256)
+            color[y : y + 4, x : x + 6] = rng.integers(0, 256, size=3)
+        yield converter.cells(gray, color, ramp, mode), charset_for(mode, ramp)
+
+
+@pytest.mark.parametrize(
+    "mode", [Mode.RGB, Mode.GRAYSCALE, Mode.ASCII, Mode.ANSI256, Mode.ANSI16, Mode.HALFBLOCK, Mode.QUADRANT],
+    ids=lambda m: m.name,
+)
+@pytest.mark.parametrize("coalesce", [False, True])
+def test_diff_output_matches_full_redraw(mode, coalesce):
+    renderer = DiffRenderer(Converter(coalesce=coalesce), keyframe_interval=1000)
+    screen = VirtualTerminal(40, 100)
+    sizes = []
+    for (glyphs, colors, background), charset in frames(mode):
+        output = renderer.render(glyphs, colors, charset, mode, background)
+        sizes.append(len(output))
+        screen.feed(output)
+
+        full = DiffRenderer(Converter(coalesce=coalesce)).render(glyphs, colors, charset, mode, background)
+        assert screen.cells == VirtualTerminal(40, 100).feed(full).cells
+
+    # Only the first frame is a full redraw
+    assert max(sizes[1:]) < sizes[0]
+
+
+def test_unchanged_frame_writes_only_cursor_move():
+    renderer = DiffRenderer()
+    (glyphs, colors, background), charset = next(frames(Mode.RGB))
+    renderer.render(glyphs, colors, charset, Mode.RGB, background)
+    assert renderer.render(glyphs, colors, charset, Mode.RGB, background) == f"\033[{glyphs.shape[0] + 1};1H"
+
+
+def test_style_change_forces_full_redraw():
+    renderer = DiffRenderer()
+    (glyphs, colors, _), charset = next(frames(Mode.ANSI256))
+    renderer.render(glyphs, colors, charset, Mode.ANSI256)
+    # Same planes, but the colour values mean something else in ANSI16
+    output = renderer.render(glyphs, colors % 16, charset, Mode.ANSI16)
+    assert output.startswith("\033[H")
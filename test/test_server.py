@@ -0,0 +1,122 @@
+import asyncio
+import re
+import socket
+
+import pytest
+
+from ascii_engine.core.terminal import SYNC_BEGIN, SYNC_END
+from ascii_engine.server import MAX_WIDTH, MIN_WIDTH, Client, FrameServer, parse_view
+from ascii_engine.settings import Mode
+
+from conftest import make_image
+
+ESCAPE = re.compile(r"\033\[[0-9;?]*[A-Za-z]")
+
+
+class FakeWriter:
+    def get_extra_info(self, name):
+        return ("127.0.0.1", 1234)
+
+
+def grid(data: bytes) -> list:
+    """Text rows of one encoded frame."""
+    assert data.startswith(SYNC_BEGIN) and data.endswith(SYNC_END)
+    text = data[len(SYNC_BEGIN) : -len(SYNC_END)].decode("utf-8")
+    return ESCAPE.sub("", text).split("\n")
+
+
+@pytest.mark.parametrize(
+    "line,view",
+    [
+        ("120", (120, Mode.RGB)),
+        ("ansi16", (80, Mode.ANSI16)),
+        ("40 ascii", (40, Mode.ASCII)),
+        ("please 60 thanks", (60, Mode.RGB)),
+        ("3", (MIN_WIDTH, Mode.RGB)),
+        ("99999", (MAX_WIDTH, Mode.RGB)),
+        ("", (80, Mode.RGB)),
+    ],
+)
+def test_parse_view(line, view):
+    assert parse_view(line, (80, Mode.RGB)) == view
+
+
+def test_encode_once_per_view(make_processor):
+    server = FrameServer(make_processor(), source=0)
+    views = [(32, Mode.RGB), (20, Mode.ASCII)]
+    encodings = server.encode(make_image(0), views)
+
+    assert set(encodings) == set(views)
+    assert server.stats.encoded == 2
+    for (width, _), data in encodings.items():
+        assert {len(row) for row in grid(data) if row} == {width}
+    # Only the colour view carries colour escapes
+    assert b"\033[38;2;" in encodings[(32, Mode.RGB)]
+    assert b"\033[38" not in encodings[(20, Mode.ASCII)]
+    # Converters are kept per view, and the server's processor is untouched
+    server.encode(make_image(1), views)
+    assert len(server._converters) == 2
+    assert (server.processor.target_width, server.processor.mode) == (32, Mode.RGB)
+
+
+def test_clients_sharing_a_view_share_the_work(make_processor):
+    server = FrameServer(make_processor(), source=0)
+    first, second = Client(FakeWriter()), Client(FakeWriter())
+    server._watch(first, (32, Mode.RGB))
+    server._watch(second, (32, Mode.RGB))
+    assert server.views() == ((32, Mode.RGB),)
+
+    server._watch(second, (20, Mode.ANSI16))
+    assert set(server.views()) == {(32, Mode.RGB), (20, Mode.ANSI16)}
+    server._watch(first, None)
+    assert server.views() == ((20, Mode.ANSI16),)
+
+
+def test_slow_client_only_keeps_the_newest_frame():
+    client = Client(FakeWriter())
+    for data in (b"1", b"2", b"3"):
+        client.offer(data)
+    assert client.slot.get_nowait() == b"3"
+    assert client.dropped == 2
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+async def next_frame(reader: asyncio.StreamReader) -> bytes:
+    await reader.readuntil(SYNC_BEGIN)
+    return SYNC_BEGIN + await reader.readuntil(SYNC_END)
+
+
+def test_clients_receive_their_own_views(video_path, make_processor):
+    server = FrameServer(make_processor(), video_path, port=free_port())
+
+    async def scenario():
+        serve = asyncio.create_task(server.serve())
+        for _ in range(100):
+            try:
+                connections = [await asyncio.open_connection(server.host, server.port) for _ in range(2)]
+                break
+            except ConnectionError:
+                await asyncio.sleep(0.02)
+        (wide, _), (narrow, narrow_writer) = connections
+        narrow_writer.write(b"20 ascii\n")
+        await narrow_writer.drain()
+
+        rows = grid(await next_frame(wide))
+        # Frames already queued before the switch may still arrive
+        for _ in range(20):
+            narrow_rows = grid(await next_frame(narrow))
+            if len(narrow_rows[0]) == 20:
+                break
+        serve.cancel()
+        await asyncio.gather(serve, return_exceptions=True)
+        return rows, narrow_rows
+
+    rows, narrow_rows = asyncio.run(asyncio.wait_for(scenario(), 20))
+    assert {len(row) for row in rows if row} == {32}
+    assert {len(row) for row in narrow_rows if row} == {20}
+    assert server.stats.clients == 2
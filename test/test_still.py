@@ -0,0 +1,52 @@
+import cv2
+import numpy as np
+import pytest
+
+from ascii_engine.core.still import image_size, is_still_image, read_image, reduction_factor
+
+from conftest import make_image
+
+
+@pytest.fixture
+def photo(tmp_path):
+    path = tmp_path / "photo.jpg"
+    image = cv2.resize(make_image(0), (1600, 1200), interpolation=cv2.INTER_LINEAR)
+    cv2.imwrite(str(path), image)
+    return str(path)
+
+
+def test_still_image_types():
+    assert is_still_image("a/b.JPG") and is_still_image("x.png")
+    assert not is_still_image("clip.mp4") and not is_still_image("anim.gif")
+
+
+@pytest.mark.parametrize(
+    "size,needed,factor",
+    [((1600, 1200), (32, 12), 8), ((1600, 1200), (200, 75), 4), ((400, 300), (120, 60), 1), ((640, 480), (160, 60), 2)],
+)
+def test_reduction_keeps_twice_the_needed_size(size, needed, factor):
+    assert reduction_factor(size, needed) == factor
+
+
+def test_reduced_decode(photo):
+    assert image_size(photo) == (1600, 1200)
+    assert read_image(photo, 8).shape == (150, 200, 3)
+    assert read_image(photo).shape == (1200, 1600, 3)
+    assert image_size("missing.jpg") is None
+
+
+def test_processor_decodes_stills_once_at_reduced_size(photo, make_processor, monkeypatch):
+    factors = []
+    monkeypatch.setattr(
+        "ascii_engine.core.processor.read_image",
+        lambda path, factor=1: factors.append(factor) or read_image(path, factor),
+    )
+    processor = make_processor()
+    frames = list(processor.iter_frames(photo))
+
+    assert factors == [8]
+    assert len(frames) == 1 and frames[0].shape == (12, 32)
+    assert processor.source_fps == 0.0
+    # Same grid as converting the full-resolution decode
+    full = processor.process_frame(cv2.imread(photo))
+    assert np.mean(full.glyphs != frames[0].glyphs) < 0.2
@@ -0,0 +1,91 @@
+import io
+import os
+import threading
+
+from ascii_engine.core.terminal import SYNC_BEGIN, SYNC_END, TerminalWriter
+
+
+class BlockingStream(io.StringIO):
+    """Text stream whose first write waits until `release` is set."""
+
+    def __init__(self):
+        super().__init__()
+        self.writing = threading.Event()
+        self.release = threading.Event()
+
+    def write(self, text: str) -> int:
+        self.writing.set()
+        self.release.wait(5)
+        return super().write(text)
+
+
+def synced(*frames: str) -> str:
+    return "".join(SYNC_BEGIN.decode() + frame + SYNC_END.decode() for frame in frames)
+
+
+def test_frames_are_written_in_order_with_sync_markers():
+    stream = io.StringIO()
+    writer = TerminalWriter(stream)
+    assert writer.fd is None
+    for frame in ("one", "two", "three"):
+        writer.submit(frame)
+    writer.close()
+
+    assert stream.getvalue() == synced("one", "two", "three")
+    assert writer.frames == 3
+    assert 1 <= writer.writes <= 3
+
+
+def test_unsynchronized_output_is_unchanged():
+    stream = io.StringIO()
+    writer = TerminalWriter(stream, synchronized=False)
+    writer.submit("\033[Hframe ✓")
+    writer.close()
+    assert stream.getvalue() == "\033[Hframe ✓"
+
+
+def test_large_frames_reach_a_pipe_intact():
+    read_fd, write_fd = os.pipe()
+    received = bytearray()
+
+    def drain():
+        while True:
+            chunk = os.read(read_fd, 4096)
+            if not chunk:
+                return
+            received.extend(chunk)
+
+    reader = threading.Thread(target=drain)
+    reader.start()
+    with os.fdopen(write_fd, "w") as stream:
+        writer = TerminalWriter(stream)
+        assert writer.fd == write_fd
+        # Larger than a pipe buffer: each frame takes several rounds of the reader
+        frames = ["".join(chr(0x2800 + (i + j) % 256) for j in range(100_000)) for i in range(3)]
+        for frame in frames:
+            writer.submit(frame)
+        writer.close()
+    reader.join()
+    os.close(read_fd)
+
+    assert received.decode("utf-8") == synced(*frames)
+
+
+def test_replace_discards_frames_not_written_yet():
+    stream = BlockingStream()
+    writer = TerminalWriter(stream, max_pending=10)
+    writer.submit("first")
+    assert stream.writing.wait(5)
+
+    # The writer is busy with the first frame; these pile up in the back buffer
+    writer.submit("delta-1")
+    writer.submit("delta-2")
+    assert writer.congested
+    writer.submit("full", replace=True)
+    assert writer.pending_bytes == len(synced("full").encode())
+
+    stream.release.set()
+    writer.close()
+    assert stream.getvalue() == synced("first", "full")
+    assert writer.replaced == 1 and writer.frames == 4
+    assert not writer.congested
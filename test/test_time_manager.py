@@ -0,0 +1,165 @@
+import cv2
+import pytest
+
+from ascii_engine.core import time_manager
+from ascii_engine.core.time_manager import Backoff, FPSController, FrameScheduler
+
+
+class FakeClock:
+    """Stand-in for the `time` module: sleeps advance the clock instantly."""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def perf_counter(self) -> float:
+        # Every reading takes a microsecond, so spin loops terminate
+        self.now += 1e-6
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.now += max(0.0, seconds)
+
+
+class FakeCapture:
+    """Video of `count` frames at `fps`, reporting timestamps like OpenCV."""
+
+    def __init__(self, count: int, fps: float):
+        self.count, self.fps = count, fps
+        self.position = 0
+        self.retrieved = []
+
+    def grab(self) -> bool:
+        if self.position >= self.count:
+            return False
+        self.position += 1
+        return True
+
+    def retrieve(self):
+        self.retrieved.append(self.position - 1)
+        return True, self.position - 1
+
+    def get(self, prop):
+        assert prop == cv2.CAP_PROP_POS_MSEC
+        return (self.position - 1) * 1000.0 / self.fps
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeClock()
+    monkeypatch.setattr(time_manager, "time", fake)
+    return fake
+
+
+def play(clock, cap, scheduler, work: float):
+    """Read every frame, spending `work` seconds on each one."""
+    shown = []
+    while True:
+        ok, frame = scheduler.read(cap)
+        if not ok:
+            return shown
+        shown.append((frame, clock.now))
+        clock.sleep(work)
+
+
+def test_fast_consumer_sees_every_frame_on_time(clock):
+    cap, scheduler = FakeCapture(50, 10.0), FrameScheduler(10.0)
+    shown = play(clock, cap, scheduler, work=0.01)
+
+    assert [frame for frame, _ in shown] == list(range(50))
+    assert scheduler.stats.dropped == 0
+    start = shown[0][1]
+    for frame, at in shown:
+        assert at - start == pytest.approx(frame * 0.1, abs=1e-3)
+
+
+def test_slow_consumer_skips_late_frames_before_decoding(clock):
+    cap, scheduler = FakeCapture(100, 10.0), FrameScheduler(10.0)
+    shown = play(clock, cap, scheduler, work=0.35)
+
+    stats = scheduler.stats
+    assert stats.shown == len(shown) == len(cap.retrieved)
+    assert stats.shown + stats.dropped == 100
+    # About one frame in 3.5 is shown, and skipped frames are never decoded
+    assert 25 <= stats.shown <= 32
+    assert cap.retrieved == [frame for frame, _ in shown]
+    # Playback stays on the source clock
+    start = shown[0][1]
+    for frame, at in shown:
+        assert at - start == pytest.approx(frame * 0.1, abs=0.36)
+
+
+def test_shown_frames_report_their_source_time(clock):
+    cap, scheduler = FakeCapture(40, 10.0), FrameScheduler(10.0)
+    times = []
+    while True:
+        ok, frame = scheduler.read(cap)
+        if not ok:
+            break
+        times.append((frame, scheduler.timestamp))
+        clock.sleep(0.25)
+
+    assert scheduler.stats.dropped > 0
+    for frame, timestamp in times:
+        assert timestamp == pytest.approx(frame * 0.1)
+
+
+def test_drops_in_a_row_are_bounded(clock):
+    cap, scheduler = FakeCapture(100, 10.0), FrameScheduler(10.0, max_drop=3)
+    shown = play(clock, cap, scheduler, work=2.0)
+
+    frames = [frame for frame, _ in shown]
+    assert all(b - a <= 4 for a, b in zip(frames, frames[1:]))
+    assert scheduler.stats.late > 0
+
+
+def test_pacing_follows_an_absolute_schedule(clock):
+    pacer = FPSController(20.0)
+    wakeups = []
+    for i in range(100):
+        pacer.wait_next_frame()
+        wakeups.append(clock.now)
+        # Uneven work, always shorter than a frame
+        clock.sleep(0.01 + (i % 7) * 0.005)
+
+    start = wakeups[0]
+    for k, at in enumerate(wakeups):
+        assert at - start == pytest.approx(k * 0.05, abs=1e-3)
+    assert pacer.resyncs == 0
+    assert max(pacer.jitter) < 1e-3
+
+
+def test_pacing_skips_missed_slots_after_a_stall(clock):
+    pacer = FPSController(20.0)
+    pacer.wait_next_frame()
+    start = clock.now
+    clock.sleep(0.33)
+    wakeups = []
+    for _ in range(5):
+        pacer.wait_next_frame()
+        wakeups.append(clock.now - start)
+
+    # Resumes on the next slot after the stall, then no burst to catch up
+    assert pacer.resyncs == 1
+    assert wakeups[0] == pytest.approx(0.35, abs=1e-3)
+    for a, b in zip(wakeups, wakeups[1:]):
+        assert b - a == pytest.approx(0.05, abs=1e-3)
+
+
+def test_jitter_percentiles_in_milliseconds(clock):
+    pacer = FPSController(20.0)
+    assert pacer.jitter_percentiles() == {}
+    pacer.jitter.extend([0.001, 0.002, 0.003, 0.004])
+    percentiles = pacer.jitter_percentiles((50, 100))
+    assert percentiles == pytest.approx({"p50": 2.5, "p100": 4.0})
+
+
+def test_backoff_doubles_up_to_the_maximum(clock):
+    backoff = Backoff(initial=0.001, maximum=0.005)
+    delays = []
+    for _ in range(5):
+        before = clock.now
+        backoff.wait()
+        delays.append(clock.now - before)
+    assert delays == pytest.approx([0.001, 0.002, 0.004, 0.005, 0.005])
+    backoff.reset()
+    assert backoff.delay == 0.001
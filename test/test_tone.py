@@ -0,0 +1,59 @@
+import numpy as np
+import pytest
+
+from ascii_engine.core import Converter
+from ascii_engine.core.converter import ConversionEngine
+from ascii_engine.core.tone import ToneMap
+from ascii_engine.settings import Gradient, Mode, get_gradient_ramp
+
+TONES = [
+    ToneMap(),
+    ToneMap(brightness=40),
+    ToneMap(brightness=-60, contrast=1.5),
+    ToneMap(contrast=0.5, gamma=2.2),
+    ToneMap(gamma=0.6, invert=True),
+    ToneMap(brightness=300),
+]
+
+
+def reference_tone(value: int, tone: ToneMap) -> int:
+    """Tone curve of one value, step by step."""
+    v = value / 255.0
+    if tone.gamma > 0 and tone.gamma != 1.0:
+        v = v ** (1.0 / tone.gamma)
+    v = ((v - 0.5) * tone.contrast + 0.5) * 255.0 + tone.brightness
+    v = min(max(round(v), 0), 255)
+    return 255 - v if tone.invert else v
+
+
+@pytest.mark.parametrize("tone", TONES, ids=repr)
+def test_lut_matches_per_value_curve(tone):
+    assert tone.lut.tolist() == [reference_tone(v, tone) for v in range(256)]
+
+
+@pytest.mark.parametrize("tone", TONES, ids=repr)
+def test_apply_is_one_lookup(tone):
+    plane = np.random.default_rng(0).integers(0, 256, size=(20, 30, 3), dtype=np.uint8)
+    np.testing.assert_array_equal(tone.apply(plane), tone.lut[plane])
+
+
+def test_identity_is_a_no_op():
+    plane = np.arange(256, dtype=np.uint8).reshape(16, 16)
+    assert ToneMap().is_identity
+    assert ToneMap().apply(plane) is plane
+    np.testing.assert_array_equal(ToneMap().lut, np.arange(256))
+
+
+@pytest.mark.parametrize("tone", TONES, ids=repr)
+@pytest.mark.parametrize("mode", [Mode.RGB, Mode.GRAYSCALE, Mode.ASCII, Mode.ANSI256], ids=lambda m: m.name)
+def test_fused_tone_matches_toned_planes(tone, mode):
+    rng = np.random.default_rng(1)
+    gray = rng.integers(0, 256, size=(24, 40), dtype=np.uint8)
+    color = rng.integers(0, 256, size=(24, 40, 3), dtype=np.uint8)
+    ramp = get_gradient_ramp(Gradient.DETAILED)
+
+    fused = Converter().convert(gray, color, ramp, mode, tone)
+    separate = Converter(engine=ConversionEngine.REFERENCE).convert(
+        tone.apply(gray), tone.apply(color), ramp, mode
+    )
+    assert fused == separate
@@ -0,0 +1,75 @@
+import cv2
+import numpy as np
+import pytest
+from PIL import Image
+
+from ascii_engine.batch import build_sinks
+from ascii_engine.media import ImageSink, VideoEncoder, VideoSink
+
+from conftest import make_image
+
+
+@pytest.fixture(scope="module")
+def frames(video_path, make_processor):
+    return list(make_processor().iter_frames(video_path))[:8]
+
+
+def read_video(path):
+    cap = cv2.VideoCapture(str(path))
+    sizes = []
+    while True:
+        ok, frame = cap.read()
+        if not ok:
+            break
+        sizes.append(frame.shape[:2])
+    cap.release()
+    return sizes
+
+
+def test_encoder_scales_frames_to_the_first_size(tmp_path):
+    with VideoEncoder(tmp_path / "out.mp4", fps=10) as video:
+        video.write(make_image(0, height=48, width=64))
+        video.write(make_image(1, height=96, width=128))
+        video.write(make_image(2, height=48, width=64))
+    assert (video.count, video.resized) == (3, 1)
+    assert read_video(tmp_path / "out.mp4") == [(48, 64)] * 3
+
+
+@pytest.mark.parametrize("workers", [0, 2])
+def test_video_sink_saves_the_frames_it_renders(tmp_path, frames, workers, monkeypatch):
+    sink = VideoSink(tmp_path / "out.mp4", fps=10, frames_dir=tmp_path / "frames", workers=workers, palette=True)
+    rendered = []
+    render = sink.images.render
+    monkeypatch.setattr(sink.images, "render", lambda frame: rendered.append(render(frame)) or rendered[-1])
+
+    sink.open(10.0)
+    for frame in frames:
+        sink.write(frame)
+    sink.close()
+
+    # One render per frame feeds both the video and the images
+    assert len(rendered) == len(frames)
+    assert len(read_video(tmp_path / "out.mp4")) == len(frames)
+    paths = sorted((tmp_path / "frames").iterdir())
+    assert [p.name for p in paths] == [f"frame_{i:05d}.png" for i in range(len(frames))]
+    for path, pixels in zip(paths, rendered):
+        np.testing.assert_array_equal(np.asarray(Image.open(path).convert("RGB")), pixels)
+
+
+def test_video_without_frames_dir_saves_no_images(tmp_path, frames, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    sink = VideoSink(tmp_path / "out.mp4", fps=10)
+    sink.open(10.0)
+    sink.write(frames[0])
+    sink.close()
+    assert [p.name for p in tmp_path.iterdir()] == ["out.mp4"]
+
+
+def test_batch_renders_video_frames_once(tmp_path, video_path):
+    out_dir = tmp_path / "clip"
+    sinks = build_sinks(video_path, out_dir, ["image", "video"], fps=10, image_options={"palette": True})
+    assert len(sinks) == 1 and isinstance(sinks[0], VideoSink)
+    assert sinks[0].images.out_dir == out_dir / "frames" and sinks[0].images.exporter.palette
+
+    sinks = build_sinks(video_path, out_dir, ["image"], fps=10)
+    assert len(sinks) == 1 and isinstance(sinks[0], ImageSink)